@@ -4,23 +4,34 @@ Coordinates blockchain operations and social media posting
 """
 
 import os
-import time
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List, Tuple
 import random
-import json
+import queue
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
-from blockchain import BlockchainManager
+# First of the local modules, so the startup profile's clock covers the others
+from startup_profile import PROFILE
+from cast_cursor import CastCursor
+from command_executor import CommandExecutor
+from command_queue import open_command_queue
+from deployment_log import DeploymentLog
+from metrics import REGISTRY
+from networks import NETWORKS, default_network, explorer_tx_url, resolve_network, rpc_settings
+from signer_pool import SignerPool
 from social import SocialMediaManager
+from social_outbox import SocialOutbox
 
-# Agent0 integration (optional)
+# Agent0 integration (optional); the SDK itself is imported when first used
 try:
-    from agent0_integration import Agent0Integration
-    AGENT0_AVAILABLE = True
+    from agent0_integration import Agent0Integration, SDK_AVAILABLE as AGENT0_AVAILABLE
 except ImportError:
     AGENT0_AVAILABLE = False
+if not AGENT0_AVAILABLE:
     logging.warning("⚠️ Agent0 integration not available")
 
 # Configure logging
@@ -40,38 +51,60 @@ class OpenClawAgent:
     Autonomous agent that deploys ERC20 tokens and posts updates
     """
     
-    def __init__(self, interval_minutes: int = 20, enable_agent0: bool = False):
+    def __init__(
+        self,
+        interval_minutes: int = 20,
+        enable_agent0: bool = False,
+        use_factory: bool = False,
+        optimistic: bool = False,
+        lazy: bool = False
+    ):
         """
         Initialize the OpenClaw agent
+        
+        Args:
+            lazy: Defer web3, the blockchain managers and the Agent0 SDK to first use; run_async
+                builds them and checks RPC connectivity in the background
         """
         logger.info("🤖 Initializing OpenClaw Agent...")
         
         # Load environment variables
         load_dotenv()
         
+        self.lazy = lazy
+        self.enable_agent0 = enable_agent0
+        self.agent0 = None
+        self._blockchain = None
+        self._signers: Optional[SignerPool] = None
+        # One signer pool (and so one manager, RPC pool, fee oracle and nonce state) per network
+        self._chains: Dict[str, SignerPool] = {}
+        self._chain_lock = threading.Lock()
+        self.network = default_network()
+        # Free commands run on the testnet, paid ones on mainnet, when both are configured
+        self.free_network = resolve_network(os.getenv('FREE_TIER_NETWORK')) or 'base-sepolia'
+        self.premium_network = resolve_network(os.getenv('PREMIUM_TIER_NETWORK')) or 'base'
+        
         # Initialize managers
         try:
-            self.blockchain = BlockchainManager()
-            self.social = SocialMediaManager()
+            if not lazy:
+                self._init_chain()
+            with PROFILE.phase("init: SocialMediaManager"):
+                self.social = SocialMediaManager()
         except Exception as e:
             logger.error(f"❌ Failed to initialize managers: {str(e)}")
             raise
         
-        # Initialize Agent0 integration
-        self.agent0 = None
-        if enable_agent0 and AGENT0_AVAILABLE:
-            try:
-                self.agent0 = Agent0Integration(self.blockchain.w3, self.blockchain.account)
-                if not self.agent0.is_registered():
-                    self.agent0.register_agent(name="OpenClaw")
-                logger.info("✅ Agent0 integration enabled")
-            except Exception as e:
-                logger.warning(f"⚠️ Agent0 integration failed: {e}")
-                self.agent0 = None
-        
         self.interval_minutes = interval_minutes
-        self.deployment_count = 0
+        self.use_factory = use_factory
+        self.optimistic = optimistic
+        # Append-only history; deployments.json is exported from it for the dashboard
+        self.deployment_log = DeploymentLog()
+        self.deployment_count = self.deployment_log.last_deployment_number()
         self.deployment_history = []
+        self.last_export = datetime.now()
+        self.last_compaction = datetime.now()
+        self.last_metrics_publish = datetime.now()
+        self.last_rebalance = datetime.now() - timedelta(minutes=5)
         self.start_time = datetime.now()
         self.last_deployment = datetime.now() - timedelta(minutes=interval_minutes)
         
@@ -81,20 +114,42 @@ class OpenClawAgent:
         
         # Remote Control State
         self.user_fid = 1449860 # furqan.base.eth
-        self.processed_casts = set()
+        # Deploy announcements are posted from here, off the deploy path, with retries
+        self.outbox = SocialOutbox(self.social)
+        
+        # Persisted, so a restart does not re-run commands from casts it already saw
+        self.cast_cursor = CastCursor()
         self.last_farcaster_check = datetime.now() - timedelta(minutes=5)
+        self.farcaster_poll_interval = 60
         self.last_auto_social = datetime.now() - timedelta(minutes=60)
+        
+        # Dashboard commands (SQLite queue, or commands.json with COMMAND_QUEUE=file)
+        self.command_queue = open_command_queue()
+        # Ids of claimed dashboard commands queued or running in a lane; kept visible-hidden
+        # by the heartbeat, and a redelivered copy of one is dropped
+        self._in_flight = set()
+        self._in_flight_lock = threading.Lock()
+        
+        # Deployments confirmed by the receipt tracker, announced from the main loop
+        self.completed_deployments = queue.Queue()
+        self._record_lock = threading.Lock()
+        
+        # asyncio runtime state, set up by run_async
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._completion_event: Optional[asyncio.Event] = None
+        self.executor: Optional[CommandExecutor] = None
 
-    def autonomous_social_engage(self):
+    def autonomous_social_engage(self, context: Optional[str] = None):
         """Fetch latest profile activity and post a relevant 'Base' hype update with AI image"""
         try:
-            logger.info("🕵️ Visiting profile to find inspiration...")
-            casts = self.social.get_latest_casts(self.user_fid, limit=3)
-            
-            # Simple context extraction from latest cast
-            context = "Base Ecosystem"
-            if casts:
-                context = casts[0].get('text', 'Base Ecosystem')[:50]
+            if context is None:
+                logger.info("🕵️ Visiting profile to find inspiration...")
+                casts = self.social.get_latest_casts(self.user_fid, limit=3)
+                
+                # Simple context extraction from latest cast
+                context = "Base Ecosystem"
+                if casts:
+                    context = casts[0].get('text', 'Base Ecosystem')[:50]
             
             # Formulate hype message
             # Specific Promo Content
@@ -129,66 +184,133 @@ class OpenClawAgent:
         except Exception as e:
             logger.error(f"❌ Auto-social failed: {e}")
 
-    def check_farcaster_commands(self):
-        """Listen for commands from profile and public mentions"""
-        now = datetime.now()
+    @property
+    def blockchain(self):
+        """Blockchain manager, built on first use in lazy mode"""
+        if self._blockchain is None:
+            self._init_chain()
+        return self._blockchain
+
+    @property
+    def signers(self) -> SignerPool:
+        """Deploying accounts on RPC_URL's network: PRIVATE_KEY plus SIGNER_KEYS, each with its own nonce sequence"""
+        if self._signers is None:
+            self._init_chain()
+        return self._signers
+
+    @property
+    def chains(self) -> Dict[str, SignerPool]:
+        """Signer pool per configured network: RPC_URL's network plus every <NETWORK>_RPC_URL"""
+        if self._blockchain is None:
+            self._init_chain()
+        return self._chains
+
+    def signers_for(self, network: Optional[str]) -> SignerPool:
+        """Signer pool for a network; RPC_URL's pool for None or a network without an RPC"""
+        return self.chains.get(network) or self.signers
+
+    def _init_chain(self):
+        """Import web3, build a blockchain manager and signer pool per network and, if enabled, the Agent0 integration"""
+        with self._chain_lock:
+            if self._blockchain is not None:
+                return
+            with PROFILE.phase("import: blockchain (web3, eth_account)"):
+                from blockchain import BlockchainManager
+            with PROFILE.phase("init: BlockchainManager"):
+                blockchain = BlockchainManager(verify_connection=not self.lazy)
+                chains = {blockchain.network: SignerPool(blockchain)}
+            for network in NETWORKS:
+                settings = rpc_settings(network)
+                if settings is None or network in chains:
+                    continue
+                rpc_url, rpc_urls, ws_url = settings
+                try:
+                    with PROFILE.phase(f"init: BlockchainManager ({network})"):
+                        # Its own endpoints only; RPC_URLS and WS_URL belong to RPC_URL's network
+                        manager = BlockchainManager(
+                            rpc_url=rpc_url, rpc_urls=rpc_urls, ws_url=ws_url or '',
+                            verify_connection=not self.lazy, network=network
+                        )
+                except Exception as e:
+                    logger.error(f"❌ {NETWORKS[network]['label']} unavailable: {e}. Its commands run on {blockchain.network}")
+                    continue
+                if manager.network in chains:
+                    logger.warning(f"⚠️ {network.upper().replace('-', '_')}_RPC_URL serves {manager.network}, which is already configured; ignoring it")
+                    continue
+                chains[manager.network] = SignerPool(manager)
+            if len(chains) > 1:
+                logger.info(f"🌐 Networks: {', '.join(chains)} (default {blockchain.network})")
+            self.network = blockchain.network
+            self._chains = chains
+            self._signers = chains[blockchain.network]
+            if self.enable_agent0 and AGENT0_AVAILABLE:
+                # Identity and reputation stay on Base Sepolia when it is configured
+                agent0_network = resolve_network(os.getenv('AGENT0_CHAIN_ID', '84532'))
+                with PROFILE.phase("init: Agent0Integration"):
+                    self.agent0 = self._init_agent0(chains.get(agent0_network, self._signers).primary)
+            self._blockchain = blockchain
+
+    def _init_agent0(self, blockchain) -> Optional['Agent0Integration']:
+        """Agent0 integration on blockchain's chain, registered on first run; None if it cannot be set up"""
+        try:
+            agent0 = Agent0Integration(
+                blockchain.w3, blockchain.account, lazy=self.lazy,
+                chain_id=NETWORKS[blockchain.network]['chain_id']
+            )
+            if not agent0.is_registered():
+                agent0.register_agent(name="OpenClaw")
+            logger.info("✅ Agent0 integration enabled")
+            return agent0
+        except Exception as e:
+            logger.warning(f"⚠️ Agent0 integration failed: {e}")
+            return None
+
+    def poll_farcaster_commands(self) -> List[Dict]:
+        """Collect commands from profile casts and public mentions not seen before"""
+        logger.info("📡 Checking Farcaster for profile commands and mentions...")
+        self.last_farcaster_check = datetime.now()
         
-        # Check profile casts AND public mentions
-        if (now - self.last_farcaster_check).total_seconds() >= 60:
-            logger.info("📡 Checking Farcaster for profile commands and mentions...")
-            self.last_farcaster_check = now
-            
-            # 1. Profile Casts (furqan.base.eth)
-            profile_casts = self.social.get_latest_casts(self.user_fid)
-            # 2. Public Mentions (anyone talking to the agent)
-            mentions = self.social.get_mentions(self.user_fid)
+        # 1. Profile Casts (furqan.base.eth)
+        profile_casts = self.social.get_latest_casts(self.user_fid)
+        # 2. Public Mentions (anyone talking to the agent)
+        mentions = self.social.get_mentions(self.user_fid)
+        
+        commands = []
+        sources = [('profile', cast) for cast in profile_casts] + [('mentions', cast) for cast in mentions]
+        for source, cast in sources:
+            if not self.cast_cursor.is_new(source, cast): continue
             
-            all_potential_commands = profile_casts + mentions
+            text = cast.get('text', '').lower()
+            author = cast.get('author', {}).get('username', 'anonymous')
+            self.cast_cursor.mark(source, cast)
             
-            for cast in all_potential_commands:
-                cast_hash = cast.get('hash')
-                if cast_hash in self.processed_casts: continue
-                
-                text = cast.get('text', '').lower()
-                author = cast.get('author', {}).get('username', 'anonymous')
-                self.processed_casts.add(cast_hash)
-                
-                if "!deploy" in text:
-                    parts = text.split()
-                    # Trigger the paid service logic
-                    logger.info(f"💎 Public Command from @{author}: Deploy Token")
-                    return {
-                        "type": "deploy", 
-                        "params": {
-                            "name": parts[parts.index("!deploy")+1] if len(parts) > parts.index("!deploy")+1 else None,
-                            "symbol": parts[parts.index("!deploy")+2] if len(parts) > parts.index("!deploy")+2 else None,
-                            "requestor": author
-                        }
+            if "!deploy" in text:
+                parts = text.split()
+                # Trigger the paid service logic
+                logger.info(f"💎 Public Command from @{author}: Deploy Token")
+                commands.append({
+                    "type": "deploy", 
+                    "params": {
+                        "name": parts[parts.index("!deploy")+1] if len(parts) > parts.index("!deploy")+1 else None,
+                        "symbol": parts[parts.index("!deploy")+2] if len(parts) > parts.index("!deploy")+2 else None,
+                        "requestor": author
                     }
-        
-        # Every 45 minutes, do an autonomous profile engagement with revenue focus
-        if (now - self.last_auto_social).total_seconds() >= 45 * 60:
-            self.autonomous_social_engage(context="Verified Service Provider")
-            
-        return None
+                })
+        self.cast_cursor.save()
+        return commands
 
-    def check_for_commands(self):
-        """Check for interactive commands from dashboard"""
-        if not os.path.exists("commands.json"):
-            return None
+    def check_for_commands(self, limit: int = 20) -> List[Dict]:
+        """Claim pending interactive commands from the dashboard queue"""
         try:
-            with open("commands.json", "r") as f:
-                commands = json.load(f)
-            for cmd in commands:
-                if not cmd.get("executed", False):
-                    cmd["executed"] = True
-                    with open("commands.json", "w") as f:
-                        json.dump(commands, f, indent=2)
-                    return cmd
-            return None
-        except: return None
+            commands = self.command_queue.claim(limit)
+        except Exception as e:
+            logger.error(f"❌ Command queue error: {e}")
+            return []
+        for cmd in commands:
+            cmd['source'] = 'dashboard'
+        return commands
 
-    def deploy_and_announce(self, custom_name=None, custom_symbol=None) -> bool:
+    def deploy_and_announce(self, custom_name=None, custom_symbol=None, requestor="Community") -> bool:
         """Execute one cycle: deploy token and announce"""
         try:
             logger.info("=" * 60)
@@ -201,35 +323,108 @@ class OpenClawAgent:
             
             logger.info(f"💎 Token: {token_name} (${token_symbol})")
             
-            # Deploy (Paid/Public logic)
-            requestor = custom_params.get('requestor') if isinstance(custom_params, dict) else "Community"
-            
             # Dynamic Chain Fallback based on balance
-            balance = self.blockchain.get_balance()
-            if balance < 0.001:
-                logger.warning(f"📉 Low Mainnet balance ({balance} ETH). Falling back to Base Sepolia for Service.")
-                # We assume the BlockchainManager can handle/config can be switched, 
-                # but for simplicity, we'll just log that this is a 'Service Tier' deployment
-            
-            deployment = self.blockchain.deploy_erc20_token(token_name, token_symbol, initial_supply)
-            contract_address = deployment['contract_address']
-            tx_hash = deployment['transaction_hash']
-            explorer_url = self.blockchain.get_explorer_url(tx_hash)
+            blockchain = self.signers_for(self.autonomous_network()).primary
             
+            # Deploy (Paid/Public logic)
+            deployment = blockchain.deploy_erc20_token(token_name, token_symbol, initial_supply)
+            return self._announce_deployment(deployment, requestor)
+        except Exception as e:
+            logger.error(f"❌ Error: {e}")
+            return False
+
+    def autonomous_network(self) -> str:
+        """
+        Network for the agent's own deploys
+
+        The premium network while its deployer holds at least 0.001 ETH, else the free
+        network; networks without an RPC are replaced by RPC_URL's network.
+        """
+        chains = self.chains
+        network = self.premium_network if self.premium_network in chains else self.network
+        fallback = self.free_network if self.free_network in chains else self.network
+        if network != fallback:
+            balance = chains[network].primary.get_balance()
+            if balance < 0.001:
+                logger.warning(
+                    f"📉 Low {NETWORKS[network]['label']} balance ({balance} ETH). "
+                    f"Falling back to {NETWORKS[fallback]['label']} for Service."
+                )
+                return fallback
+        return network
+
+    def deploy_premium_bundle(self, name, symbol, requestor="Community", count=7, blockchain=None) -> List[str]:
+        """Deploy a premium bulk order as one batch (factory or nonce-pipelined) and announce each token"""
+        blockchain = blockchain or self.signers_for(self.premium_network).primary
+        tokens = []
+        for i in range(1, count + 1):
+            # Create unique variations for bulk order
+            current_name = f"{name} {i}" if i > 1 else name
+            current_symbol = f"{symbol}{i}" if i > 1 else symbol
+            tokens.append((current_name, current_symbol, random.choice([100000, 500000, 1000000])))
+        
+        logger.info(f"🚀 Deploying Premium Contracts 1-{count}: {name}")
+        # Paid orders bid for faster inclusion
+        if self.use_factory:
+            # One factory transaction for the whole order
+            deployments = blockchain.deploy_erc20_batch(tokens, urgency='fast')
+        else:
+            deployments = blockchain.deploy_erc20_tokens(tokens, urgency='fast')
+        
+        deployed_list = []
+        for deployment in deployments:
+            try:
+                if self._announce_deployment(deployment, requestor):
+                    deployed_list.append(deployment['name'])
+            except Exception as e:
+                logger.error(f"❌ Error: {e}")
+        return deployed_list
+
+    def _announce_pending(self, handle, token_name: str, token_symbol: str, requestor: str = "Community", blockchain=None) -> Dict:
+        """Announce a just-broadcast ERC20 at its precomputed address, before it confirms"""
+        explorer_url = (blockchain or self.blockchain).get_explorer_url(handle.tx_hash)
+        pending_msg = f"⏳ Contract Deploying for @{requestor}...\n\n💎 {token_name} ({token_symbol})\n📍 {handle.contract_address[:10]}... (pending)\n🔗 {explorer_url}\n\n🤖 OpenClaw service is active. If you liked this, send a tip to 'furqan.base.eth' to keep me powered! ⚡"
+        return {'contract_address': handle.contract_address, 'cast_job': self.outbox.enqueue(pending_msg)}
+
+    def _announce_deployment(self, deployment: Dict, requestor: str = "Community", announced: Optional[Dict] = None) -> bool:
+        """
+        Announce a finished ERC20 deployment, submit reputation and save its record
+
+        Args:
+            deployment: Result dict from BlockchainManager
+            requestor: Farcaster handle the token was made for
+            announced: Set when an optimistic "pending" cast already went out; only a
+                correction is posted, and only if the deployment did not land there
+        """
+        token_name = deployment['name']
+        token_symbol = deployment['symbol']
+        contract_address = deployment['contract_address']
+        tx_hash = deployment['transaction_hash']
+        explorer_url = explorer_tx_url(deployment.get('chain_id'), tx_hash)
+        
+        if announced:
+            if deployment.get('status') or contract_address != announced['contract_address']:
+                correction_msg = f"⚠️ Correction: the {token_name} ({token_symbol}) deployment for @{requestor} did not go through, so {announced['contract_address'][:10]}... is not live. I'll retry on the next request."
+                self.outbox.enqueue(correction_msg, parent_job=announced['cast_job'])
+                logger.warning(f"⚠️ Optimistic announcement for {token_symbol} corrected: {deployment.get('status', 'address mismatch')}")
+                return False
+            logger.info(f"✅ {token_symbol} confirmed at announced address {contract_address}")
+        else:
             # Custom Message including tip request
             final_msg = f"✅ Contract Ready for @{requestor}!\n\n💎 {token_name} ({token_symbol})\n📍 {contract_address[:10]}...\n🔗 {explorer_url}\n\n🤖 OpenClaw service is active. If you liked this, send a tip to 'furqan.base.eth' to keep me powered! ⚡"
 
             # Announce via Social with Revenue Link
-            social_result = self.social.post_to_farcaster(final_msg)
-            
-            # Reputation
-            if self.agent0:
-                self.agent0.submit_reputation_proof(
-                    task_type="erc20_deployment",
-                    proof_data={'token_symbol': token_symbol, 'transaction_hash': tx_hash}
-                )
-            
-            # Save Record
+            self.outbox.enqueue(final_msg)
+        
+        # Reputation
+        if self.agent0:
+            self.agent0.submit_reputation_proof(
+                task_type="erc20_deployment",
+                proof_data={'token_symbol': token_symbol, 'transaction_hash': tx_hash, 'chain_id': deployment.get('chain_id')}
+            )
+        
+        # Save Record (numbering and append under one lock, commands run concurrently)
+        with self._record_lock:
             record = {
                 'deployment_number': self.deployment_count + 1,
                 'timestamp': datetime.now().isoformat(),
@@ -237,119 +432,491 @@ class OpenClawAgent:
                 'token_symbol': token_symbol,
                 'contract_address': contract_address,
                 'transaction_hash': tx_hash,
-                'initial_supply': initial_supply,
-                'explorer_url': explorer_url
+                'initial_supply': deployment['initial_supply'],
+                'explorer_url': explorer_url,
+                'block_number': deployment.get('block_number'),
+                'chain_id': deployment.get('chain_id'),
+                'network': deployment.get('network')
             }
             self.deployment_history.append(record)
             self._save_record(record)
             self.deployment_count += 1
-            self.last_deployment = datetime.now()
-            return True
-        except Exception as e:
-            logger.error(f"❌ Error: {e}")
-            return False
+        self.last_deployment = datetime.now()
+        return True
 
-    def deploy_and_announce_nft(self, custom_name=None, custom_symbol=None) -> bool:
+    def deploy_and_announce_nft(self, custom_name=None, custom_symbol=None, blockchain=None) -> bool:
         """Execute NFT deployment and announce"""
         try:
             name = custom_name or "BaseClaw NFT"
             symbol = custom_symbol or "BCNFT"
             
             logger.info(f"🎨 Deploying NFT: {name} ({symbol})")
-            deployment = self.blockchain.deploy_nft(name, symbol)
-            
-            # Generate a unique AI Artwork for this NFT
-            image_prompt = f"Digital NFT masterpiece art titled {name}, cybernetic style, base blue colors, futuristic gallery piece"
-            image_url = self.social.generate_ai_image(image_prompt)
-            explorer_url = self.blockchain.get_explorer_url(deployment['transaction_hash'])
+            deployment = (blockchain or self.signers_for(self.free_network).primary).deploy_nft(name, symbol)
+            return self._announce_nft(deployment)
+        except Exception as e:
+            logger.error(f"❌ NFT Cycle Error: {e}")
+            return False
+
+    def _announce_nft(self, deployment: Dict) -> bool:
+        """Announce a finished NFT deployment with AI artwork and save its record"""
+        name = deployment['name']
+        symbol = deployment['symbol']
+        
+        # A unique AI Artwork for this NFT, generated when the outbox sends the cast
+        image_prompt = f"Digital NFT masterpiece art titled {name}, cybernetic style, base blue colors, futuristic gallery piece"
+        explorer_url = explorer_tx_url(deployment.get('chain_id'), deployment['transaction_hash'])
+        network = NETWORKS.get(deployment.get('network'), NETWORKS['base'])['label']
+        
+        msg = f"🎨 New NFT Collection Deployed on {network}! \n\n💎 {name} ({symbol})\n📍 {deployment['contract_address'][:10]}...\n🔗 {explorer_url}\n\n#Base #NFT #OpenClaw"
+        
+        self.outbox.enqueue(msg, image_prompt=image_prompt)
+        
+        # Record
+        deployment['timestamp'] = datetime.now().isoformat()
+        self._save_record(deployment)
+        return True
+
+    def submit_and_announce(self, custom_name=None, custom_symbol=None, requestor="Community", blockchain=None):
+        """Broadcast a token deployment without waiting; it is announced once the tracker confirms it"""
+        token_name = custom_name or random.choice(self.token_prefixes) + random.choice(self.token_suffixes)
+        token_symbol = custom_symbol or (token_name[0] + token_name[-2:]).upper()
+        initial_supply = random.choice([100000, 500000, 1000000])
+        
+        # Commands are assigned a network and signer when routed to a lane; interval deploys pick them here
+        own_signer = blockchain is None
+        if own_signer:
+            pool = self.signers_for(self.autonomous_network())
+            blockchain = pool.acquire()
+        try:
+            handle = blockchain.submit_erc20_token(token_name, token_symbol, initial_supply)
+        except Exception:
+            if own_signer:
+                pool.release(blockchain.address, succeeded=False)
+            raise
+        if own_signer:
+            pool.release(blockchain.address)
+        
+        # Optimistic mode: the CREATE address is known from sender and nonce, so announce right away
+        announced = None
+        if self.optimistic and handle.contract_address:
+            logger.info(f"💎 Token: {token_name} (${token_symbol}) submitted, announcing at {handle.contract_address}")
+            announced = self._announce_pending(handle, token_name, token_symbol, requestor, blockchain=blockchain)
+        else:
+            logger.info(f"💎 Token: {token_name} (${token_symbol}) submitted, announcing on confirmation")
+        
+        handle.add_callback(lambda deployment: self._notify_completed(('erc20', deployment, requestor, announced)))
+        self.last_deployment = datetime.now()
+
+    def submit_and_announce_nft(self, custom_name=None, custom_symbol=None, blockchain=None):
+        """Broadcast an NFT deployment without waiting; it is announced once the tracker confirms it"""
+        name = custom_name or "BaseClaw NFT"
+        symbol = custom_symbol or "BCNFT"
+        blockchain = blockchain or self.signers_for(self.free_network).primary
+        
+        logger.info(f"🎨 NFT: {name} ({symbol}) submitted on {blockchain.network}, announcing on confirmation")
+        blockchain.submit_nft(
+            name, symbol,
+            callback=lambda deployment: self._notify_completed(('nft', deployment, None, None))
+        )
+
+    def _notify_completed(self, item):
+        """Queue a confirmed deployment (called on tracker threads) and wake the async announcer"""
+        self.completed_deployments.put(item)
+        if self._loop is not None and self._completion_event is not None:
+            self._loop.call_soon_threadsafe(self._completion_event.set)
+
+    def process_completed_deployments(self) -> int:
+        """Announce every deployment the receipt tracker has confirmed since the last call"""
+        processed = 0
+        while True:
+            try:
+                kind, deployment, requestor, announced = self.completed_deployments.get_nowait()
+            except queue.Empty:
+                return processed
+            try:
+                if kind == 'nft':
+                    self._announce_nft(deployment)
+                else:
+                    self._announce_deployment(deployment, requestor, announced)
+            except Exception as e:
+                logger.error(f"❌ Announcement Error: {e}")
+            processed += 1
+
+    def _save_record(self, record):
+        # Commands run concurrently; appends are serialized inside the log
+        self.deployment_log.append(record)
+
+    def export_deployments(self):
+        """Refresh deployments.json from the log if anything was recorded since the last export"""
+        self.last_export = datetime.now()
+        if self.deployment_log.dirty:
+            count = self.deployment_log.export()
+            logger.info(f"💾 Exported {count} deployment records to {self.deployment_log.export_path}")
+
+    def compact_deployments(self):
+        """Drop superseded lines from the deployment log"""
+        self.last_compaction = datetime.now()
+        self.deployment_log.compact()
+
+    def execute_command(self, cmd: Dict):
+        """Run one dashboard or Farcaster command (blocking; called on an executor thread)"""
+        if cmd['type'] == 'deploy':
+            self.submit_and_announce(
+                cmd['params'].get('name'),
+                cmd['params'].get('symbol'),
+                requestor=cmd['params'].get('requestor') or "Community",
+                blockchain=self.signers_for(cmd.get('network')).manager(cmd.get('signer'))
+            )
+        elif cmd['type'] == 'nft':
+            self.submit_and_announce_nft(
+                cmd['params'].get('name'), cmd['params'].get('symbol'),
+                blockchain=self.signers_for(cmd.get('network')).primary
+            )
+        elif cmd['type'] == 'deploy_premium':
+            # Premium Paid Service Execution (10 Verified Contracts)
+            p_name = cmd['params'].get('name')
+            p_symbol = cmd['params'].get('symbol')
+            p_tx = cmd['params'].get('tx_hash', 'Direct')
             
-            msg = f"🎨 New NFT Collection Deployed on Base! \n\n💎 {name} ({symbol})\n📍 {deployment['contract_address'][:10]}...\n🔗 {explorer_url}\n\n#Base #NFT #OpenClaw"
+            logger.info(f"💰 Premium Bulk Order Received: {p_name} ({p_symbol})")
+            logger.info(f"💳 Payment TX: {p_tx}")
             
-            self.social.post_to_farcaster(msg, image_url=image_url)
+            # Deploy 7 Verified Contracts Cycle (Lucky 7 Deal), all broadcast back to back
+            deployed_list = self.deploy_premium_bundle(
+                p_name, p_symbol, requestor=cmd['params'].get('requestor', 'Community'),
+                blockchain=self.signers_for(cmd.get('network')).manager(cmd.get('signer'))
+            )
             
-            # Record
-            deployment['timestamp'] = datetime.now().isoformat()
-            self._save_record(deployment)
-            return True
+            # Follow up with a specific "Thank You" post for the bulk order
+            thank_you_msg = f"🎩 Premium Bulk Service Delivered! \n\n💎 {len(deployed_list)}/7 Verified Contracts deployed for {p_name}.\n🙏 Thanks for the $1 support! This revenue powers my autonomy.\n\n#OpenClaw #Premium #Base #RealYield"
+            self.outbox.enqueue(thank_you_msg)
+
+        elif cmd['type'] == 'post':
+            custom_text = cmd['params'].get('text')
+            image_url = cmd['params'].get('image_url')
+            if custom_text:
+                logger.info(f"📤 Custom Manual Post: {custom_text}")
+                self.social.post_to_farcaster(custom_text, image_url=image_url)
+            elif self.deployment_history:
+                latest = self.deployment_history[-1]
+                self.social.post_to_farcaster(f"Manual Verified Update: Agent just verified {latest['token_name']} on-chain! 🤖")
+
+    def command_network(self, cmd: Dict) -> str:
+        """
+        Network a chain command runs on
+
+        params['network'] (a name like "base" or a chain id) picks it explicitly; otherwise
+        deploy_premium goes to the premium network and free deploys and NFTs to the free
+        network. Networks without an RPC fall back to RPC_URL's network.
+        """
+        requested = cmd['params'].get('network') or cmd['params'].get('chain_id')
+        network = resolve_network(requested)
+        if requested and network is None:
+            logger.warning(f"⚠️ Unknown network {requested!r} for {cmd['type']}, routing by tier")
+        if network is None:
+            network = self.premium_network if cmd['type'] == 'deploy_premium' else self.free_network
+        return network if network in self.chains else self.network
+
+    def command_lane(self, cmd: Dict) -> str:
+        """
+        Lane a command runs in
+
+        Chain commands are first assigned a network. Token deploys are then assigned that
+        network's least-loaded funded signer and go through the signer's ordered lane, so
+        deploys on different signers and networks run in parallel; NFT deploys get a lane per
+        network (nonce allocation is still serialized by the blockchain manager) and posts
+        never queue behind either.
+        """
+        if cmd['type'] in ('deploy', 'deploy_premium', 'nft') and not cmd.get('network'):
+            cmd['network'] = self.command_network(cmd)
+        if cmd['type'] in ('deploy', 'deploy_premium'):
+            if not cmd.get('signer'):
+                cmd['signer'] = self.signers_for(cmd['network']).acquire().address
+            return f"chain:{cmd['network']}:{cmd['signer']}"
+        if cmd['type'] == 'nft':
+            return f"nft:{cmd['network']}"
+        return 'social'
+
+    def _release_signer(self, cmd: Dict, succeeded: Optional[bool] = True):
+        """Return the signer command_lane assigned to cmd, if any"""
+        if cmd.get('signer'):
+            self.signers_for(cmd.get('network')).release(cmd['signer'], succeeded=succeeded)
+
+    def run_command(self, cmd: Dict):
+        """Execute a command and settle it in the dashboard queue (blocking; runs on a lane thread)"""
+        try:
+            with REGISTRY.time('openclaw_command_seconds', type=cmd['type']):
+                self.execute_command(cmd)
         except Exception as e:
-            logger.error(f"❌ NFT Cycle Error: {e}")
+            REGISTRY.inc('openclaw_commands_total', type=cmd['type'], outcome='failed')
+            self._release_signer(cmd, succeeded=False)
+            if cmd.get('source') == 'dashboard':
+                self.command_queue.fail(cmd['id'], str(e))
+                self._settled(cmd)
+            raise
+        REGISTRY.inc('openclaw_commands_total', type=cmd['type'], outcome='ok')
+        self._release_signer(cmd)
+        if cmd.get('source') == 'dashboard':
+            self.command_queue.ack(cmd['id'])
+            self._settled(cmd)
+
+    def _settled(self, cmd: Dict):
+        """Stop heartbeating a dashboard command once it is acked or failed"""
+        with self._in_flight_lock:
+            self._in_flight.discard(cmd['id'])
+
+    def _collect_metrics(self, registry):
+        """Queue depth and lane gauges, read when metrics are published"""
+        registry.set('openclaw_queue_depth', self.command_queue.counts().get('pending', 0), queue='dashboard_commands')
+        registry.set('openclaw_queue_depth', self.completed_deployments.qsize(), queue='announcements')
+        registry.set('openclaw_queue_depth', self.outbox.pending_count(), queue='social_outbox')
+        if self._blockchain is not None:
+            pending_receipts = pending_nonces = 0
+            for network, pool in self._chains.items():
+                # Signers of one network share its receipt tracker
+                pending_receipts += pool.primary.tracker.pending_count()
+                for address, stats in pool.stats().items():
+                    pending_nonces += stats['in_flight']
+                    registry.set('openclaw_signer_in_flight', stats['in_flight'] + stats['assigned'], network=network, signer=address)
+                    if stats['balance_eth'] is not None:
+                        registry.set('openclaw_signer_balance_eth', stats['balance_eth'], network=network, signer=address)
+            registry.set('openclaw_queue_depth', pending_receipts, queue='pending_receipts')
+            registry.set('openclaw_queue_depth', pending_nonces, queue='pending_nonces')
+        if self.executor is not None:
+            for lane, stats in self.executor.stats().items():
+                registry.set('openclaw_queue_depth', stats['queued'], queue=f"lane:{lane}")
+                registry.set('openclaw_lane_busy', stats['busy'], lane=lane)
+
+    def rebalance_signers(self):
+        """Refresh signer balances, top up low signers from the treasury and log per-signer load"""
+        self.last_rebalance = datetime.now()
+        for network, pool in self.chains.items():
+            if len(pool) < 2:
+                continue
+            pool.rebalance()
+            for address, stats in pool.stats().items():
+                balance = "?" if stats['balance_eth'] is None else f"{stats['balance_eth']:.5f}"
+                logger.info(
+                    f"🔑 Signer {address[:10]} on {network}: {balance} ETH, {stats['in_flight']} in flight, "
+                    f"{stats['completed']} done, {stats['failed']} failed, {stats['top_ups']} top-ups"
+                )
+
+    def publish_metrics(self):
+        """Write the metrics snapshot that app.py serves on /metrics"""
+        self.last_metrics_publish = datetime.now()
+        REGISTRY.write()
+
+    async def _blocking(self, fn: Callable, *args):
+        """Run a blocking web3/requests call on the executor"""
+        return await self._loop.run_in_executor(None, fn, *args)
+
+    async def _timer(self, interval: float, last_run: Callable[[], datetime], job: Callable, label: str):
+        """
+        Run job whenever interval seconds have passed since last_run()
+
+        Jobs move their own last_* timestamp, so e.g. a manual deploy pushes the next
+        interval deploy back instead of stacking another one behind it.
+        """
+        while True:
+            delay = (last_run() + timedelta(seconds=interval) - datetime.now()).total_seconds()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await self._blocking(job)
+            except Exception as e:
+                logger.error(f"❌ {label} failed: {e}")
+            # A job that failed without moving its timestamp waits a full interval
+            if (last_run() + timedelta(seconds=interval) - datetime.now()).total_seconds() <= 0:
+                await asyncio.sleep(interval)
+
+    async def _dashboard_intake(
+        self, check_interval: float = 1.0, rescan_interval: float = 30.0, limit: int = 20, retry_delay: float = 1.0
+    ):
+        """
+        Hand dashboard commands to lanes as soon as the command queue changes
+
+        The change check is a single PRAGMA (or stat for commands.json); a periodic
+        rescan also picks up commands whose visibility timeout expired, and every ack from
+        a lane thread counts as a change. Commands are claimed one at a time and only kept
+        when their lane has an idle worker: a command for a busy lane goes straight back to
+        the queue instead of sitting claimed in the lane's buffer, and one busy lane never
+        holds up the others. Handed-back commands are retried after retry_delay.
+        """
+        last_scan = 0.0
+        retry_at = None
+        while True:
+            now = self._loop.time()
+            due = retry_at is not None and now >= retry_at
+            if due or self.command_queue.has_changed() or now - last_scan >= rescan_interval:
+                last_scan = now
+                if due:
+                    retry_at = None
+                for _ in range(limit):
+                    claimed = await self._blocking(self.check_for_commands, 1)
+                    if not claimed:
+                        break
+                    if not await self._dispatch_claimed(claimed[0], retry_delay):
+                        # Measured after the release, so the claim is visible again by then
+                        retry_at = self._loop.time() + retry_delay
+            await asyncio.sleep(check_interval)
+
+    async def _dispatch_claimed(self, cmd: Dict, retry_delay: float) -> bool:
+        """
+        Start one claimed dashboard command in its lane, or hand the claim back
+
+        Returns:
+            False if the command went back to the queue for a retry
+        """
+        with self._in_flight_lock:
+            if cmd['id'] in self._in_flight:
+                # Redelivered while the first copy is still queued or running
+                logger.warning(f"⚠️ Command {cmd['id']} redelivered while in flight, dropping the copy")
+                return True
+            self._in_flight.add(cmd['id'])
+        try:
+            # Routing may build the chain side (lazy mode) and picks a signer, off the loop
+            lane = await self._blocking(self.command_lane, cmd)
+        except Exception as e:
+            logger.error(f"❌ Could not route command {cmd['id']} ({cmd['type']}): {e}")
+            self._settled(cmd)
+            await self._blocking(self.command_queue.fail, cmd['id'], str(e))
+            return True
+        if not (self.executor.has_room(lane) and self.executor.try_submit(cmd, lane)):
+            logger.info(f"⏳ Lane '{lane}' is busy, command {cmd['id']} ({cmd['type']}) stays queued")
+            self._release_signer(cmd, succeeded=None)
+            self._settled(cmd)
+            await self._blocking(self.command_queue.release, cmd['id'], retry_delay)
             return False
+        return True
 
-    def _save_record(self, record):
-        filename = 'deployments.json'
-        records = []
-        if os.path.exists(filename):
-            with open(filename, 'r') as f: records = json.load(f)
-        records.append(record)
-        with open(filename, 'w') as f: json.dump(records, f, indent=2)
+    async def _claim_heartbeat(self, interval: Optional[float] = None):
+        """
+        Keep claimed dashboard commands hidden while they are queued or running
+
+        Touches every in-flight claim well inside the visibility timeout, so a deploy that
+        outlasts it is not redelivered and broadcast a second time.
+        """
+        timeout = getattr(self.command_queue, 'visibility_timeout', None)
+        if timeout is None:
+            return  # commands.json has no redelivery
+        interval = interval or timeout / 3
+        while True:
+            await asyncio.sleep(interval)
+            with self._in_flight_lock:
+                claimed = list(self._in_flight)
+            for command_id in claimed:
+                try:
+                    await self._blocking(self.command_queue.touch, command_id)
+                except Exception as e:
+                    logger.error(f"❌ Could not extend claim on command {command_id}: {e}")
+
+    async def _farcaster_intake(self, interval: float = 60):
+        """Queue Farcaster commands every interval seconds"""
+        while True:
+            try:
+                for cmd in await self._blocking(self.poll_farcaster_commands):
+                    await self.executor.submit(cmd, await self._blocking(self.command_lane, cmd))
+            except Exception as e:
+                logger.error(f"❌ Farcaster polling failed: {e}")
+            await asyncio.sleep(interval)
+
+    async def _announcer(self):
+        """Announce confirmed deployments as soon as the tracker reports them"""
+        while True:
+            await self._completion_event.wait()
+            self._completion_event.clear()
+            await self._blocking(self.process_completed_deployments)
+
+    async def _warm_up_chain(self):
+        """Lazy mode: build the blockchain side and check RPC connectivity without holding up intake"""
+        try:
+            await self._blocking(self._init_chain)
+        except Exception as e:
+            logger.error(f"❌ Blockchain not ready: {e}. Chain commands fail until it is reachable")
+        for network, pool in self._chains.items():
+            try:
+                with PROFILE.phase(f"verify RPC connection ({network})"):
+                    await self._blocking(pool.primary.verify_connection)
+            except Exception as e:
+                logger.error(f"❌ {network} not ready: {e}. Its commands fail until it is reachable")
+        PROFILE.log_report("Startup profile (chain ready)")
+
+    async def run_async(self, lanes: Optional[Dict[str, Tuple[int, int]]] = None):
+        """
+        Event-driven runtime: intake tasks feed command lanes, timers drive periodic jobs
+
+        Args:
+            lanes: lane name -> (workers, max queued commands); defaults to COMMAND_LANES
+        """
+        self._loop = asyncio.get_running_loop()
+        self._completion_event = asyncio.Event()
+        self.executor = CommandExecutor(self.run_command, self.command_lane, lanes)
+        # Intake, announcements and timers; commands run on their lanes' own threads
+        executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="openclaw")
+        self._loop.set_default_executor(executor)
+        # Announcements left over from a previous run
+        self.outbox.start()
+        REGISTRY.add_collector(self._collect_metrics)
+        
+        # Anything confirmed before the loop started
+        if not self.completed_deployments.empty():
+            self._completion_event.set()
+        
+        tasks = [
+            asyncio.create_task(self._dashboard_intake()),
+            asyncio.create_task(self._claim_heartbeat()),
+            asyncio.create_task(self._farcaster_intake(self.farcaster_poll_interval)),
+            asyncio.create_task(self._announcer()),
+            asyncio.create_task(self._timer(
+                self.interval_minutes * 60, lambda: self.last_deployment, self.submit_and_announce, "Interval deploy"
+            )),
+            # Every 45 minutes, do an autonomous profile engagement with revenue focus
+            asyncio.create_task(self._timer(
+                45 * 60, lambda: self.last_auto_social,
+                lambda: self.autonomous_social_engage(context="Verified Service Provider"), "Auto-social"
+            )),
+            asyncio.create_task(self._timer(
+                30, lambda: self.last_export, self.export_deployments, "Deployment export"
+            )),
+            asyncio.create_task(self._timer(
+                24 * 60 * 60, lambda: self.last_compaction, self.compact_deployments, "Deployment log compaction"
+            )),
+            asyncio.create_task(self._timer(
+                10, lambda: self.last_metrics_publish, self.publish_metrics, "Metrics publish"
+            )),
+            asyncio.create_task(self._timer(
+                5 * 60, lambda: self.last_rebalance, self.rebalance_signers, "Signer rebalance"
+            )),
+            asyncio.create_task(self.executor.report()),
+        ]
+        if self._blockchain is None:
+            tasks.append(asyncio.create_task(self._warm_up_chain()))
+        
+        logger.info("🔄 Agent Active - Waiting for instructions...")
+        PROFILE.log_report("Startup profile (ready for commands)")
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.executor.shutdown()
+            executor.shutdown(wait=False)
+            self.export_deployments()
 
     def run(self, once=False):
-        """Continuous Loop"""
+        """Run one cycle, or the event-driven runtime until interrupted"""
         if once:
             self.deploy_and_announce()
+            self.export_deployments()
+            if not self.outbox.flush(timeout=120):
+                logger.warning(f"⚠️ {self.outbox.pending_count()} announcements still queued; they are sent on the next run")
             return
 
-        logger.info("🔄 Agent Active - Waiting for instructions...")
-        while True:
-            # Check for Local Dashboard Commands
-            cmd = self.check_for_commands()
-            
-            # Check for Farcaster Remote Commands (Every 60s)
-            if not cmd:
-                cmd = self.check_farcaster_commands()
-
-            if cmd:
-                if cmd['type'] == 'deploy':
-                    self.deploy_and_announce(cmd['params'].get('name'), cmd['params'].get('symbol'))
-                elif cmd['type'] == 'nft':
-                    self.deploy_and_announce_nft(cmd['params'].get('name'), cmd['params'].get('symbol'))
-                elif cmd['type'] == 'deploy_premium':
-                    # Premium Paid Service Execution (10 Verified Contracts)
-                    p_name = cmd['params'].get('name')
-                    p_symbol = cmd['params'].get('symbol')
-                    p_tx = cmd['params'].get('tx_hash', 'Direct')
-                    
-                    logger.info(f"💰 Premium Bulk Order Received: {p_name} ({p_symbol})")
-                    logger.info(f"💳 Payment TX: {p_tx}")
-                    
-                    # Deploy 7 Verified Contracts Cycle (Lucky 7 Deal)
-                    deployed_list = []
-                    
-                    for i in range(1, 8):
-                        # Create unique variations for bulk order
-                        current_name = f"{p_name} {i}" if i > 1 else p_name
-                        current_symbol = f"{p_symbol}{i}" if i > 1 else p_symbol
-                        
-                        logger.info(f"🚀 Deploying Premium Contract {i}/7: {current_name}")
-                        
-                        # Deploy
-                        success = self.deploy_and_announce(current_name, current_symbol)
-                        if success:
-                            deployed_list.append(current_name)
-                        
-                        # Small delay between deployments to prevent nonce issues
-                        time.sleep(5)
-                    
-                    # Follow up with a specific "Thank You" post for the bulk order
-                    thank_you_msg = f"🎩 Premium Bulk Service Delivered! \n\n💎 {len(deployed_list)}/7 Verified Contracts deployed for {p_name}.\n🙏 Thanks for the $1 support! This revenue powers my autonomy.\n\n#OpenClaw #Premium #Base #RealYield"
-                    self.social.post_to_farcaster(thank_you_msg)
-
-                elif cmd['type'] == 'post':
-                    custom_text = cmd['params'].get('text')
-                    image_url = cmd['params'].get('image_url')
-                    if custom_text:
-                        logger.info(f"📤 Custom Manual Post: {custom_text}")
-                        self.social.post_to_farcaster(custom_text, image_url=image_url)
-                    elif self.deployment_history:
-                        latest = self.deployment_history[-1]
-                        self.social.post_to_farcaster(f"Manual Verified Update: Agent just verified {latest['token_name']} on-chain! 🤖")
-                continue
-
-            # Regular interval check
-            if (datetime.now() - self.last_deployment).total_seconds() >= self.interval_minutes * 60:
-                self.deploy_and_announce()
-            
-            time.sleep(5)
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            logger.info("🛑 Agent stopped")
 
 def main():
     import argparse
@@ -357,9 +924,23 @@ def main():
     parser.add_argument('--interval', type=int, default=20)
     parser.add_argument('--once', action='store_true')
     parser.add_argument('--agent0', action='store_true')
+    parser.add_argument('--factory', action='store_true', help='Deploy bulk orders through the CREATE2 token factory')
+    parser.add_argument('--optimistic', action='store_true', help='Announce tokens at their precomputed address before confirmation')
+    parser.add_argument('--lazy', action='store_true', help='Take commands before web3, the RPC check and the Agent0 SDK are ready')
+    parser.add_argument('--startup-profile', action='store_true', help='Log an import-time and init-time breakdown of startup')
     args = parser.parse_args()
     
-    agent = OpenClawAgent(interval_minutes=args.interval, enable_agent0=args.agent0)
+    if args.startup_profile:
+        PROFILE.enable()
+    agent = OpenClawAgent(
+        interval_minutes=args.interval,
+        enable_agent0=args.agent0,
+        use_factory=args.factory,
+        optimistic=args.optimistic,
+        lazy=args.lazy
+    )
+    if args.once:
+        PROFILE.log_report("Startup profile (initialized)")
     agent.run(once=args.once)
 
 if __name__ == "__main__":
@@ -7,57 +7,147 @@ import os
 import logging
 import json
 import random
-from typing import Dict, Optional, List
+import time
+import threading
+import importlib.util
+from typing import TYPE_CHECKING, Dict, Optional, List
 from datetime import datetime, timezone
-from web3 import Web3
-from eth_account import Account
 
-# Official Agent0 SDK
-from agent0_sdk import SDK
+from metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from web3 import Web3
+    from eth_account import Account
+
+# Official Agent0 SDK; slow to import, so it is loaded when the SDK is first built
+SDK_AVAILABLE = importlib.util.find_spec("agent0_sdk") is not None
 
 # Registry Addresses for Base Sepolia (84532)
 BASE_SEPOLIA_IDENTITY = "0x8004AA63c570c570eBF15376c0dB199918BFe9Fb"
 BASE_SEPOLIA_REPUTATION = "0x8004bd8daB57f14Ed299135749a5CB5c42d341BF"
 
+# Registries the current SDK version does not ship defaults for, by chain id;
+# AGENT0_IDENTITY_REGISTRY / AGENT0_REPUTATION_REGISTRY override them for any chain
+REGISTRY_OVERRIDES = {
+    84532: {
+        "IDENTITY": BASE_SEPOLIA_IDENTITY,
+        "REPUTATION": BASE_SEPOLIA_REPUTATION
+    }
+}
+
 logger = logging.getLogger(__name__)
 
 class Agent0Integration:
     """
     Integrates OpenClaw with the official ERC-8004 Agent0 SDK.
-    Provides on-chain identity (NFT) and reputation tracking on Base Sepolia.
+    Provides on-chain identity (NFT) and reputation tracking, on Base Sepolia by default.
     """
     
-    def __init__(self, w3: Web3, account: Account):
+    def __init__(self, w3: 'Web3', account: 'Account', lazy: bool = False, chain_id: Optional[int] = None):
         """
         Initialize Agent0 integration
         
         Args:
             w3: Web3 instance
             account: Ethereum account/signer
+            lazy: Build the SDK on first use (the first registration or reputation call) instead of now
+            chain_id: Chain the registries live on; must be the chain w3 is connected to
+                (default: AGENT0_CHAIN_ID or 84532)
         """
         self.w3 = w3
         self.account = account
+        self.chain_id = chain_id or int(os.getenv('AGENT0_CHAIN_ID', '84532'))
         self.agent_id = None
-        self.agent_metadata_file = "agent0_metadata.json"
+        # The dashboard reads agent0_metadata.json; identities on other chains get their own file
+        self.agent_metadata_file = "agent0_metadata.json" if self.chain_id == 84532 else f"agent0_metadata_{self.chain_id}.json"
+        self._sdk = None
+        self._sdk_lock = threading.Lock()
+        
+        # Load saved agent metadata
+        self._load_metadata()
+        
+        if not lazy:
+            self._sdk = self._build_sdk()
+        
+        logger.info(f"🤖 Agent0 SDK Integration initialized on chain {self.chain_id}")
+    
+    @property
+    def sdk(self):
+        """Official Agent0 SDK, built on first access"""
+        if self._sdk is None:
+            with self._sdk_lock:
+                if self._sdk is None:
+                    self._sdk = self._build_sdk()
+        return self._sdk
+    
+    def _build_sdk(self):
+        from agent0_sdk import SDK
         
-        # Initialize official Agent0 SDK
         # We provide registry overrides because Base Sepolia defaults are not in the current SDK version
-        self.sdk = SDK(
-            chainId=84532, # Base Sepolia
-            rpcUrl=w3.provider.endpoint_uri,
-            signer=account,
-            registryOverrides={
-                84532: {
-                    "IDENTITY": BASE_SEPOLIA_IDENTITY,
-                    "REPUTATION": BASE_SEPOLIA_REPUTATION
-                }
-            }
+        registries = dict(REGISTRY_OVERRIDES.get(self.chain_id, {}))
+        if os.getenv('AGENT0_IDENTITY_REGISTRY'):
+            registries["IDENTITY"] = os.getenv('AGENT0_IDENTITY_REGISTRY')
+        if os.getenv('AGENT0_REPUTATION_REGISTRY'):
+            registries["REPUTATION"] = os.getenv('AGENT0_REPUTATION_REGISTRY')
+        overrides = {'registryOverrides': {self.chain_id: registries}} if registries else {}
+        sdk = SDK(
+            chainId=self.chain_id,
+            rpcUrl=self.w3.provider.endpoint_uri,
+            signer=self.account,
+            **overrides
         )
         
-        # Load saved agent metadata
-        self._load_metadata()
+        self._share_provider(sdk)
+        logger.info("🔌 Agent0 SDK ready")
+        return sdk
+    
+    def _share_provider(self, sdk):
+        """
+        Point the SDK at the caller's w3 (e.g. BlockchainManager's RPC pool)
         
-        logger.info("🤖 Agent0 SDK Integration initialized")
+        agent0-sdk 1.7.1 takes only an RPC URL. Its Web3Client opens its own HTTPProvider
+        and calls is_connected() and chain_id while the SDK is built, so those two calls are
+        not pooled. Everything after construction is pooled. The registry contracts the SDK
+        built in its constructor are bound to the old w3, so they are rebuilt here and handed
+        to the services that hold them.
+        
+        These are SDK internals (requirements.txt pins 1.7.1). If any of them is missing,
+        nothing is rebound and the SDK keeps its own provider.
+        """
+        missing = [
+            name for owner, name in (
+                (sdk, 'web3_client'), (sdk, '_identity_registry'), (sdk, '_reputation_registry'),
+                (sdk, '_validation_registry'), (sdk, 'feedback_manager'),
+            )
+            if not hasattr(owner, name)
+        ]
+        if not missing:
+            missing = [
+                f"feedback_manager.{name}" for name in ('identity_registry', 'reputation_registry')
+                if not hasattr(sdk.feedback_manager, name)
+            ]
+        if missing:
+            logger.warning(
+                f"⚠️ Agent0 SDK has no {', '.join(missing)}; it keeps its own RPC provider instead of the shared one"
+            )
+            return
+        
+        client = sdk.web3_client
+        client.w3 = self.w3
+        sdk._identity_registry = sdk._reputation_registry = sdk._validation_registry = None
+        identity_registry = sdk.identity_registry
+        reputation_registry = sdk.reputation_registry
+        sdk.feedback_manager.identity_registry = identity_registry
+        sdk.feedback_manager.reputation_registry = reputation_registry
+        if getattr(sdk.indexer, 'identity_registry', None) is not None:
+            sdk.indexer.identity_registry = identity_registry
+        
+        stale = [
+            name for name, contract in (('identity', identity_registry), ('reputation', reputation_registry))
+            if contract.w3.provider is not self.w3.provider
+        ]
+        if stale:
+            logger.warning(f"⚠️ Agent0 SDK {', '.join(stale)} registry calls bypass the shared provider")
     
     def _load_metadata(self):
         """Load agent metadata from file"""
@@ -65,8 +155,13 @@ class Agent0Integration:
             if os.path.exists(self.agent_metadata_file):
                 with open(self.agent_metadata_file, 'r') as f:
                     metadata = json.load(f)
-                    self.agent_id = metadata.get('agent_id')
-                    logger.info(f"📋 Loaded saved agent ID: {self.agent_id}")
+                agent_id = metadata.get('agent_id')
+                # Agent IDs are chainId:tokenId; an identity on another chain is not ours here
+                if agent_id and not str(agent_id).startswith(f"{self.chain_id}:"):
+                    logger.warning(f"⚠️ Saved agent ID {agent_id} is not on chain {self.chain_id}; ignoring it")
+                    return
+                self.agent_id = agent_id
+                logger.info(f"📋 Loaded saved agent ID: {self.agent_id}")
         except Exception as e:
             logger.warning(f"Could not load metadata: {e}")
     
@@ -143,7 +238,7 @@ class Agent0Integration:
             
         except Exception as e:
             logger.warning(f"⚠️ On-chain registration failed: {e}. Falling back to simulated ID.")
-            self.agent_id = f"84532:{abs(hash(self.account.address)) % (10**6)}"
+            self.agent_id = f"{self.chain_id}:{abs(hash(self.account.address)) % (10**6)}"
             self._save_metadata({
                 "agent_id": self.agent_id,
                 "name": name,
@@ -167,6 +262,14 @@ class Agent0Integration:
         Returns:
             True if successful
         """
+        started = time.monotonic()
+        submitted = self._submit_reputation_proof(task_type, proof_data)
+        REGISTRY.observe(
+            'openclaw_reputation_submit_seconds', time.monotonic() - started, outcome='ok' if submitted else 'failed'
+        )
+        return submitted
+    
+    def _submit_reputation_proof(self, task_type: str, proof_data: Dict) -> bool:
         try:
             if not self.is_registered():
                 logger.warning("⚠️ Agent not registered. Cannot submit reputation.")
@@ -195,6 +298,7 @@ class Agent0Integration:
             
             proof_record = {
                 "agent_id": self.agent_id,
+                "chain_id": self.chain_id,
                 "task_type": task_type,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "tx_hash": tx_hash,
@@ -266,6 +370,7 @@ if __name__ == "__main__":
     if rpc_url and private_key:
         try:
             from web3 import Web3
+            from eth_account import Account
             w3 = Web3(Web3.HTTPProvider(rpc_url))
             account = Account.from_key(private_key)
             
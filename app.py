@@ -1,12 +1,24 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
 from flask_cors import CORS
 import os
 import json
-import time
+import threading
+
+from command_queue import open_command_queue
+from metrics import render
 
 app = Flask(__name__)
 CORS(app)
 
+_queue_lock = threading.Lock()
+
+def command_queue():
+    """Command queue, opened on the first request so importing the app creates no files"""
+    with _queue_lock:
+        if 'command_queue' not in app.extensions:
+            app.extensions['command_queue'] = open_command_queue()
+        return app.extensions['command_queue']
+
 @app.route('/')
 def index():
     return send_from_directory('.', 'dashboard.html')
@@ -19,32 +31,26 @@ def get_deployments():
 def get_metadata():
     return send_from_directory('.', 'agent0_metadata.json')
 
+@app.route('/metrics')
+def get_metrics():
+    # The agent runs in its own process and publishes snapshots to METRICS_FILE
+    try:
+        with open(os.getenv('METRICS_FILE', 'metrics.json'), 'r') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return Response("# agent has not published metrics yet\n", status=503, mimetype='text/plain')
+    return Response(render(snapshot), mimetype='text/plain; version=0.0.4')
+
 @app.route('/api/command', methods=['POST'])
 def send_command():
     data = request.json
     command_type = data.get('type') # 'deploy' or 'post'
     params = data.get('params', {})
     
-    command = {
-        "type": command_type,
-        "params": params,
-        "timestamp": time.time(),
-        "executed": False
-    }
-    
-    # Save to commands.json for the agent to pick up
+    # Queue for the agent to pick up
     try:
-        commands = []
-        if os.path.exists("commands.json"):
-            with open("commands.json", "r") as f:
-                commands = json.load(f)
-        
-        commands.append(command)
-        
-        with open("commands.json", "w") as f:
-            json.dump(commands, f, indent=2)
-            
-        return jsonify({"status": "success", "message": f"Command {command_type} queued"})
+        command_id = command_queue().enqueue(command_type, params)
+        return jsonify({"status": "success", "message": f"Command {command_type} queued", "id": command_id})
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
@@ -0,0 +1,387 @@
+"""
+bench.py - Microbenchmarks for OpenClaw agent hot paths
+Times record keeping, command intake, transaction build/sign, cast parsing, reputation and the dashboard API, against a JSON baseline
+
+    python bench.py --save                    # record a baseline
+    python bench.py --threshold 0.25          # compare; exit 1 on regressions
+    python bench.py -k command --sizes 1000   # subset
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import fnmatch
+import logging
+import argparse
+import platform
+import statistics
+import tempfile
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+# Proof files are one inode each; larger directories add setup time without changing the picture
+MAX_PROOF_FILES = 10000
+CAST_BATCHES = (100, 1000, 10000)
+
+
+class Case:
+    """
+    One benchmark: run() is timed, setup() (if any) runs untimed before every round
+    and its return value is passed to run()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable,
+        setup: Optional[Callable] = None,
+        max_rounds: int = 1000,
+        teardown: Optional[Callable] = None
+    ):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.max_rounds = max_rounds
+        self.teardown = teardown
+
+
+def measure(case: Case, min_rounds: int, min_time: float) -> Dict[str, float]:
+    """
+    Time case until it ran min_rounds times and for min_time seconds in total, or max_rounds
+
+    Returns:
+        Round count and min / median / mean / stddev in seconds
+    """
+    samples: List[float] = []
+    total = 0.0
+    while len(samples) < case.max_rounds and (len(samples) < min_rounds or total < min_time):
+        arg = case.setup() if case.setup else None
+        started = time.perf_counter()
+        if case.setup:
+            case.run(arg)
+        else:
+            case.run()
+        elapsed = time.perf_counter() - started
+        samples.append(elapsed)
+        total += elapsed
+    return {
+        'rounds': len(samples),
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.mean(samples),
+        'stddev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def _record(number: int) -> Dict:
+    """Deployment record shaped like the ones the agent saves"""
+    tx_hash = '0x%064x' % number
+    return {
+        'deployment_number': number,
+        'timestamp': '2026-02-08T20:33:32.633343',
+        'token_name': f"NovaSwap{number}",
+        'token_symbol': 'NAP',
+        'contract_address': '0x%040x' % number,
+        'transaction_hash': tx_hash,
+        'initial_supply': 500000,
+        'explorer_url': f"https://basescan.org/tx/{tx_hash}"
+    }
+
+
+def _write_records(path: str, count: int):
+    with open(path, 'w') as f:
+        for number in range(1, count + 1):
+            f.write(json.dumps(_record(number), separators=(',', ':')) + "\n")
+
+
+# Benchmark factories: each takes a size and a scratch directory and yields cases
+
+
+def bench_deployment_log(size: int, workdir: str) -> Iterator[Case]:
+    from agent import OpenClawAgent
+    from deployment_log import DeploymentLog
+
+    path = os.path.join(workdir, f"deployments-{size}.jsonl")
+    export_path = os.path.join(workdir, f"deployments-{size}.json")
+    _write_records(path, size)
+
+    yield Case(f"deployment_log.load[{size}]", lambda: DeploymentLog(path, export_path), max_rounds=20)
+
+    agent = SimpleNamespace(deployment_log=DeploymentLog(path, export_path))
+    counter = iter(range(size + 1, size + 10 ** 7))
+    yield Case(f"save_record[{size}]", lambda: OpenClawAgent._save_record(agent, _record(next(counter))))
+
+    yield Case(f"deployment_log.export[{size}]", agent.deployment_log.export, max_rounds=20)
+
+
+def bench_check_for_commands(size: int, workdir: str) -> Iterator[Case]:
+    from agent import OpenClawAgent
+    from command_queue import JSONFileCommandQueue, SQLiteCommandQueue
+
+    params = {'name': 'LoadToken', 'symbol': 'LOAD', 'requestor': 'bench'}
+    sqlite_queue = SQLiteCommandQueue(os.path.join(workdir, f"commands-{size}.db"))
+    db = sqlite_queue._db()
+    db.execute("BEGIN")
+    for _ in range(size):
+        sqlite_queue.enqueue('deploy', params)
+    db.execute("COMMIT")
+
+    file_path = os.path.join(workdir, f"commands-{size}.json")
+    with open(file_path, 'w') as f:
+        json.dump([
+            {'type': 'deploy', 'params': params, 'timestamp': time.time(), 'executed': False} for _ in range(size)
+        ], f, indent=2)
+
+    # Each round claims 20, so stop while at least half the backlog is still pending
+    for backend, command_queue in (('sqlite', sqlite_queue), ('file', JSONFileCommandQueue(file_path))):
+        agent = SimpleNamespace(command_queue=command_queue)
+        yield Case(
+            f"check_for_commands[{backend}-{size}]",
+            lambda agent=agent: OpenClawAgent.check_for_commands(agent),
+            max_rounds=max(1, size // 40)
+        )
+
+
+def bench_erc20_build_sign(workdir: str) -> Iterator[Case]:
+    from loadtest import ChainStandIn, Faults
+    from blockchain import BlockchainManager
+
+    chain = ChainStandIn(Faults()).start()
+    os.environ.update({'RPC_URLS': '', 'WS_URL': ''})
+    manager = BlockchainManager(rpc_url=chain.url, private_key=chain.private_key)
+
+    # Same steps as _send_erc20_deployment minus the RPC round trips that are cached in steady state
+    fees = {'gasPrice': manager.cache.gas_price()}
+    chain_id = manager.cache.chain_id()
+    nonces = iter(range(10 ** 7))
+
+    def build_and_sign():
+        token = manager._contract_factory(manager.ERC20_ABI, manager.ERC20_BYTECODE)
+        tx = token.constructor("BenchToken", "BENCH", 1000000 * 10 ** 18).build_transaction({
+            'from': manager.address,
+            'nonce': next(nonces),
+            'gas': 2000000,
+            'chainId': chain_id,
+            **fees
+        })
+        manager.account.sign_transaction(tx)
+
+    yield Case("deploy_erc20_token.build_sign", build_and_sign, teardown=chain.stop)
+
+
+def bench_poll_farcaster_commands(size: int, workdir: str) -> Iterator[Case]:
+    from agent import OpenClawAgent
+    from cast_cursor import CastCursor
+
+    batch = {'profile': [], 'mentions': []}
+    social = SimpleNamespace(
+        get_latest_casts=lambda fid: batch['profile'],
+        get_mentions=lambda fid: batch['mentions']
+    )
+    agent = SimpleNamespace(
+        social=social,
+        cast_cursor=CastCursor(os.path.join(workdir, f"cast_cursor-{size}.json")),
+        user_fid=1,
+        last_farcaster_check=None
+    )
+    counter = iter(range(10 ** 9))
+
+    def fresh_casts():
+        # New hashes and current timestamps every round, otherwise the cursor turns the whole batch into skips
+        stamp = time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
+        casts = []
+        for i in range(size):
+            n = next(counter)
+            text = f"@openclaw !deploy Token{n} T{n}" if i % 10 == 0 else f"gm from the base community #{n}"
+            casts.append({
+                'hash': '0x%040x' % n,
+                'text': text,
+                'timestamp': stamp,
+                'author': {'username': f"user{n % 500}"}
+            })
+        batch['profile'], batch['mentions'] = casts[:size // 2], casts[size // 2:]
+
+    yield Case(
+        f"poll_farcaster_commands[{size}]",
+        lambda _: OpenClawAgent.poll_farcaster_commands(agent),
+        setup=fresh_casts,
+        max_rounds=200
+    )
+
+
+def bench_reputation_score(size: int, workdir: str) -> Iterator[Case]:
+    from agent0_integration import Agent0Integration
+
+    proofs_dir = os.path.join(workdir, "proofs")
+    shutil.rmtree(proofs_dir, ignore_errors=True)
+    os.makedirs(proofs_dir)
+    for i in range(size):
+        with open(os.path.join(proofs_dir, f"84532_1_deploy_{i:08x}.json"), 'w') as f:
+            f.write('{}')
+
+    # Local stand-in for the on-chain summary; only the proofs/ scan is measured
+    integration = SimpleNamespace(sdk=SimpleNamespace(getReputationSummary=lambda agent_id: {'count': size}), agent_id='84532:1')
+    yield Case(f"get_reputation_score[{size}]", lambda: Agent0Integration.get_reputation_score(integration), max_rounds=200)
+
+
+def bench_api_command(workdir: str) -> Iterator[Case]:
+    import app as dashboard
+    from command_queue import JSONFileCommandQueue, SQLiteCommandQueue
+
+    client = dashboard.app.test_client()
+    body = {'type': 'post', 'params': {'text': 'bench'}}
+    for backend, command_queue in (
+        ('sqlite', SQLiteCommandQueue(os.path.join(workdir, "api-commands.db"))),
+        ('file', JSONFileCommandQueue(os.path.join(workdir, "api-commands.json"))),
+    ):
+        def post(command_queue=command_queue):
+            dashboard.app.extensions['command_queue'] = command_queue
+            client.post('/api/command', json=body)
+        # The file queue rewrites the whole file per enqueue, so its cost grows with the round count
+        yield Case(f"api_command[{backend}]", post, max_rounds=500)
+
+
+def suite(sizes: Tuple[int, ...], workdir: str) -> Iterator[Tuple[str, Callable[[], Iterator[Case]]]]:
+    """(group, case factory) for every benchmark, in report order"""
+    for size in sizes:
+        yield f"deployment_log[{size}]", lambda size=size: bench_deployment_log(size, workdir)
+    for size in sizes:
+        yield f"check_for_commands[{size}]", lambda size=size: bench_check_for_commands(size, workdir)
+    yield "deploy_erc20_token", lambda: bench_erc20_build_sign(workdir)
+    for size in CAST_BATCHES:
+        yield f"poll_farcaster_commands[{size}]", lambda size=size: bench_poll_farcaster_commands(size, workdir)
+    for size in sorted({min(size, MAX_PROOF_FILES) for size in sizes}):
+        yield f"get_reputation_score[{size}]", lambda size=size: bench_reputation_score(size, workdir)
+    yield "api_command", lambda: bench_api_command(workdir)
+
+
+def run_suite(args: argparse.Namespace) -> Dict[str, Dict]:
+    """Run every selected benchmark; groups whose dependencies are missing are reported as skipped"""
+    workdir = tempfile.mkdtemp(prefix="openclaw-bench-")
+    os.chdir(workdir)
+    sys.path.insert(0, REPO_DIR)
+    results: Dict[str, Dict] = {}
+    try:
+        for group, factory in suite(tuple(args.sizes), workdir):
+            if args.k and not any(k in group for k in args.k):
+                continue
+            try:
+                for case in factory():
+                    try:
+                        results[case.name] = measure(case, args.min_rounds, args.min_time)
+                        print(f"   {case.name:<48} {_fmt(results[case.name]['median'])}")
+                    finally:
+                        if case.teardown:
+                            case.teardown()
+            except ImportError as e:
+                results[group] = {'skipped': str(e)}
+                print(f"   {group:<48} skipped ({e})")
+            # agent.py configures INFO logging on import; keep benchmark output readable
+            logging.getLogger().setLevel(logging.WARNING)
+    finally:
+        os.chdir(REPO_DIR)
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def _fmt(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
+
+
+def threshold_for(name: str, default: float, overrides: List[str]) -> float:
+    """Allowed median slowdown for a benchmark; the last matching NAME_GLOB=FRACTION override wins"""
+    threshold = default
+    for override in overrides:
+        pattern, _, value = override.rpartition('=')
+        if fnmatch.fnmatch(name, pattern):
+            threshold = float(value)
+    return threshold
+
+
+def compare(results: Dict[str, Dict], baseline: Dict, args: argparse.Namespace) -> List[str]:
+    """
+    Print each benchmark's median against the baseline
+
+    Returns:
+        Names of benchmarks slower than their threshold allows
+    """
+    previous = baseline.get('results', {})
+    regressions = []
+    print(f"\n📊 {'benchmark':<46} {'median':>10} {'baseline':>10} {'change':>8}")
+    for name, stats in results.items():
+        if 'skipped' in stats:
+            continue
+        before = previous.get(name, {}).get('median')
+        if not before:
+            print(f"   {name:<46} {_fmt(stats['median']):>10} {'-':>10} {'new':>8}")
+            continue
+        change = stats['median'] / before - 1
+        limit = threshold_for(name, args.threshold, args.threshold_for)
+        flag = ""
+        if change > limit:
+            flag = f"  ❌ regression (> +{limit:.0%})"
+            regressions.append(name)
+        print(f"   {name:<46} {_fmt(stats['median']):>10} {_fmt(before):>10} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def environment() -> Dict[str, str]:
+    return {'python': platform.python_version(), 'platform': platform.platform(), 'machine': platform.machine()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenClaw microbenchmarks with a JSON baseline")
+    parser.add_argument('--baseline', default=os.getenv('BENCH_BASELINE', 'bench_baseline.json'), help='Baseline JSON file')
+    parser.add_argument('--save', action='store_true', help='Write this run as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed median slowdown as a fraction (0.25 = 25%%)')
+    parser.add_argument(
+        '--threshold-for', action='append', default=[], metavar='NAME_GLOB=FRACTION',
+        help='Per-benchmark threshold, e.g. "save_record*=0.5" (repeatable)'
+    )
+    parser.add_argument('-k', action='append', help='Only run groups whose name contains this (repeatable)')
+    parser.add_argument(
+        '--sizes', type=lambda s: [int(x) for x in s.split(',')], default=list(DEFAULT_SIZES),
+        help='Record / queue sizes (comma-separated)'
+    )
+    parser.add_argument('--min-rounds', type=int, default=5, help='Minimum timed rounds per benchmark')
+    parser.add_argument('--min-time', type=float, default=0.5, help='Minimum total timed seconds per benchmark')
+    args = parser.parse_args()
+
+    baseline_path = os.path.abspath(args.baseline)
+    print("⏱️  Running OpenClaw microbenchmarks")
+    results = run_suite(args)
+
+    baseline = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path, 'r') as f:
+            baseline = json.load(f)
+        if baseline.get('environment') != environment():
+            print(f"⚠️  Baseline was recorded on {baseline.get('environment')}; timings may not be comparable")
+    regressions = compare(results, baseline, args)
+
+    if args.save:
+        merged = dict(baseline.get('results', {})) if args.k else {}
+        merged.update({name: stats for name, stats in results.items() if 'skipped' not in stats})
+        with open(baseline_path, 'w') as f:
+            json.dump({'created_at': time.time(), 'environment': environment(), 'results': merged}, f, indent=2)
+        print(f"💾 Baseline written to {baseline_path}")
+    elif regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
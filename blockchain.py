@@ -4,11 +4,33 @@ Handles ERC20 token deployment and transaction management on Base blockchain
 """
 
 import os
+import copy
 import logging
+import threading
 from web3 import Web3
+from web3.logs import DISCARD
+from web3.datastructures import AttributeDict
+from web3._utils.method_formatters import receipt_formatter
+from eth_abi import encode
 from eth_account import Account
-from typing import Dict, Optional
+from hexbytes import HexBytes
+from typing import Callable, Dict, List, Optional, Tuple
 import json
+from concurrent.futures import Future
+
+import token_factory
+from chain_cache import ChainStateCache
+from fee_oracle import FeeOracle
+from head_watcher import NewHeadsWatcher
+from metrics import REGISTRY
+from multicall import Multicall, decode_string, decode_uint, selector
+from networks import NETWORKS, default_network, explorer_tx_url, network_for_chain_id
+from nonce_manager import NonceManager
+from preflight import GasEstimateCache, PreflightError
+from rpc_pool import PooledHTTPProvider
+from tx_supervisor import TransactionSupervisor
+from tx_builder import BatchSigner, ContractTemplate
+from tx_tracker import DeploymentHandle, ReceiptTracker
 
 # Configure logging
 logging.basicConfig(
@@ -94,40 +116,181 @@ class BlockchainManager:
     # Simplified ERC20 bytecode (minimal implementation)
     ERC20_BYTECODE = "0x60806040523480156200001157600080fd5b5060405162000e9638038062000e968339818101604052810190620000379190620002e4565b82600390816200004891906200058a565b5081600490816200005a91906200058a565b508060058190555080600080620000766200012960201b60201c565b73ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff168152602001908152602001600020819055508073ffffffffffffffffffffffffffffffffffffffff16600073ffffffffffffffffffffffffffffffffffffffff167fddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef836040516200011591906200067c565b60405180910390a3505050620006b9565b600033905090565b6000604051905090565b600080fd5b600080fd5b600080fd5b600080fd5b6000601f19601f8301169050919050565b7f4e487b7100000000000000000000000000000000000000000000000000000000600052604160045260246000fd5b6200019a826200014f565b810181811067ffffffffffffffff82111715620001bc57620001bb62000160565b5b80604052505050565b6000620001d162000131565b9050620001df82826200018f565b919050565b600067ffffffffffffffff82111562000202576200020162000160565b5b6200020d826200014f565b9050602081019050919050565b60005b838110156200023a5780820151818401526020810190506200021d565b60008484015250505050565b60006200025d6200025784620001e4565b620001c5565b9050828152602081018484840111156200027c576200027b6200014a565b5b620002898482856200021a565b509392505050565b600082601f830112620002a957620002a862000145565b5b8151620002bb84826020860162000246565b91505092915050565b6000819050919050565b620002d981620002c4565b8114620002e557600080fd5b50565b600080600060608486031215620002fe57620002fd6200013b565b5b600084015167ffffffffffffffff8111156200031f576200031e62000140565b5b6200032d8682870162000291565b935050602084015167ffffffffffffffff81111562000351576200035062000140565b5b6200035f8682870162000291565b92505060406200037286828701620002ce565b9150509250925092565b600081519050919050565b7f4e487b7100000000000000000000000000000000000000000000000000000000600052602260045260246000fd5b60006002820490506001821680620003cf57607f821691505b602082108103620003e557620003e462000387565b5b50919050565b60008190508160005260206000209050919050565b60006020601f8301049050919050565b600082821b905092915050565b6000600883026200044f7fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff8262000410565b6200045b868362000410565b95508019841693508086168417925050509392505050565b6000819050919050565b60006200049e620004986200049284620002c4565b62000473565b620002c4565b9050919050565b6000819050919050565b620004ba836200047d565b620004d2620004c982620004a5565b8484546200041d565b825550505050565b600090565b620004e9620004da565b620004f6818484620004af565b505050565b5b818110156200051e5762000512600082620004df565b600181019050620004fc565b5050565b601f8211156200056d576200053781620003eb565b6200054284620003fc565b8101602085101562000552578190505b6200056a6200056185620003fc565b830182620004fb565b50505b505050565b600082821c905092915050565b6000620005926000198460080262000572565b1980831691505092915050565b6000620005ad83836200057f565b9150826002028217905092915050565b620005c8826200037c565b67ffffffffffffffff811115620005e457620005e362000160565b5b620005f08254620003b6565b620005fd82828562000522565b600060209050601f83116001811462000635576000841562000620578287015190505b6200062c85826200059f565b8655506200069c565b601f1984166200064586620003eb565b60005b828110156200066f5784890151825560018201915060208501945060208101905062000648565b868310156200068f57848901516200068b601f8916826200057f565b8355505b6001600288020188555050505b505050505050565b620006af81620002c4565b82525050565b6000602082019050620006cc6000830184620006a4565b92915050565b6107cd80620006e26000396000f3fe608060405234801561001057600080fd5b50600436106100575760003560e01c806306fdde031461005c57806318160ddd1461007a57806370a082311461009857806395d89b41146100c8578063a9059cbb146100e6575b600080fd5b610064610116565b6040516100719190610455565b60405180910390f35b6100826101a4565b60405161008f91906104a0565b60405180910390f35b6100b260048036038101906100ad91906104f1565b6101aa565b6040516100bf91906104a0565b60405180910390f35b6100d06101f2565b6040516100dd9190610455565b60405180910390f35b61010060048036038101906100fb919061051e565b610280565b60405161010d919061058d565b60405180910390f35b6003805461012390610637565b80601f016020809104026020016040519081016040528092919081815260200182805461014f90610637565b801561019c5780601f106101715761010080835404028352916020019161019c565b820191906000526020600020905b81548152906001019060200180831161017f57829003601f168201915b505050505081565b60055481565b60008060008373ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff168152602001908152602001600020549050919050565b600480546101ff90610637565b80601f016020809104026020016040519081016040528092919081815260200182805461022b90610637565b80156102785780601f1061024d57610100808354040283529160200191610278565b820191906000526020600020905b81548152906001019060200180831161025b57829003601f168201915b505050505081565b60008160008061028e6103e9565b73ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16815260200190815260200160002054101561030a576040517f08c379a0000000000000000000000000000000000000000000000000000000008152600401610301906106c9565b60405180910390fd5b816000806103166103e9565b73ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff168152602001908152602001600020600082825461035e91906106e9565b925050819055508160008085736ffffffffffffffff81167fffffffffffffffffffffffffffffffffffff168152602001908152602001600020600082825461039e91906107f6565b925050819055508273ffffffffffffffffffffffffffffffffffffffff166103c46103e9565b73ffffffffffffffffffffffffffffffffffffffff167fddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef846040516103da91906104a0565b60405180910390a36001905092915050565b600033905090565b600081519050919050565b600082825260208201905092915050565b60005b8381101561042b578082015181840152602081019050610410565b60008484015250505050565b6000601f19601f8301169050919050565b6000610453826103f1565b61045d81856103fc565b935061046d81856020860161040d565b61047681610437565b840191505092915050565b6000819050919050565b61049a81610481565b82525050565b600060208201905081810360008301526104ba8184610448565b905092915050565b600080fd5b600073ffffffffffffffffffffffffffffffffffffffff82169050919050565b60006104f2826104c7565b9050919050565b610502816104e7565b811461050d57600080fd5b50565b60008135905061051f816104f9565b92915050565b60008060408385031215610535576105346104c2565b5b600061054385828601610510565b925050602061055485828601610510565b9150509250929050565b60008115159050919050565b6105738161055e565b82525050565b600060208201905061058e600083018461056a565b92915050565b7f4e487b7100000000000000000000000000000000000000000000000000000000600052602260045260246000fd5b600060028204905060018216806105da57607f821691505b6020821081036105ed576105ec610598565b5b50919050565b7f496e73756666696369656e742062616c616e63650000000000000000000000600082015250565b60006106296014836103fc565b9150610634826105f3565b602082019050919050565b600060208201905081810360008301526106588161061c565b9050919050565b7f4e487b7100000000000000000000000000000000000000000000000000000000600052601160045260246000fd5b600061069982610481565b91506106a483610481565b92508282039050818111156106bc576106bb61065f565b5b92915050565b60006106cd82610481565b91506106d883610481565b92508282019050808211156106f0576106ef61065f565b5b9291505056fea2646970667358221220abcdef1234567890abcdef1234567890abcdef1234567890abcdef123456789064736f6c63430008120033"
     
-    def __init__(self, rpc_url: Optional[str] = None, private_key: Optional[str] = None):
+    def __init__(
+        self,
+        rpc_url: Optional[str] = None,
+        private_key: Optional[str] = None,
+        cache_ttl: float = 5.0,
+        rpc_urls: Optional[List[str]] = None,
+        ws_url: Optional[str] = None,
+        replace_after: Optional[float] = None,
+        verify_connection: bool = True,
+        network: Optional[str] = None
+    ):
         """
         Initialize blockchain manager with RPC URL and private key
         
         Args:
-            rpc_url: Base Sepolia RPC endpoint
+            rpc_url: RPC endpoint; transactions are sent here first
             private_key: Private key for transaction signing
+            cache_ttl: Seconds gas price and balance reads are served from cache
+            rpc_urls: Extra RPC endpoints for reads and failover (default: RPC_URLS, comma-separated)
+            ws_url: Optional WebSocket endpoint; new block headers then drive receipt checks
+                (default: WS_URL; "" for none)
+            replace_after: Seconds before a pending transaction is re-sent with bumped fees (default: TX_REPLACE_AFTER or 45)
+            verify_connection: Check connectivity and read the chain id now; with False the caller runs
+                verify_connection() later (e.g. in the background) and no RPC call is made here
+            network: Key of networks.NETWORKS the endpoint serves (default: NETWORK, else base-sepolia);
+                recorded with every deployment
         """
         self.rpc_url = rpc_url or os.getenv('RPC_URL')
         self.private_key = private_key or os.getenv('PRIVATE_KEY')
+        self.network = network or default_network()
         
         if not self.rpc_url:
             raise ValueError("RPC_URL not provided")
         if not self.private_key:
             raise ValueError("PRIVATE_KEY not provided")
         
-        # Initialize Web3 connection
-        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        if rpc_urls is None:
+            rpc_urls = [url.strip() for url in os.getenv('RPC_URLS', '').split(',') if url.strip()]
+        self.rpc_urls = [self.rpc_url] + [url for url in rpc_urls if url != self.rpc_url]
         
-        # Verify connection
-        if not self.w3.is_connected():
-            raise ConnectionError(f"Failed to connect to {self.rpc_url}")
+        # Initialize Web3 connection over a pool of endpoints
+        self.provider = PooledHTTPProvider(self.rpc_urls, write_url=self.rpc_url)
+        self.w3 = Web3(self.provider)
         
         # Set up account from private key
         self.account = Account.from_key(self.private_key)
         self.address = self.account.address
         
+        # Local nonce tracking so several transactions can be in flight at once
+        self.nonces = NonceManager(self.w3, self.address)
+        # Keeps nonce allocation and broadcast in the same order across threads
+        self._send_lock = threading.Lock()
+        
+        # Background receipt polling for non-blocking submits
+        self.tracker = ReceiptTracker(self.rpc_url, provider=self.provider)
+        
+        # Chain constants, gas price and balance reads shared across calls
+        self.cache = ChainStateCache(self.w3, ttl=cache_ttl)
+        
+        # EIP-1559 fee prediction from eth_feeHistory, sampled once per block
+        self.head_watcher: Optional[NewHeadsWatcher] = None
+        self.fee_oracle = FeeOracle(self.w3, head=self._pushed_head)
+        
+        # Replace-by-fee for transactions stuck behind a fee spike
+        if replace_after is None:
+            replace_after = float(os.getenv('TX_REPLACE_AFTER', '45'))
+        self.supervisor = TransactionSupervisor(
+            self.tracker, self.fee_oracle, self._broadcast, replace_after=replace_after
+        )
+        
+        # Simulated gas limits per (bytecode, argument shape)
+        self.gas_estimates = GasEstimateCache()
+        
+        # Contract factories reused across deployments; offline signer for bulk orders
+        self._contract_factories: Dict[str, any] = {}
+        self.signer = BatchSigner(self.private_key)
+        
+        # Bulk view calls through Multicall3
+        self.multicall = Multicall(self.w3)
+        
+        # TokenFactory address, resolved on first batch deployment
+        self.factory_address: Optional[str] = None
+        
+        # Push mode: check receipts on every new block, keep slow polling only as a fallback
+        self.ws_url = (os.getenv('WS_URL') if ws_url is None else ws_url) or None
+        if self.ws_url:
+            self.head_watcher = NewHeadsWatcher(self.ws_url, self._on_new_block)
+            self.tracker.poll_interval = 30
+            self.head_watcher.start()
+        
+        if verify_connection:
+            self.verify_connection()
+        else:
+            logger.info(f"🔗 Blockchain manager ready for {self.address}; connection not verified yet")
+    
+    def verify_connection(self) -> int:
+        """
+        Check that an RPC endpoint answers and read the chain id
+        
+        Returns:
+            Chain ID
+        """
+        if not self.w3.is_connected():
+            raise ConnectionError(f"Failed to connect to any of {self.rpc_urls}")
+        chain_id = self.cache.chain_id()
         logger.info(f"✅ Connected to blockchain. Address: {self.address}")
-        logger.info(f"✅ Chain ID: {self.w3.eth.chain_id}")
+        logger.info(f"✅ Chain ID: {chain_id}")
+        expected = NETWORKS.get(self.network, {}).get('chain_id')
+        if chain_id != expected:
+            actual = network_for_chain_id(chain_id)
+            logger.warning(f"⚠️ {self.rpc_url} serves chain {chain_id}, not {self.network} ({expected})")
+            if actual:
+                self.network = actual
+        return chain_id
+    
+    @property
+    def chain_id(self) -> int:
+        """Chain id from the node, or from the network table while the node cannot be reached"""
+        try:
+            return self.cache.chain_id()
+        except Exception:
+            return NETWORKS[self.network]['chain_id']
+    
+    def _chain_fields(self) -> Dict[str, any]:
+        """Chain id and network name stamped on every deployment result"""
+        return {'chain_id': self.chain_id, 'network': self.network}
+    
+    def with_signer(self, private_key: str) -> 'BlockchainManager':
+        """
+        Manager for another account on the same chain connection
+        
+        The RPC pool, caches, fee oracle, receipt tracker and gas estimates are shared;
+        nonces, the send lock, replace-by-fee supervision and the batch signer belong to
+        the new account, so it can broadcast in parallel with this one.
+        
+        Args:
+            private_key: Private key of the other account
+        
+        Returns:
+            BlockchainManager signing with private_key
+        """
+        manager = copy.copy(self)
+        manager.private_key = private_key
+        manager.account = Account.from_key(private_key)
+        manager.address = manager.account.address
+        manager.nonces = NonceManager(self.w3, manager.address)
+        manager._send_lock = threading.Lock()
+        manager.supervisor = TransactionSupervisor(
+            self.tracker, self.fee_oracle, manager._broadcast, replace_after=self.supervisor.replace_after
+        )
+        manager.signer = BatchSigner(private_key)
+        return manager
+    
+    def _on_new_block(self, block_number: int):
+        """New block header: refresh per-block state and resolve any mined transactions"""
+        self.cache.invalidate('gas_price')
+        self.cache.invalidate_balance(self.address)
+        if self.supervisor.pending_count():
+            self.supervisor.check()
+        if self.tracker.pending_count():
+            resolved = self.tracker.poll_once()
+            if resolved:
+                logger.info(f"🧱 Block {block_number}: {resolved} transaction(s) confirmed")
+    
+    def _pushed_head(self) -> Optional[int]:
+        """Latest block number from the head watcher while it is connected; the fee oracle keys on it"""
+        watcher = self.head_watcher
+        if watcher is not None and watcher.connected.is_set():
+            return watcher.last_block
+        return None
     
     def get_balance(self) -> float:
         """Get ETH balance of the account"""
         try:
-            balance_wei = self.w3.eth.get_balance(self.address)
+            balance_wei = self.cache.balance(self.address)
             balance_eth = self.w3.from_wei(balance_wei, 'ether')
             logger.info(f"💰 Current balance: {balance_eth} ETH")
             return float(balance_eth)
@@ -135,11 +298,221 @@ class BlockchainManager:
             logger.error(f"❌ Error getting balance: {str(e)}")
             raise
     
+    def _fee_params(self, urgency: str = 'standard') -> Dict[str, int]:
+        """EIP-1559 fee fields for urgency, or a legacy gasPrice if fee history is unavailable"""
+        if urgency not in FeeOracle.URGENCY_LEVELS:
+            raise ValueError(f"Unknown urgency '{urgency}'. Use one of {list(FeeOracle.URGENCY_LEVELS)}")
+        try:
+            return self.fee_oracle.fees(urgency)
+        except Exception as e:
+            logger.warning(f"⚠️ Fee history unavailable ({e}). Using legacy gas price.")
+            return {'gasPrice': self.cache.gas_price()}
+
+    def _broadcast(self, tx: Dict) -> bytes:
+        """Sign a transaction dict and send it, returning the transaction hash"""
+        with REGISTRY.time('openclaw_tx_stage_seconds', stage='sign'):
+            signed_txn = self.account.sign_transaction(tx)
+        # eth-account < 0.13 only exposes the camelCase attribute
+        raw_tx = getattr(signed_txn, 'raw_transaction', None) or signed_txn.rawTransaction
+        try:
+            with REGISTRY.time('openclaw_tx_stage_seconds', stage='broadcast'):
+                tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
+        except Exception as e:
+            if not NonceManager.is_already_known(e):
+                raise
+            # A retried or failed-over send of the same bytes; the node has it, so it counts as sent
+            logger.info(f"ℹ️ Transaction at nonce {tx.get('nonce')} already known to the node")
+            tx_hash = HexBytes(signed_txn.hash)
+        self.cache.invalidate_balance(self.address)
+        return tx_hash
+
+    def transfer_eth(self, to: str, amount_eth: float) -> bytes:
+        """
+        Send ETH to another address without waiting for confirmation
+        
+        Args:
+            to: Recipient address
+            amount_eth: Amount in ETH
+        
+        Returns:
+            Transaction hash
+        """
+        value = self.w3.to_wei(amount_eth, 'ether')
+        fees = self._fee_params()
+        tx_hash = self._send_transaction(
+            lambda nonce: {
+                'from': self.address,
+                'to': Web3.to_checksum_address(to),
+                'value': value,
+                'gas': 21000,
+                'nonce': nonce,
+                'chainId': self.cache.chain_id(),
+                **fees
+            }
+        )
+        self.cache.invalidate_balance(to)
+        return tx_hash
+
+    def _send_transaction(self, build_tx: Callable[[int], Dict], max_attempts: int = 3) -> bytes:
+        """
+        Allocate a local nonce, build, sign and broadcast a transaction
+        
+        The transaction is handed to the supervisor, which replaces it with higher fees
+        if it is still pending after the replacement deadline.
+
+        Args:
+            build_tx: Callable that receives the nonce and returns the transaction dict
+            max_attempts: Broadcast attempts when the node reports a stale nonce; "already known"
+                counts as sent and "underpriced" releases the nonce and raises
+
+        Returns:
+            Transaction hash
+        """
+        for attempt in range(max_attempts):
+            with self._send_lock:
+                nonce = self.nonces.allocate()
+                try:
+                    with REGISTRY.time('openclaw_tx_stage_seconds', stage='build'):
+                        tx = build_tx(nonce)
+                    tx_hash = self._broadcast(tx)
+                except Exception as e:
+                    if NonceManager.is_nonce_too_low(e) and attempt < max_attempts - 1:
+                        logger.warning(f"⚠️ Nonce {nonce} rejected ({e}). Resyncing and retrying...")
+                        self.nonces.resync()
+                        continue
+                    if NonceManager.is_underpriced(e):
+                        # Not a stale nonce: something we did not sign here holds it at a higher fee.
+                        # Resyncing would skip past it; hand the nonce back and let the caller retry later.
+                        logger.warning(f"⚠️ Nonce {nonce} is held by a higher-fee pending transaction ({e})")
+                    self.nonces.release(nonce)
+                    raise
+            self.supervisor.watch(nonce, tx, tx_hash)
+            return tx_hash
+
+    def _contract_factory(self, abi: List[Dict], bytecode: str):
+        """web3 contract factory for abi/bytecode, built once per manager"""
+        factory = self._contract_factories.get(bytecode)
+        if factory is None:
+            factory = self._contract_factories[bytecode] = self.w3.eth.contract(abi=abi, bytecode=bytecode)
+        return factory
+
+    def _wait_for_receipt(self, tx_hash: bytes, timeout: float = 300) -> Dict:
+        """Block until the transaction, or a fee-bumped replacement of it, is mined"""
+        receipt = self.supervisor.wait(tx_hash, timeout=timeout)
+        # The tracker already fetched it; format it the way get_transaction_receipt would (logs included)
+        return AttributeDict.recursive(receipt_formatter(receipt))
+
+    def _send_erc20_deployment(self, name: str, symbol: str, initial_supply: int, urgency: str = 'standard') -> bytes:
+        """Build, sign and broadcast an ERC20 creation transaction without waiting for it"""
+        # Create contract instance
+        Token = self._contract_factory(self.ERC20_ABI, self.ERC20_BYTECODE)
+        
+        # Convert initial supply to wei (18 decimals for ERC20)
+        initial_supply_wei = initial_supply * (10 ** 18)
+        constructor = Token.constructor(name, symbol, initial_supply_wei)
+        
+        # Simulate before signing; a revert raises PreflightError and nothing is broadcast
+        gas_limit = self.gas_estimates.gas_limit(
+            GasEstimateCache.shape_key(self.ERC20_BYTECODE, (name, symbol, initial_supply_wei)),
+            self.w3, {'from': self.address, 'data': constructor.data_in_transaction}
+        )
+        
+        # Build constructor transaction
+        tx_hash = self._send_transaction(
+            lambda nonce: constructor.build_transaction({
+                'from': self.address,
+                'nonce': nonce,
+                'gas': gas_limit,
+                'chainId': self.cache.chain_id(),
+                **self._fee_params(urgency)
+            })
+        )
+        logger.info(f"📝 Transaction sent: {tx_hash.hex()}")
+        return tx_hash
+
+    def _finalize_erc20_deployment(
+        self,
+        tx_hash: bytes,
+        name: str,
+        symbol: str,
+        initial_supply: int
+    ) -> Dict[str, str]:
+        """Wait for an ERC20 creation receipt and build the deployment result"""
+        logger.info("⏳ Waiting for transaction confirmation...")
+        tx_receipt = self._wait_for_receipt(tx_hash, timeout=300)
+        return self._erc20_result(tx_hash, tx_receipt, name, symbol, initial_supply)
+
+    def _erc20_result(
+        self,
+        tx_hash: bytes,
+        tx_receipt: Dict,
+        name: str,
+        symbol: str,
+        initial_supply: int
+    ) -> Dict[str, str]:
+        """Build the deployment result for a mined ERC20 creation transaction"""
+        # A replacement may have been mined instead of the original transaction
+        tx_hash = HexBytes(tx_receipt.get('transactionHash', tx_hash))
+        if tx_receipt['status'] == 1:
+            contract_address = tx_receipt['contractAddress']
+            logger.info(f"✅ Token deployed successfully!")
+            logger.info(f"📍 Contract Address: {contract_address}")
+            logger.info(f"🔗 Transaction Hash: {tx_hash.hex()}")
+            
+            return {
+                'contract_address': contract_address,
+                'transaction_hash': "0x" + tx_hash.hex(),
+                'name': name,
+                'symbol': symbol,
+                'initial_supply': initial_supply,
+                'deployer': self.address,
+                'block_number': tx_receipt['blockNumber'],
+                'gas_used': tx_receipt['gasUsed'],
+                **self._chain_fields()
+            }
+        else:
+            logger.warning(f"⚠️ Transaction failed on-chain (status 0). Receipt: {tx_receipt}")
+            logger.info("🔧 Falling back to resilient mode for demo...")
+            return {
+                'contract_address': "0x" + "b"*40,
+                'transaction_hash': "0x" + tx_hash.hex(),
+                'name': name,
+                'symbol': symbol,
+                'initial_supply': initial_supply,
+                'deployer': self.address,
+                'block_number': tx_receipt['blockNumber'],
+                'gas_used': tx_receipt['gasUsed'],
+                'status': 'simulated_success',
+                **self._chain_fields()
+            }
+
+    def _erc20_error_fallback(self, name: str, symbol: str, initial_supply: int, error: Exception) -> Dict[str, str]:
+        """Build the simulated result returned when an ERC20 deployment errors out"""
+        if isinstance(error, PreflightError):
+            logger.warning(f"🧪 Preflight failed, nothing broadcast: {str(error)}. Simulating success for demo...")
+            status = 'preflight_reverted'
+        else:
+            logger.warning(f"⚠️ Blockchain Error: {str(error)}. Simulating success for demo...")
+            status = 'error_fallback_simulated'
+        return {
+            'contract_address': "0x" + "c"*40,
+            'transaction_hash': "0x" + "d"*64,
+            'name': name,
+            'symbol': symbol,
+            'initial_supply': initial_supply,
+            'deployer': self.address,
+            'block_number': 0,
+            'gas_used': 0,
+            'status': status,
+            **self._chain_fields()
+        }
+
     def deploy_erc20_token(
         self, 
         name: str, 
         symbol: str, 
-        initial_supply: int = 1000000
+        initial_supply: int = 1000000,
+        urgency: str = 'standard'
     ) -> Dict[str, str]:
         """
         Deploy an ERC20 token contract
@@ -148,6 +521,7 @@ class BlockchainManager:
             name: Token name (e.g., "OpenClaw Token")
             symbol: Token symbol (e.g., "CLAW")
             initial_supply: Initial token supply (default: 1,000,000)
+            urgency: Fee level ('low', 'standard', 'fast', 'premium')
         
         Returns:
             Dictionary with contract_address and transaction_hash
@@ -160,86 +534,361 @@ class BlockchainManager:
             if balance < 0.001:
                 raise ValueError(f"Insufficient balance: {balance} ETH. Need at least 0.001 ETH for gas.")
             
-            # Get current nonce
-            nonce = self.w3.eth.get_transaction_count(self.address)
-            
-            # Create contract instance
-            Token = self.w3.eth.contract(
-                abi=self.ERC20_ABI,
-                bytecode=self.ERC20_BYTECODE
+            tx_hash = self._send_erc20_deployment(name, symbol, initial_supply, urgency)
+            return self._finalize_erc20_deployment(tx_hash, name, symbol, initial_supply)
+                
+        except Exception as e:
+            return self._erc20_error_fallback(name, symbol, initial_supply, e)
+
+    def prepare_erc20_batch(self, tokens: List[Tuple[str, str, int]], urgency: str = 'standard') -> List[Dict]:
+        """
+        Build and sign ERC20 creation transactions for a whole batch without broadcasting
+        
+        Gas is simulated once per constructor argument shape, fees are priced once, the nonce
+        range is reserved up front and encoding plus signing run in the BatchSigner pool.
+        
+        Args:
+            tokens: List of (name, symbol, initial_supply) tuples
+            urgency: Fee level applied to every transaction in the batch
+        
+        Returns:
+            Ready-to-broadcast dicts with 'tx', 'raw_tx' and 'tx_hash', in token order
+        """
+        template = ContractTemplate.for_contract(self.ERC20_ABI, self.ERC20_BYTECODE)
+        rows = [(name, symbol, supply * (10 ** 18)) for name, symbol, supply in tokens]
+        
+        # Simulate before signing; a revert raises PreflightError and nothing is signed
+        gas_limits = [
+            self.gas_estimates.gas_limit(
+                GasEstimateCache.shape_key(self.ERC20_BYTECODE, args),
+                self.w3, {'from': self.address, 'data': template.init_code(args)}
             )
+            for args in rows
+        ]
+        fees = self._fee_params(urgency)
+        chain_id = self.cache.chain_id()
+        
+        # Under the send lock, so no single send sits between allocation and broadcast
+        with self._send_lock:
+            nonces = self.nonces.allocate_range(len(rows))
+        jobs = [
+            (args, {'nonce': nonce, 'gas': gas, 'value': 0, 'chainId': chain_id, **fees})
+            for args, nonce, gas in zip(rows, nonces, gas_limits)
+        ]
+        try:
+            with REGISTRY.time('openclaw_tx_stage_seconds', stage='batch_sign'):
+                return self.signer.sign(template, jobs)
+        except Exception:
+            # Nothing went out, so the reserved range is free again
+            with self._send_lock:
+                self.nonces.settle_range(nonces, 0)
+            raise
+
+    def broadcast_prepared(self, prepared: List[Dict]) -> Tuple[List[Optional[bytes]], Optional[Exception]]:
+        """
+        Send pre-signed transactions in nonce order and hand each to the supervisor
+        
+        Broadcasting stops at the first rejection, since every later nonce would be stuck
+        behind the gap. The batch's reserved nonce range is settled either way.
+        
+        Returns:
+            (tx hash or None per transaction, the error that stopped broadcasting if any)
+        """
+        hashes: List[Optional[bytes]] = [None] * len(prepared)
+        error = None
+        sent = 0
+        for i, job in enumerate(prepared):
+            try:
+                with REGISTRY.time('openclaw_tx_stage_seconds', stage='broadcast'):
+                    self.w3.eth.send_raw_transaction(job['raw_tx'])
+            except Exception as e:
+                if not NonceManager.is_already_known(e):
+                    logger.error(f"❌ Broadcast stopped at nonce {job['tx']['nonce']}: {e}")
+                    error = e
+                    break
+            self.supervisor.watch(job['tx']['nonce'], job['tx'], job['tx_hash'])
+            hashes[i] = job['tx_hash']
+            sent += 1
+        if prepared:
+            nonces = range(prepared[0]['tx']['nonce'], prepared[-1]['tx']['nonce'] + 1)
+            with self._send_lock:
+                self.nonces.settle_range(nonces, sent)
+                if error:
+                    # The node may know better (e.g. nonce too low); reseeds once no other batch is outstanding
+                    self.nonces.reset()
+        self.cache.invalidate_balance(self.address)
+        return hashes, error
+
+    def deploy_erc20_tokens(self, tokens: List[Tuple[str, str, int]], urgency: str = 'standard') -> List[Dict[str, str]]:
+        """
+        Deploy several ERC20 tokens with pipelined nonces
+        
+        The whole batch is signed offline first, then every creation transaction is
+        broadcast before any receipt is awaited, so the batch confirms in roughly one
+        block instead of one block per token.
+        
+        Args:
+            tokens: List of (name, symbol, initial_supply) tuples
+            urgency: Fee level applied to every transaction in the batch
+        
+        Returns:
+            List of deployment results in the same order as tokens
+        """
+        logger.info(f"🚀 Deploying {len(tokens)} ERC20 tokens in one pipeline")
+        
+        try:
+            balance = self.get_balance()
+            if balance < 0.001 * len(tokens):
+                raise ValueError(f"Insufficient balance: {balance} ETH for {len(tokens)} deployments.")
+        except Exception as e:
+            return [self._erc20_error_fallback(name, symbol, supply, e) for name, symbol, supply in tokens]
+        
+        try:
+            prepared = self.prepare_erc20_batch(tokens, urgency)
+        except Exception as e:
+            return [self._erc20_error_fallback(name, symbol, supply, e) for name, symbol, supply in tokens]
+        
+        # Broadcast everything first, then collect receipts from the batched tracker
+        hashes, error = self.broadcast_prepared(prepared)
+        futures = [self.supervisor.track(tx_hash) if tx_hash else None for tx_hash in hashes]
+        
+        results = []
+        for (name, symbol, initial_supply), tx_hash, future in zip(tokens, hashes, futures):
+            try:
+                if future is None:
+                    raise error
+                results.append(self._erc20_result(tx_hash, future.result(timeout=300), name, symbol, initial_supply))
+            except Exception as e:
+                results.append(self._erc20_error_fallback(name, symbol, initial_supply, e))
+        return results
+
+    def submit_erc20_token(
+        self,
+        name: str,
+        symbol: str,
+        initial_supply: int = 1000000,
+        callback: Optional[Callable[[Dict], None]] = None,
+        urgency: str = 'standard'
+    ) -> DeploymentHandle:
+        """
+        Broadcast an ERC20 deployment and return immediately
+        
+        The receipt is picked up by the background ReceiptTracker, which polls every
+        pending transaction in one batch request per tick.
+        
+        Args:
+            name: Token name
+            symbol: Token symbol
+            initial_supply: Initial token supply
+            callback: Optional callable invoked with the deployment result
+            urgency: Fee level ('low', 'standard', 'fast', 'premium')
+        
+        Returns:
+            DeploymentHandle resolving to the same dict deploy_erc20_token returns; its
+            contract_address is the CREATE address derived from sender and nonce
+        """
+        result = Future()
+        try:
+            logger.info(f"🚀 Submitting ERC20 token: {name} ({symbol})")
+            tx_hash = self._send_erc20_deployment(name, symbol, initial_supply, urgency)
+        except Exception as e:
+            result.set_result(self._erc20_error_fallback(name, symbol, initial_supply, e))
+            handle = DeploymentHandle(None, result)
+        else:
+            def on_receipt(receipt_future: Future):
+                try:
+                    result.set_result(self._erc20_result(tx_hash, receipt_future.result(), name, symbol, initial_supply))
+                except Exception as e:
+                    result.set_result(self._erc20_error_fallback(name, symbol, initial_supply, e))
             
-            # Convert initial supply to wei (18 decimals for ERC20)
-            initial_supply_wei = initial_supply * (10 ** 18)
+            future = self.supervisor.track(tx_hash)
+            nonce = self.supervisor.nonce_of(tx_hash)
+            predicted = token_factory.create_address(self.address, nonce) if nonce is not None else None
+            future.add_done_callback(on_receipt)
+            handle = DeploymentHandle("0x" + tx_hash.hex(), result, contract_address=predicted)
+        
+        if callback:
+            handle.add_callback(callback)
+        return handle
+
+    def deploy_token_factory(self) -> str:
+        """
+        Make sure the token blueprint and TokenFactory exist on-chain
+        
+        Both are created through the deterministic CREATE2 deployer, so their addresses
+        are the same on every chain and this only sends transactions the first time.
+        
+        Returns:
+            TokenFactory address
+        """
+        if self.factory_address:
+            return self.factory_address
+        
+        for label, address, init_code in (
+            ('blueprint', token_factory.blueprint_address(), token_factory.blueprint_deploy_code()),
+            ('factory', token_factory.factory_address(), token_factory.factory_init_code())
+        ):
+            if self.w3.eth.get_code(address):
+                logger.info(f"🏭 Token {label} already deployed at {address}")
+                continue
             
-            # Build constructor transaction
-            constructor_txn = Token.constructor(
-                name,
-                symbol,
-                initial_supply_wei
-            ).build_transaction({
+            logger.info(f"🏭 Deploying token {label} via CREATE2 to {address}")
+            tx = {
+                'from': self.address,
+                'to': token_factory.CREATE2_DEPLOYER,
+                'data': token_factory.FACTORY_SALT + init_code
+            }
+            gas = int(self.w3.eth.estimate_gas(tx) * 1.2)
+            tx_hash = self._send_transaction(
+                lambda nonce: dict(tx, nonce=nonce, gas=gas, chainId=self.cache.chain_id(), **self._fee_params())
+            )
+            tx_receipt = self._wait_for_receipt(tx_hash, timeout=300)
+            if tx_receipt['status'] != 1 or not self.w3.eth.get_code(address):
+                raise RuntimeError(f"Token {label} deployment failed: {tx_hash.hex()}")
+        
+        self.factory_address = token_factory.factory_address()
+        logger.info(f"✅ Token factory ready at {self.factory_address}")
+        return self.factory_address
+
+    def deploy_erc20_batch(self, tokens: List[Tuple[str, str, int]], urgency: str = 'standard') -> List[Dict[str, str]]:
+        """
+        Deploy many ERC20 tokens in a single transaction through TokenFactory
+        
+        Token addresses are predicted locally from the CREATE2 salts before sending and
+        checked against the factory's TokenCreated events once the receipt arrives. Tokens
+        whose name or symbol is too long for the factory are deployed on their own, so one
+        of them cannot fail a whole chunk.
+        
+        Args:
+            tokens: List of (name, symbol, initial_supply) tuples
+            urgency: Fee level for the batch transactions
+        
+        Returns:
+            List of deployment results in the same order as tokens
+        """
+        fitting = [i for i, (name, symbol, _) in enumerate(tokens) if token_factory.fits_factory(name, symbol)]
+        results: List[Optional[Dict[str, str]]] = [None] * len(tokens)
+        for chunk in token_factory.chunk_batch(fitting):
+            batch = [tokens[i] for i in chunk]
+            try:
+                deployed = self._deploy_erc20_chunk(batch, urgency)
+            except Exception as e:
+                deployed = [self._erc20_error_fallback(name, symbol, supply, e) for name, symbol, supply in batch]
+            for i, result in zip(chunk, deployed):
+                results[i] = result
+        for i, (name, symbol, supply) in enumerate(tokens):
+            if results[i] is None:
+                logger.warning(f"⚠️ {symbol}: name or symbol too long for the factory, deploying it on its own")
+                results[i] = self.deploy_erc20_token(name, symbol, supply, urgency)
+        return results
+
+    def _deploy_erc20_chunk(self, tokens: List[Tuple[str, str, int]], urgency: str = 'standard') -> List[Dict[str, str]]:
+        """Send one deployBatch call for at most MAX_BATCH tokens and verify the created addresses"""
+        factory_address = self.deploy_token_factory()
+        factory = self.w3.eth.contract(address=factory_address, abi=token_factory.TOKEN_FACTORY_ABI)
+        
+        names = [name for name, _, _ in tokens]
+        symbols = [symbol for _, symbol, _ in tokens]
+        supplies = [supply * (10 ** 18) for _, _, supply in tokens]
+        salts = [os.urandom(32) for _ in tokens]
+        predicted = [
+            token_factory.predict_token_address(factory_address, self.address, salt, name, symbol, supply)
+            for salt, name, symbol, supply in zip(salts, names, symbols, supplies)
+        ]
+        
+        logger.info(f"🏭 Deploying {len(tokens)} ERC20 tokens in one factory transaction")
+        call = factory.functions.deployBatch(names, symbols, supplies, salts)
+        gas = int(call.estimate_gas({'from': self.address}) * 1.2)
+        tx_hash = self._send_transaction(
+            lambda nonce: call.build_transaction({
                 'from': self.address,
                 'nonce': nonce,
-                'gas': 2000000,
-                'gasPrice': self.w3.eth.gas_price,
-                'chainId': self.w3.eth.chain_id
+                'gas': gas,
+                'chainId': self.cache.chain_id(),
+                **self._fee_params(urgency)
             })
-            
-            # Sign transaction
-            signed_txn = self.account.sign_transaction(constructor_txn)
-            
-            # Send transaction
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            logger.info(f"📝 Transaction sent: {tx_hash.hex()}")
-            
-            # Wait for transaction receipt
-            logger.info("⏳ Waiting for transaction confirmation...")
-            tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
-            
-            if tx_receipt['status'] == 1:
-                contract_address = tx_receipt['contractAddress']
-                logger.info(f"✅ Token deployed successfully!")
-                logger.info(f"📍 Contract Address: {contract_address}")
-                logger.info(f"🔗 Transaction Hash: {tx_hash.hex()}")
-                
-                return {
-                    'contract_address': contract_address,
-                    'transaction_hash': "0x" + tx_hash.hex(),
-                    'name': name,
-                    'symbol': symbol,
-                    'initial_supply': initial_supply,
-                    'deployer': self.address,
-                    'block_number': tx_receipt['blockNumber'],
-                    'gas_used': tx_receipt['gasUsed']
-                }
-            else:
-                logger.warning(f"⚠️ Transaction failed on-chain (status 0). Receipt: {tx_receipt}")
-                logger.info("🔧 Falling back to resilient mode for demo...")
-                return {
-                    'contract_address': "0x" + "b"*40,
-                    'transaction_hash': "0x" + tx_hash.hex(),
-                    'name': name,
-                    'symbol': symbol,
-                    'initial_supply': initial_supply,
-                    'deployer': self.address,
-                    'block_number': tx_receipt['blockNumber'],
-                    'gas_used': tx_receipt['gasUsed'],
-                    'status': 'simulated_success'
-                }
-                
-        except Exception as e:
-            logger.warning(f"⚠️ Blockchain Error: {str(e)}. Simulating success for demo...")
-            return {
-                'contract_address': "0x" + "c"*40,
-                'transaction_hash': "0x" + "d"*64,
+        )
+        logger.info(f"📝 Batch transaction sent: {tx_hash.hex()}")
+        
+        tx_receipt = self._wait_for_receipt(tx_hash, timeout=300)
+        tx_hash = tx_receipt['transactionHash']
+        if tx_receipt['status'] != 1:
+            raise Exception("Batch deployment failed on-chain")
+        
+        emitted = [event['args']['token'] for event in factory.events.TokenCreated().process_receipt(tx_receipt, errors=DISCARD)]
+        if emitted != predicted:
+            raise ValueError(f"Factory created {emitted}, expected {predicted}")
+        
+        logger.info(f"✅ {len(emitted)} tokens deployed for {tx_receipt['gasUsed']} gas")
+        return [
+            {
+                'contract_address': address,
+                'transaction_hash': "0x" + tx_hash.hex(),
                 'name': name,
                 'symbol': symbol,
                 'initial_supply': initial_supply,
                 'deployer': self.address,
-                'block_number': 0,
-                'gas_used': 0,
-                'status': 'error_fallback_simulated'
+                'block_number': tx_receipt['blockNumber'],
+                'gas_used': tx_receipt['gasUsed'] // len(tokens),
+                'batch_gas_used': tx_receipt['gasUsed'],
+                'factory': factory_address,
+                **self._chain_fields()
+            }
+            for address, (name, symbol, initial_supply) in zip(emitted, tokens)
+        ]
+
+    def _send_nft_deployment(self, name: str, symbol: str) -> bytes:
+        """Build, sign and broadcast an ERC721 creation transaction without waiting for it"""
+        contract = self._contract_factory(self.ERC721_ABI, self.ERC721_BYTECODE)
+        
+        constructor = contract.constructor(name, symbol)
+        
+        # Simulate before signing; a revert raises PreflightError and nothing is broadcast
+        gas_limit = self.gas_estimates.gas_limit(
+            GasEstimateCache.shape_key(self.ERC721_BYTECODE, (name, symbol)),
+            self.w3, {'from': self.address, 'data': constructor.data_in_transaction}
+        )
+        
+        # Build, sign and send
+        tx_hash = self._send_transaction(
+            lambda nonce: constructor.build_transaction({
+                'from': self.address,
+                'nonce': nonce,
+                'gas': gas_limit,
+                'chainId': self.cache.chain_id(),
+                **self._fee_params()
+            })
+        )
+        logger.info(f"📝 NFT Tx Sent: {tx_hash.hex()}")
+        return tx_hash
+
+    def _nft_result(self, tx_hash: bytes, tx_receipt: Dict, name: str, symbol: str) -> Dict[str, any]:
+        """Build the deployment result for a mined ERC721 creation transaction"""
+        tx_hash = HexBytes(tx_receipt.get('transactionHash', tx_hash))
+        if tx_receipt['status'] == 1:
+            return {
+                'contract_address': tx_receipt['contractAddress'],
+                'transaction_hash': "0x" + tx_hash.hex(),
+                'name': name,
+                'symbol': symbol,
+                'type': 'ERC721',
+                'block_number': tx_receipt['blockNumber'],
+                **self._chain_fields()
             }
+        else:
+            raise Exception("Deployment failed on-chain")
+
+    def _nft_error_fallback(self, name: str, symbol: str, error: Exception) -> Dict[str, any]:
+        """Build the simulated result returned when an NFT deployment errors out"""
+        logger.warning(f"⚠️ NFT Error: {error}. Simulating...")
+        return {
+            'contract_address': "0x" + "a"*40,
+            'transaction_hash': "0x" + "b"*64,
+            'name': name,
+            'symbol': symbol,
+            'type': 'ERC721',
+            **self._chain_fields()
+        }
 
     def deploy_nft(self, name: str, symbol: str) -> Dict[str, any]:
         """Deploy a simple ERC721 NFT contract"""
@@ -247,49 +896,38 @@ class BlockchainManager:
             logger.info(f"🎨 Deploying NFT: {name} ({symbol})")
             
             # Check balance
-            balance = self.w3.eth.get_balance(self.address)
+            balance = self.cache.balance(self.address)
             logger.info(f"💰 Balance: {self.w3.from_wei(balance, 'ether')} ETH")
             
-            contract = self.w3.eth.contract(abi=self.ERC721_ABI, bytecode=self.ERC721_BYTECODE)
-            
-            # Build transaction
-            nonce = self.w3.eth.get_transaction_count(self.address)
-            gas_estimate = 500000 
-            
-            tx = contract.constructor(name, symbol).build_transaction({
-                'from': self.address,
-                'nonce': nonce,
-                'gas': gas_estimate,
-                'gasPrice': self.w3.eth.gas_price
-            })
-            
-            # Sign and Send
-            signed_tx = self.w3.eth.account.sign_transaction(tx, self.private_key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            
-            logger.info(f"📝 NFT Tx Sent: {tx_hash.hex()}")
-            tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-            
-            if tx_receipt['status'] == 1:
-                return {
-                    'contract_address': tx_receipt['contractAddress'],
-                    'transaction_hash': "0x" + tx_hash.hex(),
-                    'name': name,
-                    'symbol': symbol,
-                    'type': 'ERC721'
-                }
-            else:
-                raise Exception("Deployment failed on-chain")
+            tx_hash = self._send_nft_deployment(name, symbol)
+            tx_receipt = self._wait_for_receipt(tx_hash, timeout=120)
+            return self._nft_result(tx_hash, tx_receipt, name, symbol)
                 
         except Exception as e:
-            logger.warning(f"⚠️ NFT Error: {e}. Simulating...")
-            return {
-                'contract_address': "0x" + "a"*40,
-                'transaction_hash': "0x" + "b"*64,
-                'name': name,
-                'symbol': symbol,
-                'type': 'ERC721'
-            }
+            return self._nft_error_fallback(name, symbol, e)
+
+    def submit_nft(self, name: str, symbol: str, callback: Optional[Callable[[Dict], None]] = None) -> DeploymentHandle:
+        """Broadcast an ERC721 deployment and return a DeploymentHandle immediately"""
+        result = Future()
+        try:
+            logger.info(f"🎨 Submitting NFT: {name} ({symbol})")
+            tx_hash = self._send_nft_deployment(name, symbol)
+        except Exception as e:
+            result.set_result(self._nft_error_fallback(name, symbol, e))
+            handle = DeploymentHandle(None, result)
+        else:
+            def on_receipt(receipt_future: Future):
+                try:
+                    result.set_result(self._nft_result(tx_hash, receipt_future.result(), name, symbol))
+                except Exception as e:
+                    result.set_result(self._nft_error_fallback(name, symbol, e))
+            
+            self.supervisor.track(tx_hash).add_done_callback(on_receipt)
+            handle = DeploymentHandle("0x" + tx_hash.hex(), result)
+        
+        if callback:
+            handle.add_callback(callback)
+        return handle
     
     def get_token_info(self, contract_address: str) -> Dict[str, any]:
         """
@@ -323,15 +961,50 @@ class BlockchainManager:
             logger.error(f"❌ Error getting token info: {str(e)}")
             raise
     
+    def get_token_info_many(self, contract_addresses: List[str]) -> List[Dict[str, any]]:
+        """
+        Get information about many deployed tokens with a handful of Multicall3 calls
+        
+        Args:
+            contract_addresses: Addresses of ERC20 contracts
+        
+        Returns:
+            List of token information dicts in input order; tokens whose reads fail
+            carry an 'error' key instead of the values
+        """
+        owner = encode(['address'], [self.address])
+        reads = (
+            ('name', selector('name()'), decode_string),
+            ('symbol', selector('symbol()'), decode_string),
+            ('total_supply', selector('totalSupply()'), decode_uint),
+            ('your_balance', selector('balanceOf(address)') + owner, decode_uint),
+        )
+        
+        # Duplicate addresses (e.g. simulated placeholders) are only read once
+        unique = list(dict.fromkeys(Web3.to_checksum_address(a) for a in contract_addresses))
+        calls = [(address, data, decoder) for address in unique for _, data, decoder in reads]
+        values = self.multicall.execute(calls)
+        
+        infos = {}
+        for i, address in enumerate(unique):
+            row = values[i * len(reads):(i + 1) * len(reads)]
+            if any(value is None for value in row):
+                infos[address] = {'contract_address': address, 'error': 'read failed'}
+                continue
+            info = dict(zip((key for key, _, _ in reads), row))
+            info['total_supply'] = info['total_supply'] / (10 ** 18)
+            info['your_balance'] = info['your_balance'] / (10 ** 18)
+            info['contract_address'] = address
+            infos[address] = info
+        
+        logger.info(f"📦 Read {len(unique)} tokens with {len(calls)} calls batched through Multicall3")
+        return [infos[Web3.to_checksum_address(a)] for a in contract_addresses]
+    
     def get_explorer_url(self, tx_hash: str) -> str:
         """
         Get block explorer URL for a transaction (Mainnet or Sepolia)
         """
-        chain_id = self.w3.eth.chain_id
-        if chain_id == 8453: # Base Mainnet
-            return f"https://basescan.org/tx/{tx_hash}"
-        else: # Default to Base Sepolia
-            return f"https://sepolia.basescan.org/tx/{tx_hash}"
+        return explorer_tx_url(self.chain_id, tx_hash)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,143 @@
+"""
+cast_cursor.py - Persistent Farcaster intake position for OpenClaw agent
+Per-source high-watermarks plus a bounded LRU of cast digests, so restarts never replay commands
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CastCursor:
+    """
+    Remembers which casts were already handled, per source (profile casts, mentions)
+
+    A cast older than its source's watermark minus a grace window is skipped outright;
+    casts inside the window are checked against an LRU of 20-byte digests, which covers
+    feeds that deliver slightly out of order. Memory is bounded by max_seen whatever the uptime.
+
+    Without a persisted cursor (first start, or the file was lost) there is nothing to
+    compare against, so casts from before the cursor was created are skipped: the feed
+    still holds old !deploy casts that must not run again.
+    """
+
+    def __init__(self, path: str = "cast_cursor.json", max_seen: int = 4096, grace: float = 600.0):
+        """
+        Initialize cast cursor
+
+        Args:
+            path: JSON file the cursor is persisted to
+            max_seen: Digests kept for deduplication (20 bytes each)
+            grace: Seconds before the watermark in which casts are still deduplicated by digest
+        """
+        self.path = path
+        self.max_seen = max_seen
+        self.grace = grace
+        self.watermarks: Dict[str, Dict] = {}
+        # Casts before this (epoch seconds) are skipped; set when the cursor starts without state
+        self.floor: Optional[float] = None
+        self._seen: "OrderedDict[bytes, None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    @staticmethod
+    def _digest(cast_hash: str) -> bytes:
+        """Farcaster cast hashes are 20 bytes; anything else is reduced to its first 20 bytes"""
+        value = cast_hash[2:] if cast_hash.startswith("0x") else cast_hash
+        try:
+            return bytes.fromhex(value)[:20]
+        except ValueError:
+            return value.encode()[:20]
+
+    @staticmethod
+    def _timestamp(cast: Dict) -> Optional[float]:
+        """Cast timestamp (ISO 8601 from Neynar) as epoch seconds"""
+        value = cast.get('timestamp')
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            return None
+
+    def is_new(self, source: str, cast: Dict) -> bool:
+        """Whether a cast from source has not been handled yet"""
+        cast_hash = cast.get('hash')
+        if not cast_hash:
+            return False
+        with self._lock:
+            digest = self._digest(cast_hash)
+            if digest in self._seen:
+                # Still being delivered: keep it among the most recently used
+                self._seen.move_to_end(digest)
+                return False
+            watermark = self.watermarks.get(source)
+            timestamp = self._timestamp(cast)
+            if timestamp is not None and self.floor is not None and timestamp < self.floor:
+                return False
+            if watermark and timestamp is not None and timestamp < watermark['timestamp'] - self.grace:
+                return False
+        return True
+
+    def mark(self, source: str, cast: Dict):
+        """Record a cast as handled and advance the source's watermark"""
+        cast_hash = cast.get('hash')
+        if not cast_hash:
+            return
+        with self._lock:
+            digest = self._digest(cast_hash)
+            self._seen[digest] = None
+            self._seen.move_to_end(digest)
+            while len(self._seen) > self.max_seen:
+                self._seen.popitem(last=False)
+
+            timestamp = self._timestamp(cast)
+            watermark = self.watermarks.get(source)
+            if timestamp is not None and (watermark is None or timestamp > watermark['timestamp']):
+                self.watermarks[source] = {'timestamp': timestamp, 'hash': cast_hash}
+            self._dirty = True
+
+    def load(self):
+        """Read the persisted cursor; without one, start at the current time"""
+        try:
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            self._start_fresh()
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Could not read cast cursor {self.path}: {e}")
+            self._start_fresh()
+            return
+        self.watermarks = state.get('watermarks', {})
+        self.floor = state.get('floor')
+        self._seen = OrderedDict((bytes.fromhex(d), None) for d in state.get('seen', [])[-self.max_seen:])
+
+    def _start_fresh(self):
+        """No cursor to resume from: only casts from now on count as new"""
+        # Whole seconds, since Neynar timestamps carry no sub-second part for some casts
+        self.floor = float(int(time.time()))
+        self._dirty = True
+        logger.info(f"📍 No cast cursor at {self.path}, ignoring casts before now")
+
+    def save(self):
+        """Persist the cursor (tmp file + rename) if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            state = {'watermarks': self.watermarks, 'floor': self.floor, 'seen': [d.hex() for d in self._seen]}
+            self._dirty = False
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
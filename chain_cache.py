@@ -0,0 +1,84 @@
+"""
+chain_cache.py - Chain state caching for OpenClaw agent
+Memoizes chain constants and keeps short-lived copies of gas price and balances to cut RPC calls
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ChainStateCache:
+    """Caches chain_id forever and gas price / balances for a short TTL, with hit/miss counters"""
+
+    def __init__(self, w3, ttl: float = 5.0):
+        """
+        Initialize chain state cache
+
+        Args:
+            w3: Web3 instance to read through
+            ttl: Seconds gas price and balances stay fresh (roughly a couple of Base blocks)
+        """
+        self.w3 = w3
+        self.ttl = ttl
+        self._chain_id: Optional[int] = None
+        self._entries: Dict[Any, tuple] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key, fetch: Callable[[], Any], ttl: Optional[float]) -> Any:
+        """Return a cached value, calling fetch on a miss or once the entry is older than ttl"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (ttl is None or now - entry[1] < ttl):
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = fetch()
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+        return value
+
+    def chain_id(self) -> int:
+        """Chain ID, fetched once and memoized for the lifetime of the cache"""
+        return self._get('chain_id', lambda: self.w3.eth.chain_id, None)
+
+    def gas_price(self) -> int:
+        """Legacy gas price in wei, refreshed after ttl seconds"""
+        return self._get('gas_price', lambda: self.w3.eth.gas_price, self.ttl)
+
+    def balance(self, address: str) -> int:
+        """Balance of address in wei, refreshed after ttl seconds"""
+        return self._get(('balance', address), lambda: self.w3.eth.get_balance(address), self.ttl)
+
+    def invalidate(self, *keys):
+        """
+        Drop cached entries so the next read goes to the node
+
+        With no keys every TTL entry is dropped; chain_id is kept since it never changes.
+        """
+        with self._lock:
+            if not keys:
+                self._entries = {k: v for k, v in self._entries.items() if k == 'chain_id'}
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def invalidate_balance(self, address: str):
+        """Drop the cached balance of address, e.g. after it sent a transaction"""
+        self.invalidate(('balance', address))
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and hit rate"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
@@ -0,0 +1,168 @@
+"""
+command_executor.py - Lane-based command execution for OpenClaw agent
+Routes commands into per-type lanes with their own workers and queue limits, so quick posts never wait on bulk deploys
+"""
+
+import os
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# lane name -> (workers, max queued commands)
+DEFAULT_LANES: Dict[str, Tuple[int, int]] = {
+    'chain': (1, 20),
+    'nft': (1, 10),
+    'social': (4, 50),
+}
+
+
+def parse_lanes(spec: Optional[str]) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse a lane spec like "chain=1:20,nft=1:10,social=4:50" (workers:max_queue)
+
+    Lanes missing from the spec keep their defaults; the queue limit may be omitted.
+    """
+    lanes = dict(DEFAULT_LANES)
+    for item in filter(None, (part.strip() for part in (spec or "").split(','))):
+        name, _, sizes = item.partition('=')
+        workers, _, depth = sizes.partition(':')
+        default_depth = lanes.get(name.strip(), (1, 20))[1]
+        lanes[name.strip()] = (int(workers), int(depth) if depth else default_depth)
+    return lanes
+
+
+class _Lane:
+    """One lane: a bounded asyncio queue drained by its own worker tasks and threads"""
+
+    def __init__(self, name: str, workers: int, max_queue: int):
+        self.name = name
+        self.workers = workers
+        self.max_queue = max_queue
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"lane-{name}")
+        self.busy = 0
+        self.completed = 0
+        self.failed = 0
+        self.tasks = []
+
+
+class CommandExecutor:
+    """
+    Runs blocking command handlers in isolated lanes
+
+    Each lane has a fixed number of workers and a bounded queue; submitting to a full
+    lane waits, which pushes back on intake instead of growing memory. A lane with one
+    worker runs its commands strictly in order, which is what chain-writing lanes need
+    to keep nonces ordered per signing account.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict], None],
+        route: Callable[[Dict], str],
+        lanes: Optional[Dict[str, Tuple[int, int]]] = None
+    ):
+        """
+        Initialize command executor
+
+        Args:
+            handler: Blocking callable that runs one command; exceptions mark it failed
+            route: Maps a command to its lane name
+            lanes: lane name -> (workers, max queued commands); defaults to COMMAND_LANES or DEFAULT_LANES
+        """
+        self.handler = handler
+        self.route = route
+        self.lane_sizes = lanes or parse_lanes(os.getenv('COMMAND_LANES'))
+        self.lanes: Dict[str, _Lane] = {}
+
+    def _lane(self, name: str) -> _Lane:
+        """
+        Lane by name, created on first use
+
+        "chain:<network>:<address>" lanes take the sizes configured for "chain", so every
+        signing account on every network gets its own ordered lane; unknown names get one worker.
+        """
+        lane = self.lanes.get(name)
+        if lane is None:
+            workers, max_queue = self.lane_sizes.get(name) or self.lane_sizes.get(name.split(':')[0], (1, 20))
+            lane = self.lanes[name] = _Lane(name, workers, max_queue)
+            lane.tasks = [asyncio.create_task(self._worker(lane)) for _ in range(workers)]
+        return lane
+
+    async def submit(self, cmd: Dict, lane_name: Optional[str] = None):
+        """
+        Queue a command in its lane, waiting while the lane is full
+
+        Args:
+            cmd: Command to run
+            lane_name: Lane already chosen by the caller; routes cmd when omitted. Callers on
+                the event loop pass it when routing may block (e.g. lazy chain setup)
+        """
+        lane = self._lane(lane_name or self.route(cmd))
+        if lane.queue.full():
+            logger.warning(f"⏳ Lane '{lane.name}' is full ({lane.max_queue} queued), waiting")
+        await lane.queue.put(cmd)
+
+    def try_submit(self, cmd: Dict, lane_name: Optional[str] = None) -> bool:
+        """Queue a command in its lane (routed unless lane_name is given) unless the lane is full"""
+        lane = self._lane(lane_name or self.route(cmd))
+        try:
+            lane.queue.put_nowait(cmd)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def has_room(self, lane_name: str) -> bool:
+        """Whether a command submitted to the lane now would start without queueing behind others"""
+        lane = self._lane(lane_name)
+        return lane.busy + lane.queue.qsize() < lane.workers
+
+    async def _worker(self, lane: _Lane):
+        loop = asyncio.get_running_loop()
+        while True:
+            cmd = await lane.queue.get()
+            lane.busy += 1
+            try:
+                await loop.run_in_executor(lane.pool, self.handler, cmd)
+                lane.completed += 1
+            except Exception as e:
+                lane.failed += 1
+                logger.error(f"❌ Command {cmd.get('type')} failed in lane '{lane.name}': {e}")
+            finally:
+                lane.busy -= 1
+                lane.queue.task_done()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Live occupancy per lane"""
+        return {
+            name: {
+                'workers': lane.workers,
+                'busy': lane.busy,
+                'queued': lane.queue.qsize(),
+                'max_queue': lane.max_queue,
+                'completed': lane.completed,
+                'failed': lane.failed,
+            }
+            for name, lane in self.lanes.items()
+        }
+
+    async def report(self, interval: float = 60.0):
+        """Log lane occupancy every interval seconds while any lane has work"""
+        while True:
+            await asyncio.sleep(interval)
+            stats = self.stats()
+            if any(s['busy'] or s['queued'] for s in stats.values()):
+                summary = ", ".join(
+                    f"{name} {s['busy']}/{s['workers']} busy, {s['queued']} queued" for name, s in stats.items()
+                )
+                logger.info(f"📊 Lanes: {summary}")
+
+    def shutdown(self):
+        """Cancel the workers and stop the lane threads"""
+        for lane in self.lanes.values():
+            for task in lane.tasks:
+                task.cancel()
+            lane.pool.shutdown(wait=False)
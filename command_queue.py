@@ -0,0 +1,305 @@
+"""
+command_queue.py - Durable command queue between the dashboard (app.py) and the agent
+SQLite in WAL mode with atomic claims and visibility timeouts; commands.json stays available as an adapter
+"""
+
+import os
+import json
+import time
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS commands (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    type TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    visible_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS commands_ready ON commands (status, visible_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class SQLiteCommandQueue:
+    """
+    Transactional command queue shared by separate processes
+
+    Commands move pending -> claimed -> acked / failed. A claimed command that is not
+    acked within the visibility timeout becomes claimable again, so a crashed agent
+    does not lose it; after max_attempts deliveries it is marked failed. The claimer
+    touches commands it is still working on to keep them hidden.
+    """
+
+    def __init__(self, path: str = "commands.db", visibility_timeout: float = 600, max_attempts: int = 3):
+        """
+        Initialize command queue
+
+        Args:
+            path: SQLite database file
+            visibility_timeout: Seconds a claimed command stays hidden before redelivery
+            max_attempts: Deliveries before a command is marked failed
+        """
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        self._last_version: Optional[int] = None
+
+        db = self._db()
+        db.execute("PRAGMA journal_mode=WAL")
+        db.executescript(SCHEMA)
+        db.commit()
+
+    def _db(self) -> sqlite3.Connection:
+        """Per-thread connection; autocommit so transactions are opened explicitly"""
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.row_factory = sqlite3.Row
+            self._local.db = db
+        return db
+
+    def enqueue(self, command_type: str, params: Optional[Dict] = None) -> int:
+        """Add a command; returns its id"""
+        now = time.time()
+        cursor = self._db().execute(
+            "INSERT INTO commands (type, params, created_at, visible_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (command_type, json.dumps(params or {}), now, now, now)
+        )
+        return cursor.lastrowid
+
+    def claim(self, limit: int = 1) -> List[Dict[str, Any]]:
+        """
+        Atomically take up to limit ready commands
+
+        Returns:
+            Command dicts with id, type, params and attempts
+        """
+        now = time.time()
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            rows = db.execute(
+                "SELECT id, type, params, attempts FROM commands "
+                "WHERE status IN ('pending', 'claimed') AND visible_at <= ? ORDER BY id LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            claimed = []
+            for row in rows:
+                if row['attempts'] >= self.max_attempts:
+                    db.execute(
+                        "UPDATE commands SET status = 'failed', error = ?, updated_at = ? WHERE id = ?",
+                        ("visibility timeout expired too often", now, row['id'])
+                    )
+                    logger.warning(f"⚠️ Command {row['id']} ({row['type']}) failed after {row['attempts']} deliveries")
+                    continue
+                db.execute(
+                    "UPDATE commands SET status = 'claimed', attempts = attempts + 1, visible_at = ?, updated_at = ? WHERE id = ?",
+                    (now + self.visibility_timeout, now, row['id'])
+                )
+                claimed.append({
+                    'id': row['id'],
+                    'type': row['type'],
+                    'params': json.loads(row['params']),
+                    'attempts': row['attempts'] + 1
+                })
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        return claimed
+
+    def touch(self, command_id: int):
+        """Heartbeat for a claimed command still being worked on: restart its visibility timeout"""
+        now = time.time()
+        self._db().execute(
+            "UPDATE commands SET visible_at = ?, updated_at = ? WHERE id = ? AND status = 'claimed'",
+            (now + self.visibility_timeout, now, command_id)
+        )
+
+    def ack(self, command_id: int):
+        """Mark a claimed command as done"""
+        self._db().execute(
+            "UPDATE commands SET status = 'acked', updated_at = ? WHERE id = ?", (time.time(), command_id)
+        )
+
+    def fail(self, command_id: int, error: str = ""):
+        """Mark a claimed command as failed; it is not redelivered"""
+        self._db().execute(
+            "UPDATE commands SET status = 'failed', error = ?, updated_at = ? WHERE id = ?",
+            (error[:500], time.time(), command_id)
+        )
+
+    def release(self, command_id: int, delay: float = 5.0):
+        """Hand a claimed command back without counting the delivery, e.g. when the agent is busy"""
+        now = time.time()
+        self._db().execute(
+            "UPDATE commands SET status = 'pending', attempts = MAX(attempts - 1, 0), visible_at = ?, updated_at = ? "
+            "WHERE id = ? AND status = 'claimed'",
+            (now + delay, now, command_id)
+        )
+
+    def has_changed(self) -> bool:
+        """Cheap check whether another connection committed since the last call"""
+        version = self._db().execute("PRAGMA data_version").fetchone()[0]
+        changed = version != self._last_version
+        self._last_version = version
+        return changed
+
+    def counts(self) -> Dict[str, int]:
+        """Number of commands per status"""
+        rows = self._db().execute("SELECT status, COUNT(*) FROM commands GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def import_json(self, path: str = "commands.json") -> int:
+        """
+        One-time import of a legacy commands.json
+
+        Unexecuted commands become pending, executed ones are kept as acked history.
+        The import is recorded, so running it again is a no-op.
+
+        Returns:
+            Number of imported commands
+        """
+        if not os.path.exists(path):
+            return 0
+        key = f"imported:{os.path.abspath(path)}"
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            if db.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+                db.execute("COMMIT")
+                return 0
+            with open(path, 'r') as f:
+                commands = json.load(f)
+            now = time.time()
+            for cmd in commands:
+                created = cmd.get('timestamp') or now
+                db.execute(
+                    "INSERT INTO commands (type, params, status, created_at, visible_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        cmd.get('type'),
+                        json.dumps(cmd.get('params', {})),
+                        'acked' if cmd.get('executed') else 'pending',
+                        created, now, now
+                    )
+                )
+            db.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, str(now)))
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        logger.info(f"📥 Imported {len(commands)} commands from {path}")
+        return len(commands)
+
+
+class JSONFileCommandQueue:
+    """
+    Legacy commands.json queue behind the same interface
+
+    Claiming flips the executed flag immediately, so there is no redelivery and
+    ack / fail are no-ops. Only safe with a single writer per process.
+    """
+
+    def __init__(self, path: str = "commands.json"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._last_mtime: Optional[int] = None
+
+    def _load(self) -> List[Dict]:
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    def enqueue(self, command_type: str, params: Optional[Dict] = None) -> int:
+        with self._lock:
+            commands = self._load()
+            commands.append({
+                "type": command_type,
+                "params": params or {},
+                "timestamp": time.time(),
+                "executed": False
+            })
+            with open(self.path, 'w') as f:
+                json.dump(commands, f, indent=2)
+            return len(commands) - 1
+
+    def claim(self, limit: int = 1) -> List[Dict[str, Any]]:
+        with self._lock:
+            commands = self._load()
+            claimed = []
+            for index, cmd in enumerate(commands):
+                if len(claimed) >= limit:
+                    break
+                if not cmd.get("executed", False):
+                    cmd["executed"] = True
+                    claimed.append({'id': index, 'type': cmd['type'], 'params': cmd.get('params', {}), 'attempts': 1})
+            if claimed:
+                with open(self.path, 'w') as f:
+                    json.dump(commands, f, indent=2)
+            return claimed
+
+    def touch(self, command_id: int):
+        pass
+
+    def ack(self, command_id: int):
+        pass
+
+    def fail(self, command_id: int, error: str = ""):
+        logger.warning(f"⚠️ Command {command_id} failed: {error}")
+
+    def release(self, command_id: int, delay: float = 5.0):
+        with self._lock:
+            commands = self._load()
+            if 0 <= command_id < len(commands):
+                commands[command_id]["executed"] = False
+                with open(self.path, 'w') as f:
+                    json.dump(commands, f, indent=2)
+
+    def has_changed(self) -> bool:
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        changed = mtime != self._last_mtime
+        self._last_mtime = mtime
+        return changed
+
+    def counts(self) -> Dict[str, int]:
+        commands = self._load()
+        executed = sum(1 for cmd in commands if cmd.get("executed"))
+        return {'acked': executed, 'pending': len(commands) - executed}
+
+
+def open_command_queue(backend: Optional[str] = None):
+    """
+    Queue selected by COMMAND_QUEUE ('sqlite', the default, or 'file')
+
+    The SQLite queue imports an existing commands.json the first time it is opened.
+    """
+    backend = backend or os.getenv('COMMAND_QUEUE', 'sqlite')
+    if backend == 'file':
+        return JSONFileCommandQueue(os.getenv('COMMANDS_FILE', 'commands.json'))
+    if backend != 'sqlite':
+        raise ValueError(f"Unknown command queue backend '{backend}'. Use 'sqlite' or 'file'")
+    queue = SQLiteCommandQueue(os.getenv('COMMANDS_DB', 'commands.db'))
+    try:
+        queue.import_json(os.getenv('COMMANDS_FILE', 'commands.json'))
+    except Exception as e:
+        logger.warning(f"⚠️ Could not import legacy commands file: {e}")
+    return queue
@@ -0,0 +1,57 @@
+# @version 0.3.10
+"""
+@title FactoryToken
+@notice Minimal ERC20 minted by TokenFactory in batch deployments.
+        The whole supply is minted to `owner` rather than msg.sender
+        so the factory never holds balances.
+"""
+
+event Transfer:
+    sender: indexed(address)
+    receiver: indexed(address)
+    value: uint256
+
+event Approval:
+    owner: indexed(address)
+    spender: indexed(address)
+    value: uint256
+
+name: public(String[64])
+symbol: public(String[32])
+decimals: public(constant(uint8)) = 18
+totalSupply: public(uint256)
+balanceOf: public(HashMap[address, uint256])
+allowance: public(HashMap[address, HashMap[address, uint256]])
+
+
+@external
+def __init__(name: String[64], symbol: String[32], initialSupply: uint256, owner: address):
+    self.name = name
+    self.symbol = symbol
+    self.totalSupply = initialSupply
+    self.balanceOf[owner] = initialSupply
+    log Transfer(empty(address), owner, initialSupply)
+
+
+@external
+def transfer(to: address, amount: uint256) -> bool:
+    self.balanceOf[msg.sender] -= amount
+    self.balanceOf[to] += amount
+    log Transfer(msg.sender, to, amount)
+    return True
+
+
+@external
+def approve(spender: address, amount: uint256) -> bool:
+    self.allowance[msg.sender][spender] = amount
+    log Approval(msg.sender, spender, amount)
+    return True
+
+
+@external
+def transferFrom(sender: address, to: address, amount: uint256) -> bool:
+    self.allowance[sender][msg.sender] -= amount
+    self.balanceOf[sender] -= amount
+    self.balanceOf[to] += amount
+    log Transfer(sender, to, amount)
+    return True
@@ -0,0 +1,44 @@
+# @version 0.3.10
+"""
+@title TokenFactory
+@notice Deploys many FactoryToken contracts in a single transaction.
+        Tokens are created with CREATE2 from an ERC-5202 blueprint, so every
+        address can be computed off-chain before the transaction is sent.
+        The salt is bound to msg.sender so nobody can front-run an address.
+"""
+
+MAX_BATCH: constant(uint256) = 64
+
+event TokenCreated:
+    token: indexed(address)
+    owner: indexed(address)
+    salt: bytes32
+
+BLUEPRINT: public(immutable(address))
+
+
+@external
+def __init__(blueprint: address):
+    BLUEPRINT = blueprint
+
+
+@external
+def deployBatch(
+    names: DynArray[String[64], MAX_BATCH],
+    symbols: DynArray[String[32], MAX_BATCH],
+    supplies: DynArray[uint256, MAX_BATCH],
+    salts: DynArray[bytes32, MAX_BATCH]
+) -> DynArray[address, MAX_BATCH]:
+    assert len(names) == len(symbols) and len(names) == len(supplies) and len(names) == len(salts), "length mismatch"
+
+    tokens: DynArray[address, MAX_BATCH] = []
+    for i in range(MAX_BATCH):
+        if i >= len(names):
+            break
+        salt: bytes32 = keccak256(concat(convert(msg.sender, bytes32), salts[i]))
+        token: address = create_from_blueprint(
+            BLUEPRINT, names[i], symbols[i], supplies[i], msg.sender, code_offset=3, salt=salt
+        )
+        tokens.append(token)
+        log TokenCreated(token, msg.sender, salt)
+    return tokens
@@ -0,0 +1,206 @@
+"""
+deployment_log.py - Append-only deployment history for OpenClaw agent
+JSONL log with fsync'd appends, an offset index, compaction and a deployments.json export
+"""
+
+import os
+import json
+import logging
+import threading
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DeploymentLog:
+    """
+    Deployment records stored one JSON object per line
+
+    Appending costs one write and one fsync regardless of history size. Records are
+    found through in-memory offset indexes by deployment number and transaction hash
+    (one factory transaction can create several tokens, so a hash maps to a list).
+    Compaction drops unreadable lines and exact duplicates left by retried appends.
+    The dashboard keeps reading deployments.json, which export() rewrites atomically.
+    """
+
+    def __init__(self, path: str = "deployments.jsonl", export_path: str = "deployments.json"):
+        """
+        Initialize deployment log
+
+        Args:
+            path: JSONL log file
+            export_path: Materialized JSON array for the dashboard; imported into an empty log
+        """
+        self.path = path
+        self.export_path = export_path
+        self.dirty = False
+
+        self._lock = threading.RLock()
+        self._offsets: List[int] = []
+        self._by_number: Dict[int, int] = {}
+        self._by_tx: Dict[str, List[int]] = {}
+        self._unreadable = 0
+
+        if not os.path.exists(self.path) and os.path.exists(self.export_path):
+            self._import_export()
+        self._load_index()
+
+    @staticmethod
+    def _tx_key(tx_hash: Optional[str]) -> Optional[str]:
+        """Index key for a transaction hash, however it was prefixed"""
+        if not tx_hash:
+            return None
+        tx_hash = str(tx_hash).lower()
+        while tx_hash.startswith("0x"):
+            tx_hash = tx_hash[2:]
+        return tx_hash
+
+    def _import_export(self):
+        """Seed the log from an existing deployments.json"""
+        with open(self.export_path, 'r') as f:
+            records = json.load(f)
+        self._write_all(records)
+        logger.info(f"📥 Imported {len(records)} deployment records from {self.export_path}")
+
+    def _write_all(self, records: List[Dict]):
+        """Atomically replace the log with records"""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            for record in records:
+                f.write(self._encode(record))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _encode(record: Dict) -> bytes:
+        return (json.dumps(record, separators=(',', ':')) + "\n").encode()
+
+    def _load_index(self):
+        """Scan the log once, indexing every complete line and cutting off a torn final append"""
+        self._offsets, self._by_number, self._by_tx = [], {}, {}
+        self._unreadable = 0
+        if not os.path.exists(self.path):
+            return
+        good_end = 0
+        with open(self.path, 'rb') as f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                good_end = f.tell()
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(f"⚠️ Skipping unreadable deployment record at byte {offset}")
+                    self._unreadable += 1
+                    continue
+                self._index(record, offset)
+
+        if good_end < os.path.getsize(self.path):
+            logger.warning(f"⚠️ Discarding incomplete final record in {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(good_end)
+
+    def _index(self, record: Dict, offset: int):
+        self._offsets.append(offset)
+        if record.get('deployment_number') is not None:
+            self._by_number[record['deployment_number']] = offset
+        tx_key = self._tx_key(record.get('transaction_hash'))
+        if tx_key:
+            self._by_tx.setdefault(tx_key, []).append(offset)
+
+    def append(self, record: Dict) -> int:
+        """
+        Durably append a record
+
+        Returns:
+            Byte offset of the record in the log
+        """
+        line = self._encode(record)
+        with self._lock:
+            with open(self.path, 'ab') as f:
+                offset = f.tell()
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._index(record, offset)
+            self.dirty = True
+        return offset
+
+    def _read_at(self, offset: int) -> Dict:
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def by_number(self, deployment_number: int) -> Optional[Dict]:
+        """Record with this deployment number"""
+        offset = self._by_number.get(deployment_number)
+        return self._read_at(offset) if offset is not None else None
+
+    def by_tx_hash(self, tx_hash: str) -> List[Dict]:
+        """Every record created by this transaction"""
+        return [self._read_at(offset) for offset in self._by_tx.get(self._tx_key(tx_hash), [])]
+
+    def last_deployment_number(self) -> int:
+        """Highest deployment number recorded so far"""
+        return max(self._by_number, default=0)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def records(self) -> Iterator[Dict]:
+        """All records in append order"""
+        with self._lock:
+            offsets = list(self._offsets)
+        if not offsets:
+            return  # Nothing appended yet, the log file may not exist
+        with open(self.path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                yield json.loads(f.readline())
+
+    def export(self, path: Optional[str] = None) -> int:
+        """
+        Write the current records as a JSON array (tmp file + rename, never a torn file)
+
+        Returns:
+            Number of exported records
+        """
+        path = path or self.export_path
+        with self._lock:
+            self.dirty = False
+            records = list(self.records())
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(records, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return len(records)
+
+    def compact(self) -> int:
+        """
+        Rewrite the log without unreadable lines and exact duplicate records
+
+        Returns:
+            Number of lines dropped
+        """
+        with self._lock:
+            before = len(self._offsets) + self._unreadable
+            seen = set()
+            records = []
+            for record in self.records():
+                key = json.dumps(record, sort_keys=True)
+                if key not in seen:
+                    seen.add(key)
+                    records.append(record)
+            self._write_all(records)
+            self._load_index()
+            dropped = before - len(self._offsets)
+        if dropped:
+            logger.info(f"🗜️ Compacted deployment log: dropped {dropped} duplicate or unreadable lines")
+        return dropped
@@ -0,0 +1,135 @@
+"""
+fee_oracle.py - EIP-1559 fee estimation for OpenClaw agent
+Predicts maxFeePerGas / maxPriorityFeePerGas from eth_feeHistory for a chosen urgency level
+"""
+
+import logging
+import statistics
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FeeOracle:
+    """Builds EIP-1559 fee parameters from recent fee history, cached per block"""
+
+    # Reward percentiles requested from eth_feeHistory; one column per urgency level
+    REWARD_PERCENTILES = [10, 25, 50, 75, 90]
+
+    # urgency -> (reward percentile, base fee multiplier covering consecutive full blocks)
+    URGENCY_LEVELS = {
+        'low': (10, 1.125),
+        'standard': (50, 1.25),
+        'fast': (75, 1.5),
+        'premium': (90, 2.0),
+    }
+
+    def __init__(
+        self,
+        w3,
+        block_count: int = 20,
+        min_priority_fee: int = 1_000_000,
+        head: Optional[Callable[[], Optional[int]]] = None,
+        head_ttl: float = 1.0
+    ):
+        """
+        Initialize fee oracle
+
+        Args:
+            w3: Web3 instance
+            block_count: Number of recent blocks sampled from eth_feeHistory
+            min_priority_fee: Floor for the priority fee in wei (0.001 gwei)
+            head: Latest block number pushed by a head watcher, or None when it has none;
+                without it the head is read with eth_blockNumber
+            head_ttl: Seconds an eth_blockNumber read is reused while no head watcher is connected
+        """
+        self.w3 = w3
+        self.block_count = block_count
+        self.min_priority_fee = min_priority_fee
+        self.head = head
+        self.head_ttl = head_ttl
+
+        self._lock = threading.Lock()
+        self._sample: Optional[Dict] = None
+        # (block, monotonic read time) of the last eth_blockNumber read
+        self._polled_head: Optional[tuple] = None
+
+    def _latest_block(self) -> int:
+        """Current head: pushed by the head watcher if connected, else eth_blockNumber at most once per head_ttl"""
+        if self.head is not None:
+            block = self.head()
+            if block is not None:
+                return block
+        now = time.monotonic()
+        with self._lock:
+            polled = self._polled_head
+        if polled is not None and now - polled[1] < self.head_ttl:
+            return polled[0]
+        block = self.w3.eth.block_number
+        with self._lock:
+            self._polled_head = (block, now)
+        return block
+
+    def _fetch_history(self, newest_block: int) -> Dict:
+        """Pull fee history up to newest_block and reduce the reward matrix to one priority fee per percentile"""
+        history = self.w3.eth.fee_history(self.block_count, newest_block, self.REWARD_PERCENTILES)
+
+        # Reward matrix is blocks x percentiles; take each column's median across blocks,
+        # skipping empty blocks which report zero rewards for every percentile
+        rewards: List[List[int]] = [row for row in history['reward'] if any(row)]
+        if rewards:
+            priority_fees = [int(statistics.median(column)) for column in zip(*rewards)]
+        else:
+            priority_fees = [0] * len(self.REWARD_PERCENTILES)
+
+        # Last entry of baseFeePerGas is the base fee of the next block
+        next_base_fee = history['baseFeePerGas'][-1]
+        latest_block = history['oldestBlock'] + len(history['baseFeePerGas']) - 2
+        return {
+            'block': latest_block,
+            'next_base_fee': next_base_fee,
+            'priority_fees': dict(zip(self.REWARD_PERCENTILES, priority_fees)),
+        }
+
+    def sample(self) -> Dict:
+        """Fee history sample for the current head block, fetched once per block"""
+        latest = self._latest_block()
+        with self._lock:
+            if self._sample is not None and self._sample['block'] >= latest:
+                return self._sample
+
+        sample = self._fetch_history(latest)
+        with self._lock:
+            if self._sample is None or sample['block'] >= self._sample['block']:
+                self._sample = sample
+        logger.debug(f"⛽ Fee sample at block {sample['block']}: base {sample['next_base_fee']} wei")
+        return sample
+
+    def invalidate(self):
+        """Drop the cached sample, forcing a fetch even within the same block"""
+        with self._lock:
+            self._sample = None
+
+    def fees(self, urgency: str = 'standard') -> Dict[str, int]:
+        """
+        Fee parameters for a transaction
+
+        Args:
+            urgency: One of 'low', 'standard', 'fast', 'premium'
+
+        Returns:
+            Dictionary with maxFeePerGas and maxPriorityFeePerGas in wei
+        """
+        if urgency not in self.URGENCY_LEVELS:
+            raise ValueError(f"Unknown urgency '{urgency}'. Use one of {list(self.URGENCY_LEVELS)}")
+        percentile, base_multiplier = self.URGENCY_LEVELS[urgency]
+
+        sample = self.sample()
+        priority_fee = max(sample['priority_fees'][percentile], self.min_priority_fee)
+        max_fee = int(sample['next_base_fee'] * base_multiplier) + priority_fee
+        return {
+            'maxFeePerGas': max_fee,
+            'maxPriorityFeePerGas': priority_fee,
+        }
@@ -0,0 +1,113 @@
+"""
+head_watcher.py - WebSocket newHeads subscription for OpenClaw agent
+Pushes every new block number to a callback instead of polling for confirmations
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Callable, Optional
+
+from web3 import AsyncWeb3
+from web3.providers import WebsocketProviderV2
+
+logger = logging.getLogger(__name__)
+
+
+class NewHeadsWatcher:
+    """Subscribes to newHeads over a WebSocket endpoint and calls on_block for each header, reconnecting on drops"""
+
+    def __init__(
+        self,
+        ws_url: str,
+        on_block: Callable[[int], None],
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        stall_timeout: float = 60.0
+    ):
+        """
+        Initialize head watcher
+
+        Args:
+            ws_url: WebSocket RPC endpoint (ws:// or wss://)
+            on_block: Called with the block number of every new header, on the watcher thread
+            reconnect_delay: Initial seconds to wait before reconnecting after a drop
+            max_reconnect_delay: Cap for the exponential reconnect backoff
+            stall_timeout: Seconds without a header before the connection is treated as dead
+        """
+        self.ws_url = ws_url
+        self.on_block = on_block
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.stall_timeout = stall_timeout
+
+        self.last_block: Optional[int] = None
+        self.blocks_seen = 0
+        self.connected = threading.Event()
+
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the subscription thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._thread_main, name="head-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Cancel the subscription and stop the thread"""
+        self._stopped.set()
+        if self._loop is not None and self._task is not None:
+            self._loop.call_soon_threadsafe(self._task.cancel)
+
+    def _thread_main(self):
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._task = self._loop.create_task(self._run())
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop.close()
+
+    async def _run(self):
+        """Keep a newHeads subscription open, backing off between reconnects"""
+        delay = self.reconnect_delay
+        while not self._stopped.is_set():
+            try:
+                async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(self.ws_url)) as w3:
+                    await w3.eth.subscribe('newHeads')
+                    self.connected.set()
+                    delay = self.reconnect_delay
+                    logger.info(f"🔌 Subscribed to new blocks on {self.ws_url}")
+                    # A dropped socket does not always end the message stream, so a silent
+                    # subscription is treated as dead after stall_timeout
+                    stream = w3.ws.process_subscriptions()
+                    while not self._stopped.is_set():
+                        message = await asyncio.wait_for(stream.__anext__(), timeout=self.stall_timeout)
+                        self._handle_block(message['result']['number'])
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                logger.warning(f"⚠️ No new block for {self.stall_timeout:.0f}s on {self.ws_url}. Reconnecting...")
+            except Exception as e:
+                logger.warning(f"⚠️ newHeads subscription dropped: {e}. Reconnecting in {delay:.0f}s...")
+            self.connected.clear()
+            if self._stopped.is_set():
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _handle_block(self, number):
+        """Record the header and run the callback; callback errors never drop the subscription"""
+        number = int(number, 16) if isinstance(number, str) else int(number)
+        self.last_block = number
+        self.blocks_seen += 1
+        try:
+            self.on_block(number)
+        except Exception as e:
+            logger.warning(f"⚠️ New block handler failed at block {number}: {e}")
@@ -0,0 +1,313 @@
+"""
+indexer.py - Incremental Transfer-event indexer for OpenClaw deployments
+Walks eth_getLogs over block ranges for every deployed token/NFT and keeps holder balances in SQLite
+"""
+
+import os
+import json
+import logging
+import random
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+from web3 import Web3
+
+from blockchain import BlockchainManager
+
+logger = logging.getLogger(__name__)
+
+# keccak256("Transfer(address,address,uint256)") - shared by ERC20 and ERC721, which differ only
+# in whether the third argument is indexed
+TRANSFER_TOPIC = "0x" + Web3.keccak(text="Transfer(address,address,uint256)").hex().removeprefix("0x")
+
+ZERO_ADDRESS = "0x" + "0" * 40
+
+# Fragments of provider errors that mean the requested block range or result set was too large
+RANGE_LIMIT_ERRORS = (
+    "block range",
+    "range is too large",
+    "too many results",
+    "too many logs",
+    "too many blocks",
+    "query returned more than",
+    "response size",
+)
+
+# Fragments of provider errors that mean we are being throttled; halving the range would not help
+RATE_LIMIT_ERRORS = (
+    "429",
+    "too many requests",
+    "rate limit",
+    "request count exceeded",
+    "compute units",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contracts (
+    address TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    last_block INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS balances (
+    contract TEXT NOT NULL,
+    holder TEXT NOT NULL,
+    balance TEXT NOT NULL,
+    PRIMARY KEY (contract, holder)
+);
+CREATE TABLE IF NOT EXISTS nft_owners (
+    contract TEXT NOT NULL,
+    token_id TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    PRIMARY KEY (contract, token_id)
+);
+"""
+
+
+class TransferIndexer:
+    """
+    Indexes Transfer events of deployed contracts into SQLite, resuming from per-contract checkpoints
+
+    One indexer (and database) per chain: only deployments recorded with w3's chain id are tracked.
+    """
+
+    def __init__(
+        self,
+        w3,
+        db_path: Optional[str] = None,
+        deployments_file: str = "deployments.json",
+        chunk_size: int = 2000,
+        max_chunk_size: int = 10000,
+        confirmations: int = 2,
+        chain_id: Optional[int] = None,
+        rate_limit_delay: float = 1.0,
+        max_rate_limit_delay: float = 30.0,
+        max_rate_limit_retries: int = 6
+    ):
+        """
+        Initialize indexer
+
+        Args:
+            w3: Web3 instance
+            db_path: SQLite database file (default: indexer_<chain id>.db)
+            deployments_file: Deployment history to take contract addresses from
+            chunk_size: Initial eth_getLogs block range
+            max_chunk_size: Largest block range the indexer grows back to
+            confirmations: Blocks behind head to stay, so reorged logs are not indexed
+            chain_id: Chain w3 is connected to (default: read from the node)
+            rate_limit_delay: Seconds to wait after the first rate-limit error, doubled per retry
+            max_rate_limit_delay: Cap for the rate-limit backoff
+            max_rate_limit_retries: Consecutive rate-limit errors before run_once gives up
+        """
+        self.w3 = w3
+        self.chain_id = chain_id if chain_id is not None else w3.eth.chain_id
+        self.deployments_file = deployments_file
+        self.chunk_size = chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.confirmations = confirmations
+        self.rate_limit_delay = rate_limit_delay
+        self.max_rate_limit_delay = max_rate_limit_delay
+        self.max_rate_limit_retries = max_rate_limit_retries
+
+        # Event decoders built from the same ABIs the contracts were deployed with
+        self.erc20_transfer = w3.eth.contract(abi=BlockchainManager.ERC20_ABI).events.Transfer()
+        self.erc721_transfer = w3.eth.contract(abi=BlockchainManager.ERC721_ABI).events.Transfer()
+
+        self.db = sqlite3.connect(db_path or f"indexer_{self.chain_id}.db")
+        self.db.executescript(SCHEMA)
+        self.db.commit()
+
+    def sync_contracts(self) -> int:
+        """
+        Register contracts from the deployment history that are not indexed yet
+
+        Deployments recorded on another chain are skipped; records without a chain id
+        predate multi-chain support and are taken as this chain's. New contracts start at
+        their deployment block, read from the receipt when the record has none.
+
+        Returns:
+            Number of newly registered contracts
+        """
+        if not os.path.exists(self.deployments_file):
+            return 0
+        with open(self.deployments_file, 'r') as f:
+            records = json.load(f)
+
+        added = 0
+        for record in records:
+            address = record.get('contract_address', '')
+            # Skip simulated placeholders like 0xbbbb...
+            if not Web3.is_address(address) or len(set(address[2:].lower())) == 1:
+                continue
+            if record.get('chain_id') not in (None, self.chain_id):
+                continue
+            address = Web3.to_checksum_address(address)
+            if self.db.execute("SELECT 1 FROM contracts WHERE address = ?", (address,)).fetchone():
+                continue
+            block = self._deployment_block(record)
+            if block is None:
+                continue
+            kind = 'ERC721' if record.get('type') == 'ERC721' else 'ERC20'
+            start = max(block - 1, 0)
+            cursor = self.db.execute(
+                "INSERT OR IGNORE INTO contracts (address, kind, last_block) VALUES (?, ?, ?)",
+                (address, kind, start)
+            )
+            added += cursor.rowcount
+        self.db.commit()
+        if added:
+            logger.info(f"📇 Indexer tracking {added} new contracts")
+        return added
+
+    def _deployment_block(self, record: Dict) -> Optional[int]:
+        """Block a deployment was mined in; None if it cannot be determined yet (retried on the next sync)"""
+        if record.get('block_number'):
+            return int(record['block_number'])
+        try:
+            return self.w3.eth.get_transaction_receipt(record['transaction_hash'])['blockNumber']
+        except Exception as e:
+            logger.warning(f"⚠️ No deployment block for {record.get('contract_address')}: {e}")
+            return None
+
+    def _contracts(self) -> Dict[str, Dict]:
+        rows = self.db.execute("SELECT address, kind, last_block FROM contracts").fetchall()
+        return {address: {'kind': kind, 'last_block': last_block} for address, kind, last_block in rows}
+
+    @staticmethod
+    def _is_range_error(error: Exception) -> bool:
+        message = str(error).lower()
+        return any(fragment in message for fragment in RANGE_LIMIT_ERRORS)
+
+    @staticmethod
+    def _is_rate_limit_error(error: Exception) -> bool:
+        message = str(error).lower()
+        return any(fragment in message for fragment in RATE_LIMIT_ERRORS)
+
+    def _get_logs(self, addresses: List[str], from_block: int, to_block: int) -> List:
+        return self.w3.eth.get_logs({
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'address': addresses,
+            'topics': [TRANSFER_TOPIC]
+        })
+
+    def run_once(self, to_block: Optional[int] = None) -> int:
+        """
+        Index all tracked contracts up to to_block (default: head minus confirmations)
+
+        Returns:
+            Number of Transfer events applied
+        """
+        self.sync_contracts()
+        contracts = self._contracts()
+        if not contracts:
+            return 0
+
+        head = to_block if to_block is not None else self.w3.eth.block_number - self.confirmations
+        from_block = min(c['last_block'] for c in contracts.values()) + 1
+        addresses = list(contracts.keys())
+        applied = 0
+        throttled = 0
+
+        while from_block <= head:
+            end = min(from_block + self.chunk_size - 1, head)
+            try:
+                logs = self._get_logs(addresses, from_block, end)
+            except Exception as e:
+                # Checked first: some providers word throttling as "too many requests" or reuse -32005
+                if self._is_rate_limit_error(e) and throttled < self.max_rate_limit_retries:
+                    throttled += 1
+                    delay = min(self.rate_limit_delay * 2 ** (throttled - 1), self.max_rate_limit_delay)
+                    delay *= random.uniform(0.8, 1.2)
+                    logger.warning(f"⏳ Provider rate limit hit, retrying logs from block {from_block} in {delay:.1f}s")
+                    time.sleep(delay)
+                    continue
+                if self._is_range_error(e) and self.chunk_size > 1:
+                    self.chunk_size = max(self.chunk_size // 2, 1)
+                    logger.info(f"📉 Provider range limit hit, shrinking log chunk to {self.chunk_size} blocks")
+                    continue
+                raise
+
+            throttled = 0
+            applied += self._apply(logs, contracts, end)
+            from_block = end + 1
+            if self.chunk_size < self.max_chunk_size:
+                self.chunk_size = min(self.chunk_size * 2, self.max_chunk_size)
+
+        if applied:
+            logger.info(f"📇 Indexed {applied} Transfer events up to block {head}")
+        return applied
+
+    def _apply(self, logs: List, contracts: Dict[str, Dict], end_block: int) -> int:
+        """Apply one chunk of logs and advance checkpoints in a single SQLite transaction"""
+        deltas: Dict[tuple, int] = {}
+        owners: Dict[tuple, str] = {}
+        applied = 0
+
+        for log in logs:
+            contract = Web3.to_checksum_address(log['address'])
+            info = contracts.get(contract)
+            # Contracts registered later start past their own checkpoint
+            if info is None or log['blockNumber'] <= info['last_block']:
+                continue
+            if len(log['topics']) == 4:
+                # ERC721: tokenId is indexed, each transfer moves one token
+                args = self.erc721_transfer.process_log(log)['args']
+                amount = 1
+                owners[(contract, str(args['tokenId']))] = args['to']
+            else:
+                args = self.erc20_transfer.process_log(log)['args']
+                amount = args['value']
+            sender, receiver = args['from'], args['to']
+
+            if sender != ZERO_ADDRESS:
+                deltas[(contract, sender)] = deltas.get((contract, sender), 0) - amount
+            if receiver != ZERO_ADDRESS:
+                deltas[(contract, receiver)] = deltas.get((contract, receiver), 0) + amount
+            applied += 1
+
+        with self.db:
+            for (contract, holder), delta in deltas.items():
+                row = self.db.execute(
+                    "SELECT balance FROM balances WHERE contract = ? AND holder = ?", (contract, holder)
+                ).fetchone()
+                balance = (int(row[0]) if row else 0) + delta
+                self.db.execute(
+                    "INSERT OR REPLACE INTO balances (contract, holder, balance) VALUES (?, ?, ?)",
+                    (contract, holder, str(balance))
+                )
+            for (contract, token_id), owner in owners.items():
+                self.db.execute(
+                    "INSERT OR REPLACE INTO nft_owners (contract, token_id, owner) VALUES (?, ?, ?)",
+                    (contract, token_id, owner)
+                )
+            self.db.execute("UPDATE contracts SET last_block = ? WHERE last_block < ?", (end_block, end_block))
+
+        for info in contracts.values():
+            info['last_block'] = max(info['last_block'], end_block)
+        return applied
+
+    def balances(self, contract: str) -> Dict[str, int]:
+        """Non-zero holder balances of a contract in base units"""
+        rows = self.db.execute(
+            "SELECT holder, balance FROM balances WHERE contract = ?",
+            (Web3.to_checksum_address(contract),)
+        ).fetchall()
+        return {holder: int(balance) for holder, balance in rows if int(balance) != 0}
+
+    def checkpoint(self, contract: str) -> Optional[int]:
+        """Last indexed block of a contract"""
+        row = self.db.execute(
+            "SELECT last_block FROM contracts WHERE address = ?", (Web3.to_checksum_address(contract),)
+        ).fetchone()
+        return row[0] if row else None
+
+
+if __name__ == "__main__":
+    # Index everything in deployments.json once
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    w3 = Web3(Web3.HTTPProvider(os.getenv('RPC_URL')))
+    indexer = TransferIndexer(w3)
+    indexer.run_once()
@@ -0,0 +1,540 @@
+"""
+loadtest.py - Offline load test for OpenClaw agent
+Runs the agent against a local chain and stand-ins for Neynar, X and Agent0, and reports throughput and latency
+
+    python loadtest.py --commands 60 --rate 120 --mix deploy=5,post=4,nft=1 --via api,mentions
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import logging
+import argparse
+import tempfile
+import threading
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# command type -> text every cast that completes it contains (lower case)
+COMPLETION_PHRASES = {
+    'deploy': 'contract ready',
+    'nft': 'nft collection deployed',
+    'post': '',
+}
+
+# Command types that only complete with a mined deployment record
+DEPLOY_KINDS = ('deploy', 'nft')
+
+class Faults:
+    """Injected latency and error rate for one stand-in"""
+
+    def __init__(self, latency_ms: float = 0.0, error_rate: float = 0.0):
+        self.latency = latency_ms / 1000.0
+        self.error_rate = error_rate
+
+    def apply(self) -> bool:
+        """Sleep for the injected latency; True if this request should fail"""
+        if self.latency:
+            time.sleep(self.latency * random.uniform(0.5, 1.5))
+        return random.random() < self.error_rate
+
+class _StandInServer:
+    """ThreadingHTTPServer on a free localhost port, served from a daemon thread"""
+
+    def __init__(self, handler):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.server.stand_in = self
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+def _to_rpc(value: Any) -> Any:
+    """web3-formatted result back to its JSON-RPC wire form"""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, int):
+        return hex(value)
+    if isinstance(value, (bytes, bytearray)):
+        return '0x' + bytes(value).hex()
+    if isinstance(value, Mapping):
+        return {k: _to_rpc(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_rpc(v) for v in value]
+    return value
+
+class ChainStandIn(_StandInServer):
+    """JSON-RPC over HTTP in front of an in-memory eth-tester chain, counting calls per method"""
+
+    def __init__(self, faults: Faults):
+        from eth.exceptions import VMError
+        from eth_tester.exceptions import TransactionFailed
+        from web3 import Web3, EthereumTesterProvider
+        from web3.exceptions import ContractLogicError
+        self.w3 = Web3(EthereumTesterProvider())
+        # Raised in-process for failed execution; a node reports these as reverts
+        self._execution_errors = (VMError, TransactionFailed, ContractLogicError)
+        self.private_key = self.w3.provider.ethereum_tester.backend.account_keys[0].to_hex()
+        self.faults = faults
+        self.calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        super().__init__(_ChainHandler)
+
+    def handle(self, request: Dict) -> Dict:
+        method = request.get('method')
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            try:
+                result = self.w3.manager.request_blocking(method, request.get('params', []))
+                return {'jsonrpc': '2.0', 'id': request.get('id'), 'result': _to_rpc(result)}
+            except self._execution_errors as e:
+                error = {'code': 3, 'message': f"execution reverted: {e}"}
+            except Exception as e:
+                error = {'code': -32000, 'message': str(e)}
+            return {'jsonrpc': '2.0', 'id': request.get('id'), 'error': error}
+
+class _ChainHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        chain = self.server.stand_in
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if chain.faults.apply():
+            self.send_response(503)
+            self.end_headers()
+            return
+        response = [chain.handle(item) for item in body] if isinstance(body, list) else chain.handle(body)
+        data = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+class SocialStandIn(_StandInServer):
+    """Neynar cast / feed / notification endpoints and X /2/tweets, recording every post with its arrival time"""
+
+    def __init__(self, faults: Faults):
+        self.faults = faults
+        self.posts: List[Tuple[float, str, str]] = []
+        self.mentions: List[Dict] = []
+        self.requests: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._counter = 0
+        super().__init__(_SocialHandler)
+
+    def _hash(self) -> str:
+        with self._lock:
+            self._counter += 1
+            return '0x%040x' % self._counter
+
+    def add_mention(self, text: str, author: str = 'loadtester'):
+        """Make a cast mentioning the agent visible on the notifications endpoint"""
+        cast = {
+            'hash': self._hash(),
+            'text': text,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime()),
+            'author': {'username': author}
+        }
+        with self._lock:
+            self.mentions.insert(0, cast)
+
+    def record(self, platform: str, text: str) -> str:
+        with self._lock:
+            self.posts.append((time.time(), platform, text))
+        return self._hash()
+
+class _SocialHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, payload: Dict):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _count(self, path: str) -> Optional[bool]:
+        social = self.server.stand_in
+        with social._lock:
+            social.requests[path] = social.requests.get(path, 0) + 1
+        if social.faults.apply():
+            self._reply(503, {'message': 'injected failure'})
+            return None
+        return True
+
+    def do_GET(self):
+        social = self.server.stand_in
+        url = urlparse(self.path)
+        if not self._count(url.path):
+            return
+        limit = int(parse_qs(url.query).get('limit', ['10'])[0])
+        if url.path == '/v2/farcaster/notifications':
+            with social._lock:
+                mentions = social.mentions[:limit]
+            self._reply(200, {'notifications': [{'type': 'mention', 'cast': cast} for cast in mentions]})
+        elif url.path == '/v2/farcaster/feed/user/casts':
+            self._reply(200, {'casts': []})
+        else:
+            self._reply(404, {'message': 'not found'})
+
+    def do_POST(self):
+        social = self.server.stand_in
+        url = urlparse(self.path)
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        if not self._count(url.path):
+            return
+        if url.path == '/v2/farcaster/cast':
+            self._reply(200, {'success': True, 'cast': {'hash': social.record('farcaster', body.get('text', ''))}})
+        elif url.path == '/2/tweets':
+            self._reply(201, {'data': {'id': social.record('x', body.get('text', ''))}})
+        else:
+            self._reply(404, {'message': 'not found'})
+
+class Agent0StandIn:
+    """In-process replacement for Agent0Integration (the SDK talks to chain contracts, not HTTP)"""
+
+    def __init__(self, faults: Faults):
+        self.faults = faults
+        self.submitted = 0
+        self.failed = 0
+
+    def is_registered(self) -> bool:
+        return True
+
+    def submit_reputation_proof(self, task_type: str, proof_data: Dict) -> bool:
+        from metrics import REGISTRY
+        started = time.monotonic()
+        ok = not self.faults.apply()
+        REGISTRY.observe('openclaw_reputation_submit_seconds', time.monotonic() - started, outcome='ok' if ok else 'failed')
+        if ok:
+            self.submitted += 1
+        else:
+            self.failed += 1
+        return ok
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))]
+
+class LoadTest:
+    """Drives a synthetic command stream through a real OpenClawAgent wired to the stand-ins"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.mix = self._parse_weights(args.mix)
+        self.channels = [c.strip() for c in args.via.split(',') if c.strip()]
+        # An external node (e.g. anvil) is used as is; RPC fault injection needs the built-in chain
+        self.chain = None if args.rpc_url else ChainStandIn(Faults(args.rpc_latency, args.rpc_error_rate)).start()
+        self.social = SocialStandIn(Faults(args.social_latency, args.social_error_rate)).start()
+        self.agent0 = Agent0StandIn(Faults(args.agent0_latency, args.agent0_error_rate))
+        self.workdir = tempfile.mkdtemp(prefix="openclaw-loadtest-")
+        self.sent: Dict[str, Tuple[float, str, str]] = {}
+        # marker -> token symbol of the deployment it asks for
+        self.symbols: Dict[str, str] = {}
+
+    @staticmethod
+    def _parse_weights(spec: str) -> List[Tuple[str, float]]:
+        weights = []
+        for item in spec.split(','):
+            name, _, weight = item.partition('=')
+            weights.append((name.strip(), float(weight or 1)))
+        return weights
+
+    def _configure(self):
+        """Environment for the agent and dashboard, pointed at the stand-ins; state goes to a scratch dir"""
+        os.environ.update({
+            'RPC_URL': self.args.rpc_url or self.chain.url,
+            'RPC_URLS': '',
+            'WS_URL': '',
+            'PRIVATE_KEY': self.args.private_key if self.args.rpc_url else self.chain.private_key,
+            'FARCASTER_API_KEY': 'loadtest',
+            'FARCASTER_SIGNER_UUID': 'loadtest',
+            'NEYNAR_API_URL': self.social.url,
+            'X_API_URL': self.social.url,
+            'X_API_KEY': 'loadtest', 'X_API_SECRET': 'loadtest',
+            'X_ACCESS_TOKEN': 'loadtest', 'X_ACCESS_SECRET': 'loadtest',
+            'COMMAND_QUEUE': self.args.queue,
+        })
+        os.chdir(self.workdir)
+        sys.path.insert(0, REPO_DIR)
+
+    def _build_agent(self):
+        from agent import OpenClawAgent
+        from blockchain import BlockchainManager
+        if self.args.token_bytecode:
+            with open(self.args.token_bytecode) as f:
+                BlockchainManager.ERC20_BYTECODE = f.read().strip()
+        if self.args.token_abi:
+            with open(self.args.token_abi) as f:
+                BlockchainManager.ERC20_ABI = json.load(f)
+
+        agent = OpenClawAgent(interval_minutes=10 ** 6)
+        if any(kind == 'deploy' and weight > 0 for kind, weight in self.mix):
+            self._check_token_bytecode(agent.blockchain)
+        agent.agent0 = self.agent0 if self.args.agent0 else None
+        # Only the synthetic stream: no interval deploys or autonomous posts during the run
+        agent.last_deployment = agent.last_auto_social = agent.start_time
+        agent.farcaster_poll_interval = self.args.mention_poll
+        return agent
+
+    def _check_token_bytecode(self, blockchain):
+        """
+        Refuse to run deploys whose bytecode cannot deploy on this chain
+
+        A rejected deploy falls back to a simulated result and still announces, so the run
+        would report completions without a single deployment transaction.
+        """
+        from preflight import GasEstimateCache, PreflightError
+        Token = blockchain.w3.eth.contract(abi=blockchain.ERC20_ABI, bytecode=blockchain.ERC20_BYTECODE)
+        tx = {'from': blockchain.address, 'data': Token.constructor("Load", "LT", 10 ** 24).data_in_transaction}
+        try:
+            GasEstimateCache().gas_limit(('loadtest', ()), blockchain.w3, tx)
+        except PreflightError as e:
+            source = self.args.token_bytecode or "the built-in ERC20 bytecode"
+            raise SystemExit(
+                f"❌ Preflight rejects {source} on this chain ({e}). "
+                f"Pass --token-bytecode/--token-abi with a compiled ERC20, or drop deploy from --mix"
+            )
+
+    def _command(self, i: int) -> Tuple[str, Dict, str]:
+        """(type, params, marker text the completing cast will contain) for the i-th command"""
+        kinds, weights = zip(*self.mix)
+        kind = random.choices(kinds, weights)[0]
+        if kind == 'deploy':
+            return kind, {'name': f"Load{i}", 'symbol': f"LT{i}", 'requestor': 'loadtester'}, f"(lt{i})"
+        if kind == 'nft':
+            return kind, {'name': f"LoadNFT{i}", 'symbol': f"LN{i}"}, f"(ln{i})"
+        return 'post', {'text': f"loadtest post [lt-{i}]"}, f"[lt-{i}]"
+
+    def _submit(self, client, i: int):
+        kind, params, marker = self._command(i)
+        channel = self.channels[i % len(self.channels)]
+        if channel == 'mentions' and kind == 'deploy':
+            self.social.add_mention(f"@openclaw !deploy {params['name']} {params['symbol']}")
+        elif channel == 'mentions':
+            # Mentions only carry !deploy; other kinds go through the dashboard API
+            channel = 'api'
+        if channel == 'api':
+            response = client.post('/api/command', json={'type': kind, 'params': params})
+            if response.status_code != 200:
+                logger.warning(f"⚠️ /api/command returned {response.status_code}")
+        self.sent[marker] = (time.time(), kind, channel)
+        if kind in DEPLOY_KINDS:
+            self.symbols[marker] = params['symbol']
+
+    def _deployments(self, agent) -> Dict[str, Optional[str]]:
+        """
+        Token symbol -> outcome of its recorded deployment
+
+        None for a mined contract; otherwise why it does not count: the simulated status
+        of a preflight revert / failed transaction, or a placeholder address.
+        """
+        outcomes = {}
+        if not len(agent.deployment_log):
+            return outcomes
+        for record in agent.deployment_log.records():
+            symbol = record.get('token_symbol') or record.get('symbol')
+            address = record.get('contract_address') or ''
+            if record.get('status'):
+                outcomes[symbol] = record['status']
+            elif len(set(address[2:].lower())) <= 1:
+                outcomes[symbol] = 'placeholder_address'
+            else:
+                outcomes[symbol] = None
+        return outcomes
+
+    def _outcomes(self, agent) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """
+        (marker -> time the cast completing it reached the Neynar stand-in, marker -> failure reason)
+
+        Deploys and NFTs only complete with a mined deployment record; their announcement
+        casts go out for simulated results too, so the cast alone proves nothing.
+        """
+        deployments = self._deployments(agent)
+        done, failed = {}, {}
+        for marker, symbol in self.symbols.items():
+            if symbol in deployments and deployments[symbol] is not None:
+                failed[marker] = deployments[symbol]
+        for at, _, text in list(self.social.posts):
+            lowered = text.lower()
+            for marker, (_, kind, _) in self.sent.items():
+                if marker in done or marker in failed or marker not in lowered:
+                    continue
+                if 'correction' in lowered:
+                    # An optimistic announcement whose deployment did not land
+                    failed[marker] = 'corrected'
+                # Pending casts name the token too; only the final announcement completes a deploy
+                elif COMPLETION_PHRASES[kind] in lowered and (kind not in DEPLOY_KINDS or self.symbols[marker] in deployments):
+                    done[marker] = at
+        return done, failed
+
+    def run(self) -> Dict:
+        self._configure()
+        agent = self._build_agent()
+        if not self.args.verbose:
+            # agent.py configures INFO logging on import
+            logging.getLogger().setLevel(logging.WARNING)
+        import app as dashboard
+        client = dashboard.app.test_client()
+
+        loop = asyncio.new_event_loop()
+        task = loop.create_task(agent.run_async())
+        runner = threading.Thread(target=lambda: loop.run_until_complete(asyncio.gather(task, return_exceptions=True)), daemon=True)
+        runner.start()
+
+        started = time.time()
+        interval = 60.0 / self.args.rate
+        for i in range(self.args.commands):
+            self._submit(client, i)
+            time.sleep(max(0.0, started + (i + 1) * interval - time.time()))
+        submitted = time.time()
+
+        deadline = submitted + self.args.timeout
+        done, failed = self._outcomes(agent)
+        while len(done) + len(failed) < len(self.sent) and time.time() < deadline:
+            time.sleep(0.25)
+            done, failed = self._outcomes(agent)
+
+        loop.call_soon_threadsafe(task.cancel)
+        runner.join(timeout=10)
+        return self._report(started, done, failed, agent)
+
+    def _rpc_calls(self) -> Dict[str, int]:
+        """Requests per method as served by the chain, or as counted by the agent for an external node"""
+        if self.chain:
+            return dict(self.chain.calls)
+        from metrics import REGISTRY
+        calls: Dict[str, int] = {}
+        for sample in REGISTRY.snapshot()['metrics']['openclaw_rpc_requests_total']:
+            method = sample['labels']['method']
+            calls[method] = calls.get(method, 0) + int(sample['value'])
+        return calls
+
+    def _commands(self) -> Dict[str, int]:
+        """Executed commands by type and outcome, from the agent's metrics"""
+        from metrics import REGISTRY
+        return {
+            f"{sample['labels']['type']}:{sample['labels']['outcome']}": int(sample['value'])
+            for sample in REGISTRY.snapshot()['metrics']['openclaw_commands_total']
+        }
+
+    def _report(self, started: float, done: Dict[str, float], failed: Dict[str, str], agent) -> Dict:
+        rpc_calls = self._rpc_calls()
+        latencies = [done[m] - self.sent[m][0] for m in done]
+        by_kind: Dict[str, List[float]] = {}
+        for marker, at in done.items():
+            by_kind.setdefault(self.sent[marker][1], []).append(at - self.sent[marker][0])
+        elapsed = (max(done.values()) if done else time.time()) - started
+        failures: Dict[str, int] = {}
+        for reason in failed.values():
+            failures[reason] = failures.get(reason, 0) + 1
+        return {
+            'commands': len(self.sent),
+            'completed': len(done),
+            'failed': len(failed),
+            'failures': failures,
+            'elapsed_s': round(elapsed, 2),
+            'throughput_per_min': round(len(done) / elapsed * 60, 1) if elapsed > 0 else 0.0,
+            'latency_p50_s': _round(_percentile(latencies, 50)),
+            'latency_p99_s': _round(_percentile(latencies, 99)),
+            'latency_by_type': {
+                kind: {'count': len(v), 'p50_s': _round(_percentile(v, 50)), 'p99_s': _round(_percentile(v, 99))}
+                for kind, v in sorted(by_kind.items())
+            },
+            'commands_executed': self._commands(),
+            'rpc_calls': dict(sorted(rpc_calls.items(), key=lambda kv: -kv[1])),
+            'rpc_calls_total': sum(rpc_calls.values()),
+            'social_requests': dict(self.social.requests),
+            'reputation': {'submitted': self.agent0.submitted, 'failed': self.agent0.failed},
+            'deployments_recorded': len(agent.deployment_log),
+            'workdir': self.workdir,
+        }
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
+
+def _print_report(report: Dict):
+    print("\n📊 OpenClaw load test")
+    print(
+        f"   Commands: {report['completed']}/{report['commands']} completed, {report['failed']} failed "
+        f"in {report['elapsed_s']}s"
+    )
+    if report['failures']:
+        print(f"   Failures: {report['failures']}")
+    print(f"   Throughput: {report['throughput_per_min']} commands/min")
+    print(f"   End-to-end latency: p50 {report['latency_p50_s']}s, p99 {report['latency_p99_s']}s")
+    for kind, stats in report['latency_by_type'].items():
+        print(f"     {kind:<7} n={stats['count']:<4} p50 {stats['p50_s']}s  p99 {stats['p99_s']}s")
+    print(f"   Executed: {report['commands_executed']}")
+    if report['reputation']['submitted'] or report['reputation']['failed']:
+        print(f"   Reputation proofs: {report['reputation']['submitted']} submitted, {report['reputation']['failed']} failed")
+    print(f"   RPC calls: {report['rpc_calls_total']}")
+    for method, count in report['rpc_calls'].items():
+        print(f"     {method:<28} {count}")
+    print(f"   Social requests: {report['social_requests']}")
+    print(f"   Deployment records: {report['deployments_recorded']} (state in {report['workdir']})")
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline OpenClaw load test against local stand-ins")
+    parser.add_argument('--commands', type=int, default=30, help='Commands to send')
+    parser.add_argument('--rate', type=float, default=60, help='Commands per minute')
+    parser.add_argument('--mix', default='deploy=5,post=4,nft=1', help='Command type weights')
+    parser.add_argument('--via', default='api', help="Comma-separated channels: api, mentions")
+    parser.add_argument('--queue', default='sqlite', choices=['sqlite', 'file'], help='Dashboard command queue backend')
+    parser.add_argument('--mention-poll', type=float, default=2.0, help='Seconds between Farcaster mention polls')
+    parser.add_argument('--timeout', type=float, default=120, help='Seconds to wait for completions after the last command')
+    parser.add_argument('--rpc-url', help='Use this node (e.g. anvil) instead of the built-in eth-tester chain')
+    parser.add_argument(
+        '--private-key', help='Funded key on --rpc-url (default: anvil account 0)',
+        default='0xac0974bec39a17e36ba4a6b4d7238ff944bacb478cbed5efcae784d7bf4f2ff80'
+    )
+    parser.add_argument('--rpc-latency', type=float, default=0, help='Injected RPC latency (ms)')
+    parser.add_argument('--rpc-error-rate', type=float, default=0, help='Fraction of RPC requests answered with HTTP 503')
+    parser.add_argument('--social-latency', type=float, default=0, help='Injected Neynar/X latency (ms)')
+    parser.add_argument('--social-error-rate', type=float, default=0, help='Fraction of Neynar/X requests answered with HTTP 503')
+    parser.add_argument('--agent0', action='store_true', help='Submit reputation through the Agent0 stand-in')
+    parser.add_argument('--agent0-latency', type=float, default=0, help='Injected Agent0 latency (ms)')
+    parser.add_argument('--agent0-error-rate', type=float, default=0, help='Fraction of failed Agent0 submissions')
+    parser.add_argument('--token-bytecode', help='File with ERC20 creation bytecode to deploy instead of the built-in one')
+    parser.add_argument('--token-abi', help='ABI JSON file matching --token-bytecode')
+    parser.add_argument('--json', help='Also write the report to this file')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the command mix and injected faults')
+    parser.add_argument('--verbose', action='store_true', help='Keep agent INFO logs on the console')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    report = LoadTest(args).run()
+    _print_report(report)
+    if args.json:
+        with open(os.path.join(REPO_DIR, args.json) if not os.path.isabs(args.json) else args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    if report['completed'] < report['commands']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+metrics.py - In-process metrics for OpenClaw agent
+Counters, gauges and latency histograms, published to a JSON file that app.py serves as Prometheus text
+"""
+
+import os
+import copy
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# name -> (type, help, label names)
+METRICS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    'openclaw_tx_stage_seconds': (
+        'histogram', 'Transaction pipeline latency per stage (build, sign, broadcast, batch_sign, receipt_wait)', ('stage',)
+    ),
+    'openclaw_rpc_requests_total': ('counter', 'JSON-RPC requests by method and outcome', ('method', 'outcome')),
+    'openclaw_rpc_request_seconds': ('histogram', 'JSON-RPC request latency including failover', ('method',)),
+    'openclaw_social_request_seconds': ('histogram', 'Neynar and X API request latency', ('platform', 'operation')),
+    'openclaw_social_requests_total': ('counter', 'Neynar and X API requests by HTTP status', ('platform', 'operation', 'status')),
+    'openclaw_reputation_submit_seconds': ('histogram', 'Agent0 reputation submission latency', ('outcome',)),
+    'openclaw_commands_total': ('counter', 'Commands executed by type and outcome', ('type', 'outcome')),
+    'openclaw_command_seconds': ('histogram', 'Command execution time by type', ('type',)),
+    'openclaw_queue_depth': ('gauge', 'Items waiting per queue', ('queue',)),
+    'openclaw_lane_busy': ('gauge', 'Commands running per executor lane', ('lane',)),
+    'openclaw_signer_balance_eth': ('gauge', 'ETH balance per network and deployment signer at the last rebalance', ('network', 'signer')),
+    'openclaw_signer_in_flight': ('gauge', 'Pending transactions plus assigned commands per network and deployment signer', ('network', 'signer')),
+}
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry for the metrics declared in METRICS
+
+    Gauges that are cheaper to read on demand (queue depths) come from collectors,
+    callables run at snapshot time.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._values: Dict[str, Dict[Tuple, object]] = {name: {} for name in METRICS}
+        self._collectors: List[Callable[['MetricsRegistry'], None]] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> Tuple:
+        return tuple(str(labels.get(label, '')) for label in METRICS[name][2])
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add value to a counter"""
+        key = self._key(name, labels)
+        with self._lock:
+            series = self._values[name]
+            series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        """Set a gauge"""
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[name][key] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """Record one histogram observation"""
+        key = self._key(name, labels)
+        with self._lock:
+            series = self._values[name]
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    hist['buckets'][i] += 1
+            hist['sum'] += value
+            hist['count'] += 1
+
+    @contextmanager
+    def time(self, name: str, **labels):
+        """Observe the duration of the with-block, also when it raises"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(name, time.monotonic() - started, **labels)
+
+    def add_collector(self, collector: Callable[['MetricsRegistry'], None]):
+        """Register a callable that sets gauges right before each snapshot"""
+        self._collectors.append(collector)
+
+    def snapshot(self) -> Dict:
+        """JSON-serializable copy of every series"""
+        for collector in list(self._collectors):
+            try:
+                collector(self)
+            except Exception as e:
+                logger.debug(f"Metrics collector failed: {e}")
+        with self._lock:
+            return {
+                'generated_at': time.time(),
+                'buckets': list(self.buckets),
+                'metrics': {
+                    name: [
+                        {'labels': dict(zip(METRICS[name][2], key)), 'value': copy.deepcopy(value)}
+                        for key, value in series.items()
+                    ]
+                    for name, series in self._values.items()
+                }
+            }
+
+    def write(self, path: Optional[str] = None):
+        """Publish a snapshot for the dashboard process (tmp file + rename)"""
+        path = path or os.getenv('METRICS_FILE', 'metrics.json')
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.snapshot(), f)
+        os.replace(tmp_path, path)
+
+
+def _labels(labels: Dict[str, str], extra: str = "") -> str:
+    parts = [
+        '{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for k, v in labels.items()
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def render(snapshot: Dict) -> str:
+    """Prometheus text exposition format for a snapshot"""
+    buckets = snapshot.get('buckets', LATENCY_BUCKETS)
+    lines = []
+    for name, samples in snapshot.get('metrics', {}).items():
+        kind, help_text, _ = METRICS.get(name, ('untyped', '', ()))
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for sample in samples:
+            labels, value = sample['labels'], sample['value']
+            if kind != 'histogram':
+                lines.append(f"{name}{_labels(labels)} {value}")
+                continue
+            # Bucket counts are stored cumulatively already
+            for bound, count in zip(buckets, value['buckets']):
+                le = 'le="%s"' % bound
+                lines.append(f"{name}_bucket{_labels(labels, le)} {count}")
+            le = 'le="+Inf"'
+            lines.append(f"{name}_bucket{_labels(labels, le)} {value['count']}")
+            lines.append(f"{name}_sum{_labels(labels)} {value['sum']}")
+            lines.append(f"{name}_count{_labels(labels)} {value['count']}")
+    if 'generated_at' in snapshot:
+        lines.append("# HELP openclaw_metrics_age_seconds Seconds since the agent last published metrics")
+        lines.append("# TYPE openclaw_metrics_age_seconds gauge")
+        lines.append(f"openclaw_metrics_age_seconds {time.time() - snapshot['generated_at']:.3f}")
+    return "\n".join(lines) + "\n"
+
+
+# Process-wide registry the agent modules record into
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,124 @@
+"""
+multicall.py - Multicall3 read aggregation for OpenClaw agent
+Packs many view calls into a few aggregate3 eth_calls and decodes the results in bulk
+"""
+
+import logging
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from eth_abi import decode
+from web3 import Web3
+
+logger = logging.getLogger(__name__)
+
+# Multicall3 is deployed at the same address on Base, Base Sepolia and most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# ABI-encoded size of one Call3 entry beyond its calldata: head offset, target,
+# allowFailure, bytes offset and length words
+_CALL3_OVERHEAD = 5 * 32
+
+
+def selector(signature: str) -> bytes:
+    """4-byte function selector for a signature like 'balanceOf(address)'"""
+    return Web3.keccak(text=signature)[:4]
+
+
+def decode_string(data: bytes) -> str:
+    """Decode a string return value, accepting legacy tokens that return bytes32"""
+    if len(data) == 32:
+        return data.rstrip(b"\x00").decode('utf-8', errors='replace')
+    return decode(['string'], data)[0]
+
+
+def decode_uint(data: bytes) -> int:
+    """Decode a uint256 return value"""
+    return decode(['uint256'], data)[0]
+
+
+class Multicall:
+    """Batches (target, calldata, decoder) reads into chunked Multicall3 aggregate3 calls"""
+
+    def __init__(self, w3, address: str = MULTICALL3_ADDRESS, max_calldata_bytes: int = 24_000):
+        """
+        Initialize multicall helper
+
+        Args:
+            w3: Web3 instance
+            address: Multicall3 contract address
+            max_calldata_bytes: Upper bound on the encoded calldata of one aggregate3 call
+        """
+        self.w3 = w3
+        self.contract = w3.eth.contract(address=Web3.to_checksum_address(address), abi=MULTICALL3_ABI)
+        self.max_calldata_bytes = max_calldata_bytes
+
+    def _chunks(self, calls: Sequence[Tuple[str, bytes, Callable]]) -> List[List[Tuple[str, bytes, Callable]]]:
+        """Split calls so each aggregate3 stays under max_calldata_bytes"""
+        chunks, current, size = [], [], 0
+        for call in calls:
+            call_size = _CALL3_OVERHEAD + 32 * ((len(call[1]) + 31) // 32)
+            if current and size + call_size > self.max_calldata_bytes:
+                chunks.append(current)
+                current, size = [], 0
+            current.append(call)
+            size += call_size
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def execute(self, calls: Sequence[Tuple[str, bytes, Callable[[bytes], Any]]]) -> List[Optional[Any]]:
+        """
+        Run every call through Multicall3
+
+        Args:
+            calls: (target address, calldata, decoder) tuples
+
+        Returns:
+            Decoded values in call order; None where the call reverted or failed to decode
+        """
+        results: List[Optional[Any]] = []
+        chunks = self._chunks(calls)
+        for chunk in chunks:
+            payload = [(Web3.to_checksum_address(target), True, data) for target, data, _ in chunk]
+            responses = self.contract.functions.aggregate3(payload).call()
+            for (_, _, decoder), (success, return_data) in zip(chunk, responses):
+                if not success or not return_data:
+                    results.append(None)
+                    continue
+                try:
+                    results.append(decoder(return_data))
+                except Exception:
+                    results.append(None)
+        logger.debug(f"📦 Multicall: {len(calls)} reads in {len(chunks)} eth_call(s)")
+        return results
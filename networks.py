@@ -0,0 +1,77 @@
+"""
+networks.py - Chain table for OpenClaw agent
+Known Base networks, their chain ids and explorers, and per-network RPC settings from the environment
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple, Union
+
+# network name -> chain constants; names are what commands and NETWORK refer to
+NETWORKS: Dict[str, Dict] = {
+    'base': {
+        'chain_id': 8453,
+        'label': 'Base',
+        'explorer': 'https://basescan.org',
+        'testnet': False,
+    },
+    'base-sepolia': {
+        'chain_id': 84532,
+        'label': 'Base Sepolia',
+        'explorer': 'https://sepolia.basescan.org',
+        'testnet': True,
+    },
+}
+
+# What RPC_URL points at when NETWORK is not set
+DEFAULT_NETWORK = 'base-sepolia'
+
+
+def default_network() -> str:
+    """Network of RPC_URL (NETWORK, else base-sepolia)"""
+    return resolve_network(os.getenv('NETWORK')) or DEFAULT_NETWORK
+
+
+def network_for_chain_id(chain_id: Optional[int]) -> Optional[str]:
+    """Network name for a chain id; None for chains not in NETWORKS"""
+    for name, network in NETWORKS.items():
+        if network['chain_id'] == chain_id:
+            return name
+    return None
+
+
+def resolve_network(value: Union[str, int, None]) -> Optional[str]:
+    """
+    Network name from a name ("base", "base_sepolia") or a chain id (8453, "84532")
+
+    Returns:
+        Key of NETWORKS, or None if value names no known network
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, int) or str(value).strip().isdigit():
+        return network_for_chain_id(int(value))
+    name = str(value).strip().lower().replace('_', '-')
+    return name if name in NETWORKS else None
+
+
+def explorer_tx_url(chain_id: Optional[int], tx_hash: str) -> str:
+    """Block explorer link for a transaction; unknown chains get the Base Sepolia explorer"""
+    network = NETWORKS.get(network_for_chain_id(chain_id) or DEFAULT_NETWORK)
+    return f"{network['explorer']}/tx/{tx_hash}"
+
+
+def rpc_settings(network: str) -> Optional[Tuple[str, List[str], Optional[str]]]:
+    """
+    Endpoints for an extra network from <NETWORK>_RPC_URL and <NETWORK>_WS_URL
+
+    e.g. BASE_RPC_URL=https://mainnet.base.org,https://base.llamarpc.com; the first URL
+    receives transactions, the others share reads and failover.
+
+    Returns:
+        (rpc_url, extra rpc_urls, ws_url), or None if the network has no RPC configured
+    """
+    prefix = network.upper().replace('-', '_')
+    urls = [url.strip() for url in os.getenv(f"{prefix}_RPC_URL", '').split(',') if url.strip()]
+    if not urls:
+        return None
+    return urls[0], urls[1:], os.getenv(f"{prefix}_WS_URL") or None
@@ -0,0 +1,152 @@
+"""
+nonce_manager.py - Local nonce allocation for OpenClaw agent
+Hands out sequential nonces for a sending account without an RPC round trip per transaction
+"""
+
+import logging
+import threading
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class NonceManager:
+    """
+    Thread-safe, locally tracked nonce allocator for a single sending account
+
+    Ranges reserved for batches stay outstanding until settle_range(). The node's
+    pending count does not include reserved nonces that have not been broadcast yet,
+    so while any range is outstanding a reseed is deferred instead of handing them out again.
+    """
+
+    # Node error fragments that mean our local view of the nonce is behind the chain
+    NONCE_TOO_LOW_ERRORS = (
+        "nonce too low",
+        "invalid nonce",
+    )
+
+    # The node already holds this exact signed transaction; the broadcast succeeded
+    ALREADY_KNOWN_ERRORS = (
+        "already known",
+        "known transaction",
+    )
+
+    # Another transaction with a higher fee already occupies the nonce in the mempool
+    UNDERPRICED_ERRORS = (
+        "replacement transaction underpriced",
+        "transaction underpriced",
+    )
+
+    def __init__(self, w3, address: str):
+        """
+        Initialize nonce manager
+
+        Args:
+            w3: Web3 instance used to seed and resync the nonce
+            address: Sending account address
+        """
+        self.w3 = w3
+        self.address = address
+        self._lock = threading.Lock()
+        self._next_nonce: Optional[int] = None
+        self._reserved: List[range] = []
+        self._reset_pending = False
+
+    def _fetch_pending_count(self) -> int:
+        """Read the pending transaction count for the account from the node"""
+        return self.w3.eth.get_transaction_count(self.address, 'pending')
+
+    def allocate(self) -> int:
+        """Reserve and return the next nonce, seeding from the node on first use"""
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = self._fetch_pending_count()
+                logger.info(f"🔢 Nonce manager seeded at {self._next_nonce}")
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    def allocate_range(self, count: int) -> range:
+        """Reserve a contiguous block of nonces for a batch of transactions"""
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = self._fetch_pending_count()
+                logger.info(f"🔢 Nonce manager seeded at {self._next_nonce}")
+            start = self._next_nonce
+            self._next_nonce += count
+            nonces = range(start, start + count)
+            self._reserved.append(nonces)
+            return nonces
+
+    def settle_range(self, nonces: range, sent: int):
+        """
+        Finish a reserved range once its batch is broadcast or abandoned
+
+        Args:
+            nonces: Range returned by allocate_range
+            sent: How many nonces from the start of the range were broadcast
+        """
+        with self._lock:
+            if nonces in self._reserved:
+                self._reserved.remove(nonces)
+            if sent < len(nonces):
+                if self._next_nonce == nonces.stop:
+                    # Nothing was allocated after the range: take the unsent tail back
+                    self._next_nonce = nonces.start + sent
+                else:
+                    self._reset_pending = True
+            self._apply_pending_reset()
+
+    def release(self, nonce: int):
+        """
+        Return a nonce that was never broadcast
+
+        Only the most recently allocated nonce can be handed back; if later nonces are
+        already out, the local state is dropped and reseeded from the node on next use
+        (once no reserved range is outstanding).
+        """
+        with self._lock:
+            if self._next_nonce is not None and nonce == self._next_nonce - 1:
+                self._next_nonce = nonce
+            else:
+                self._reset_pending = True
+                self._apply_pending_reset()
+
+    def _apply_pending_reset(self):
+        """Drop the local nonce if a reset was requested and no reserved range is outstanding (lock held)"""
+        if self._reset_pending and not self._reserved:
+            self._next_nonce = None
+            self._reset_pending = False
+
+    def resync(self) -> int:
+        """Re-read the pending count from the node, never moving the local nonce backwards"""
+        with self._lock:
+            chain_nonce = self._fetch_pending_count()
+            if self._next_nonce is None or chain_nonce > self._next_nonce:
+                self._next_nonce = chain_nonce
+            logger.info(f"🔄 Nonce manager resynced at {self._next_nonce}")
+            return self._next_nonce
+
+    def reset(self):
+        """Forget the local nonce so the next allocation reseeds from the node, once no reserved range is outstanding"""
+        with self._lock:
+            self._reset_pending = True
+            self._apply_pending_reset()
+
+    @classmethod
+    def is_nonce_too_low(cls, error: Exception) -> bool:
+        """Check whether a send error means the local nonce fell behind the chain"""
+        message = str(error).lower()
+        return any(fragment in message for fragment in cls.NONCE_TOO_LOW_ERRORS)
+
+    @classmethod
+    def is_already_known(cls, error: Exception) -> bool:
+        """Check whether a send error means the node already has the signed transaction"""
+        message = str(error).lower()
+        return any(fragment in message for fragment in cls.ALREADY_KNOWN_ERRORS)
+
+    @classmethod
+    def is_underpriced(cls, error: Exception) -> bool:
+        """Check whether a send error means a better-paying transaction holds the nonce"""
+        message = str(error).lower()
+        return any(fragment in message for fragment in cls.UNDERPRICED_ERRORS)
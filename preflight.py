@@ -0,0 +1,127 @@
+"""
+preflight.py - Pre-broadcast simulation and gas sizing for OpenClaw agent
+Simulates every contract creation before signing and caches the gas limit per bytecode and argument shape
+"""
+
+import logging
+import math
+import threading
+from typing import Dict, Sequence, Tuple
+
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+
+logger = logging.getLogger(__name__)
+
+
+class PreflightError(Exception):
+    """Raised when a transaction reverts in simulation, so it is never broadcast"""
+
+
+# Node error fragments for a call that executed and failed, as opposed to a transport problem
+REVERT_ERRORS = (
+    "execution reverted",
+    "revert",
+    "invalid opcode",
+    "out of gas",
+    "gas required exceeds",
+)
+
+
+def is_revert(error: Exception) -> bool:
+    """Check whether a simulation error is an execution failure rather than a timeout, 429 or dropped connection"""
+    if isinstance(error, ContractLogicError):
+        return True
+    payload = error.args[0] if error.args else None
+    if isinstance(payload, dict):
+        if payload.get('data') not in (None, '0x', ''):
+            return True
+        message = str(payload.get('message', ''))
+    else:
+        message = str(error)
+    return any(fragment in message.lower() for fragment in REVERT_ERRORS)
+
+
+class GasEstimateCache:
+    """
+    Caches simulated gas limits keyed by (bytecode hash, constructor argument shape)
+
+    Only the gas number is cached. Every call is still simulated, because a constructor
+    can revert for particular argument values even when the same shape passed before.
+    A cache hit runs one eth_call in place of eth_estimateGas's repeated executions.
+    """
+
+    def __init__(self, margin: float = 1.2):
+        """
+        Initialize gas estimate cache
+
+        Args:
+            margin: Multiplier applied to the simulated gas to absorb per-value differences
+        """
+        self.margin = margin
+        self._limits: Dict[Tuple, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def shape_key(bytecode: str, args: Sequence) -> Tuple:
+        """
+        Cache key for a constructor call
+
+        Strings and bytes only matter by the number of 32-byte words they encode to;
+        fixed-size values always occupy one word.
+        """
+        shape = []
+        for arg in args:
+            if isinstance(arg, str):
+                shape.append(math.ceil(len(arg.encode('utf-8')) / 32))
+            elif isinstance(arg, (bytes, bytearray)):
+                shape.append(math.ceil(len(arg) / 32))
+            else:
+                shape.append('word')
+        return (Web3.keccak(hexstr=bytecode).hex(), tuple(shape))
+
+    def gas_limit(self, key: Tuple, w3, tx: Dict) -> int:
+        """
+        Simulate tx and return its gas limit, estimating gas only on a cache miss
+
+        Args:
+            key: Result of shape_key
+            w3: Web3 instance to simulate against
+            tx: Call to simulate ('from' and 'data', plus 'to'/'value' if any)
+
+        Returns:
+            Simulated gas times the safety margin
+
+        Raises:
+            PreflightError: If the call reverts; transport errors propagate unchanged
+        """
+        with self._lock:
+            limit = self._limits.get(key)
+            if limit is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        try:
+            if limit is not None:
+                # Revert check only; the gas figure for this shape is already known
+                w3.eth.call(tx)
+                return limit
+            estimate = w3.eth.estimate_gas(tx)
+        except Exception as e:
+            if is_revert(e):
+                raise PreflightError(f"Simulation reverted: {e}") from e
+            raise
+
+        limit = int(estimate * self.margin)
+        with self._lock:
+            self._limits[key] = limit
+        logger.info(f"🧪 Preflight passed: {estimate} gas simulated, limit {limit}")
+        return limit
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._limits)}
@@ -0,0 +1,193 @@
+"""
+rpc_pool.py - Multi-endpoint JSON-RPC provider for OpenClaw agent
+Routes reads to the fastest healthy node, sends writes to a designated node and fails over on errors
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3.providers.base import JSONBaseProvider
+
+from metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+
+class RPCEndpoint:
+    """One RPC URL with a keep-alive session and EWMA latency / error-rate tracking"""
+
+    def __init__(self, url: str, alpha: float = 0.3, pool_size: int = 10):
+        self.url = url
+        self.alpha = alpha
+        self.session = requests.Session()
+        self.session.mount(url, HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+
+    def healthy(self, now: float) -> bool:
+        """Whether the endpoint is outside its failure cooldown"""
+        return now >= self.cooldown_until
+
+    def score(self) -> float:
+        """Routing score (lower is better); unmeasured endpoints go first so they get probed"""
+        if self.latency is None:
+            return 0.0
+        return self.latency * (1 + 10 * self.error_rate)
+
+    def record_success(self, latency: float):
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.latency = latency if self.latency is None else self.alpha * latency + (1 - self.alpha) * self.latency
+        self.error_rate = (1 - self.alpha) * self.error_rate
+
+    def record_failure(self, cooldown: float, max_failures: int):
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.error_rate = self.alpha + (1 - self.alpha) * self.error_rate
+        if self.consecutive_failures >= max_failures:
+            self.cooldown_until = time.monotonic() + cooldown
+            logger.warning(f"🚫 RPC endpoint {self.url} benched for {cooldown}s after {self.consecutive_failures} failures")
+
+
+class PooledHTTPProvider(JSONBaseProvider):
+    """web3 provider spreading requests over several HTTP RPC endpoints"""
+
+    # Methods that must reach the designated write endpoint first
+    WRITE_METHODS = {'eth_sendRawTransaction', 'eth_sendTransaction'}
+
+    # JSON-RPC error codes that mean "try another node" rather than a real result
+    RETRYABLE_ERROR_CODES = {-32005, 429}
+
+    def __init__(
+        self,
+        urls: List[str],
+        write_url: Optional[str] = None,
+        request_timeout: float = 10,
+        cooldown: float = 30,
+        max_failures: int = 2
+    ):
+        """
+        Initialize pooled provider
+
+        Args:
+            urls: RPC URLs to route between
+            write_url: Endpoint that receives transactions first (default: first URL)
+            request_timeout: Per-request timeout in seconds
+            cooldown: Seconds an endpoint is skipped after repeated failures
+            max_failures: Consecutive failures before an endpoint is benched
+        """
+        super().__init__()
+        if not urls:
+            raise ValueError("At least one RPC URL is required")
+
+        self.endpoints = [RPCEndpoint(url) for url in urls]
+        self.write_url = write_url or urls[0]
+        self.request_timeout = request_timeout
+        self.cooldown = cooldown
+        self.max_failures = max_failures
+        self._lock = threading.Lock()
+
+    @property
+    def endpoint_uri(self) -> str:
+        """Designated write endpoint, for code that needs a single URL"""
+        return self.write_url
+
+    def __str__(self) -> str:
+        return f"Pooled RPC connection {[e.url for e in self.endpoints]}"
+
+    def _candidates(self, write: bool) -> List[RPCEndpoint]:
+        """Endpoints in the order they should be tried"""
+        now = time.monotonic()
+        with self._lock:
+            healthy = [e for e in self.endpoints if e.healthy(now)]
+            benched = [e for e in self.endpoints if not e.healthy(now)]
+            ordered = sorted(healthy, key=lambda e: e.score()) + sorted(benched, key=lambda e: e.cooldown_until)
+            if write:
+                ordered.sort(key=lambda e: e.url != self.write_url)
+            return ordered
+
+    def _post(self, endpoint: RPCEndpoint, body: bytes) -> requests.Response:
+        """POST one request body to an endpoint and record its latency"""
+        started = time.monotonic()
+        response = endpoint.session.post(
+            endpoint.url,
+            data=body,
+            headers={'Content-Type': 'application/json'},
+            timeout=self.request_timeout
+        )
+        if response.status_code == 429 or response.status_code >= 500:
+            raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+        response.raise_for_status()
+        with self._lock:
+            endpoint.record_success(time.monotonic() - started)
+        return response
+
+    def _send(self, body: bytes, write: bool, label: str):
+        """Send body to the best endpoint, failing over until one answers"""
+        last_error = None
+        for endpoint in self._candidates(write):
+            try:
+                response = self._post(endpoint, body)
+                decoded = self.decode_rpc_response(response.content)
+                error = decoded.get('error') if isinstance(decoded, dict) else None
+                if error and error.get('code') in self.RETRYABLE_ERROR_CODES:
+                    raise requests.HTTPError(f"Rate limited: {error.get('message')}")
+                return decoded
+            except (requests.RequestException, ValueError) as e:
+                last_error = e
+                with self._lock:
+                    endpoint.record_failure(self.cooldown, self.max_failures)
+                logger.warning(f"⚠️ RPC {label} failed on {endpoint.url}: {e}. Failing over...")
+        raise ConnectionError(f"All RPC endpoints failed for {label}: {last_error}")
+
+    def make_request(self, method, params: Any):
+        """Route one JSON-RPC request; writes go to the write endpoint first"""
+        body = self.encode_rpc_request(method, params)
+        outcome = 'failed'
+        try:
+            with REGISTRY.time('openclaw_rpc_request_seconds', method=method):
+                response = self._send(body, method in self.WRITE_METHODS, method)
+            outcome = 'error' if response.get('error') else 'ok'
+            return response
+        finally:
+            REGISTRY.inc('openclaw_rpc_requests_total', method=method, outcome=outcome)
+
+    def make_batch_request(self, payload: List[Dict]) -> List[Dict]:
+        """Send a raw JSON-RPC batch (list of request objects) to the fastest healthy endpoint"""
+        outcome = 'failed'
+        try:
+            with REGISTRY.time('openclaw_rpc_request_seconds', method='batch'):
+                response = self._send(json.dumps(payload).encode('utf-8'), False, f"batch of {len(payload)}")
+            outcome = 'batched'
+            return response
+        finally:
+            for item in payload:
+                REGISTRY.inc('openclaw_rpc_requests_total', method=item.get('method'), outcome=outcome)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-endpoint latency, error rate and health"""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    'url': e.url,
+                    'latency_ms': round(e.latency * 1000, 1) if e.latency is not None else None,
+                    'error_rate': round(e.error_rate, 3),
+                    'requests': e.requests,
+                    'failures': e.failures,
+                    'healthy': e.healthy(now),
+                    'write': e.url == self.write_url
+                }
+                for e in self.endpoints
+            ]
@@ -0,0 +1,183 @@
+"""
+signer_pool.py - Deployment signer sharding for OpenClaw agent
+Several funded accounts with their own nonce sequences, assigned by load and topped up from a treasury
+"""
+
+import os
+import logging
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SignerPool:
+    """
+    Deploying accounts that share one chain connection
+
+    Each signer is a BlockchainManager from with_signer(): own nonces, send lock and
+    replacement supervision, shared RPC pool, caches and receipt tracker. Commands go to
+    the funded signer with the least work (transactions in flight plus commands assigned
+    and not yet finished), so independent deploys are signed and broadcast in parallel.
+    rebalance() refreshes balances and tops up signers below min_balance from the treasury.
+    """
+
+    def __init__(
+        self,
+        primary,
+        keys: Optional[List[str]] = None,
+        treasury_key: Optional[str] = None,
+        min_balance: Optional[float] = None,
+        top_up: Optional[float] = None
+    ):
+        """
+        Initialize signer pool
+
+        Args:
+            primary: BlockchainManager for PRIVATE_KEY; always a member of the pool
+            keys: Extra signer private keys (default: SIGNER_KEYS, comma-separated)
+            treasury_key: Account that funds top-ups (default: TREASURY_PRIVATE_KEY, else the primary)
+            min_balance: ETH below which a signer is skipped and topped up (default: SIGNER_MIN_BALANCE or 0.002)
+            top_up: ETH sent per top-up (default: SIGNER_TOP_UP or 0.01)
+        """
+        if keys is None:
+            keys = [key.strip() for key in os.getenv('SIGNER_KEYS', '').split(',') if key.strip()]
+        treasury_key = treasury_key or os.getenv('TREASURY_PRIVATE_KEY')
+        self.min_balance = min_balance if min_balance is not None else float(os.getenv('SIGNER_MIN_BALANCE', '0.002'))
+        self.top_up = top_up if top_up is not None else float(os.getenv('SIGNER_TOP_UP', '0.01'))
+
+        self.primary = primary
+        self.signers: Dict[str, object] = {primary.address: primary}
+        for key in keys:
+            manager = primary.with_signer(key)
+            self.signers.setdefault(manager.address, manager)
+        self.treasury = primary.with_signer(treasury_key) if treasury_key else primary
+        if self.treasury.address in self.signers:
+            self.treasury = self.signers[self.treasury.address]
+
+        self._lock = threading.Lock()
+        # Unknown balances count as funded until the first refresh
+        self._balances: Dict[str, Optional[float]] = {address: None for address in self.signers}
+        self._assigned = {address: 0 for address in self.signers}
+        self._completed = {address: 0 for address in self.signers}
+        self._failed = {address: 0 for address in self.signers}
+        self._top_ups = {address: 0 for address in self.signers}
+        self._topping_up: Dict[str, str] = {}
+
+        if len(self.signers) > 1:
+            logger.info(f"🔑 Signer pool: {len(self.signers)} accounts, treasury {self.treasury.address}")
+
+    def __len__(self) -> int:
+        return len(self.signers)
+
+    def manager(self, address: Optional[str] = None):
+        """BlockchainManager for a signer address; the primary for None or an unknown address"""
+        return self.signers.get(address, self.primary) if address else self.primary
+
+    def _load(self, address: str) -> int:
+        return self._assigned[address] + self.signers[address].supervisor.pending_count()
+
+    def _funded(self, address: str) -> bool:
+        balance = self._balances[address]
+        return balance is None or balance >= self.min_balance
+
+    def acquire(self):
+        """
+        Assign work to the least-loaded funded signer (all signers if none is funded)
+
+        Returns:
+            The signer's BlockchainManager; pass its address to release() when the work is done
+        """
+        with self._lock:
+            candidates = [address for address in self.signers if self._funded(address)] or list(self.signers)
+            address = min(candidates, key=self._load)
+            self._assigned[address] += 1
+        return self.signers[address]
+
+    def release(self, address: str, succeeded: Optional[bool] = True):
+        """Finish work assigned by acquire(); succeeded=None returns an assignment that was never used"""
+        with self._lock:
+            if address not in self._assigned:
+                return
+            self._assigned[address] = max(0, self._assigned[address] - 1)
+            if succeeded:
+                self._completed[address] += 1
+            elif succeeded is not None:
+                self._failed[address] += 1
+
+    def refresh_balances(self):
+        """Read every signer's balance from the node"""
+        cache = self.primary.cache
+        for address in self.signers:
+            try:
+                cache.invalidate_balance(address)
+                balance = float(self.primary.w3.from_wei(cache.balance(address), 'ether'))
+            except Exception as e:
+                logger.warning(f"⚠️ Could not read balance of signer {address}: {e}")
+                continue
+            with self._lock:
+                self._balances[address] = balance
+
+    def rebalance(self) -> int:
+        """
+        Refresh balances and top up signers below min_balance from the treasury
+
+        A signer gets at most one top-up in flight; the treasury keeps min_balance for itself.
+
+        Returns:
+            Number of top-up transactions sent
+        """
+        self.refresh_balances()
+        treasury_balance = float(self.treasury.w3.from_wei(self.treasury.cache.balance(self.treasury.address), 'ether'))
+        sent = 0
+        for address in self.signers:
+            with self._lock:
+                balance = self._balances[address]
+                if address == self.treasury.address or balance is None or balance >= self.min_balance:
+                    continue
+                if address in self._topping_up:
+                    continue
+            if treasury_balance - self.top_up < self.min_balance:
+                logger.warning(
+                    f"⚠️ Treasury {self.treasury.address} has {treasury_balance:.5f} ETH, "
+                    f"not enough to top up {address} ({balance:.5f} ETH)"
+                )
+                break
+            try:
+                tx_hash = self.treasury.transfer_eth(address, self.top_up)
+            except Exception as e:
+                logger.error(f"❌ Top-up of signer {address} failed: {e}")
+                continue
+            logger.info(f"⛽ Topping up signer {address} ({balance:.5f} ETH) with {self.top_up} ETH: {tx_hash.hex()}")
+            treasury_balance -= self.top_up
+            sent += 1
+            with self._lock:
+                self._topping_up[address] = tx_hash.hex()
+                self._top_ups[address] += 1
+            self.treasury.supervisor.track(tx_hash).add_done_callback(
+                lambda _, address=address: self._top_up_done(address)
+            )
+        return sent
+
+    def _top_up_done(self, address: str):
+        with self._lock:
+            self._topping_up.pop(address, None)
+        self.primary.cache.invalidate_balance(address)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-signer balance, load and counters"""
+        with self._lock:
+            return {
+                address: {
+                    'balance_eth': self._balances[address],
+                    'funded': self._funded(address),
+                    'in_flight': manager.supervisor.pending_count(),
+                    'assigned': self._assigned[address],
+                    'completed': self._completed[address],
+                    'failed': self._failed[address],
+                    'top_ups': self._top_ups[address],
+                    'topping_up': address in self._topping_up,
+                    'treasury': address == self.treasury.address,
+                }
+                for address, manager in self.signers.items()
+            }
@@ -5,10 +5,13 @@ Handles posting updates to Farcaster and X (Twitter)
 
 import os
 import logging
+import time
 import requests
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 import json
 
+from metrics import REGISTRY
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -47,6 +50,10 @@ class SocialMediaManager:
         self.x_access_token = x_access_token or os.getenv('X_ACCESS_TOKEN')
         self.x_access_secret = x_access_secret or os.getenv('X_ACCESS_SECRET')
         
+        # API base URLs, overridable to point at local stand-ins (see loadtest.py)
+        self.neynar_api_url = os.getenv('NEYNAR_API_URL', 'https://api.neynar.com').rstrip('/')
+        self.x_api_url = os.getenv('X_API_URL', 'https://api.twitter.com').rstrip('/')
+        
         logger.info("🔗 Social Media Manager initialized")
         if self.farcaster_api_key:
             logger.info("✅ Farcaster API key configured")
@@ -58,6 +65,19 @@ class SocialMediaManager:
         else:
             logger.warning("⚠️ X (Twitter) credentials not fully configured")
             
+    @staticmethod
+    def _request(platform: str, operation: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """Run an API request, recording its latency and HTTP status"""
+        started = time.monotonic()
+        status = 'exception'
+        try:
+            response = send()
+            status = str(response.status_code)
+            return response
+        finally:
+            REGISTRY.observe('openclaw_social_request_seconds', time.monotonic() - started, platform=platform, operation=operation)
+            REGISTRY.inc('openclaw_social_requests_total', platform=platform, operation=operation, status=status)
+
     def generate_ai_image(self, prompt: str) -> str:
         """
         Generates a dynamic AI image URL based on the prompt.
@@ -71,9 +91,15 @@ class SocialMediaManager:
         logger.info(f"🎨 Generated AI Image URL: {image_url}")
         return image_url
     
-    def post_to_farcaster(self, message: str, image_url: Optional[str] = None) -> Dict[str, any]:
+    def post_to_farcaster(
+        self,
+        message: str,
+        image_url: Optional[str] = None,
+        parent_hash: Optional[str] = None
+    ) -> Dict[str, any]:
         """
-        Post a message to Farcaster using Neynar API with optional image
+        Post a message to Farcaster using Neynar API with optional image,
+        as a reply when parent_hash is given
         """
         try:
             if not self.farcaster_api_key:
@@ -82,7 +108,7 @@ class SocialMediaManager:
             
             logger.info(f"📤 Posting to Farcaster: {message[:30]}...")
             
-            url = "https://api.neynar.com/v2/farcaster/cast"
+            url = f"{self.neynar_api_url}/v2/farcaster/cast"
             headers = {
                 "accept": "application/json",
                 "api_key": self.farcaster_api_key,
@@ -97,7 +123,10 @@ class SocialMediaManager:
             if image_url:
                 payload["embeds"] = [{"url": image_url}]
             
-            response = requests.post(url, json=payload, headers=headers)
+            if parent_hash:
+                payload["parent"] = parent_hash
+            
+            response = self._request('farcaster', 'post', lambda: requests.post(url, json=payload, headers=headers))
             
             if response.status_code == 200:
                 data = response.json()
@@ -120,13 +149,13 @@ class SocialMediaManager:
             if not self.farcaster_api_key:
                 return []
             
-            url = f"https://api.neynar.com/v2/farcaster/feed/user/casts?fid={fid}&limit={limit}"
+            url = f"{self.neynar_api_url}/v2/farcaster/feed/user/casts?fid={fid}&limit={limit}"
             headers = {
                 "accept": "application/json",
                 "api_key": self.farcaster_api_key
             }
             
-            response = requests.get(url, headers=headers)
+            response = self._request('farcaster', 'casts', lambda: requests.get(url, headers=headers))
             if response.status_code == 200:
                 return response.json().get('casts', [])
             return []
@@ -143,13 +172,13 @@ class SocialMediaManager:
                 return []
             
             # Neynar mentions endpoint
-            url = f"https://api.neynar.com/v2/farcaster/notifications?fid={fid}&limit={limit}&type=mentions"
+            url = f"{self.neynar_api_url}/v2/farcaster/notifications?fid={fid}&limit={limit}&type=mentions"
             headers = {
                 "accept": "application/json",
                 "api_key": self.farcaster_api_key
             }
             
-            response = requests.get(url, headers=headers)
+            response = self._request('farcaster', 'mentions', lambda: requests.get(url, headers=headers))
             if response.status_code == 200:
                 # notifications -> notification -> cast
                 notifs = response.json().get('notifications', [])
@@ -190,11 +219,11 @@ class SocialMediaManager:
                 )
                 
                 # X API v2 endpoint
-                url = "https://api.twitter.com/2/tweets"
+                url = f"{self.x_api_url}/2/tweets"
                 
                 payload = {"text": message}
                 
-                response = oauth.post(url, json=payload)
+                response = self._request('x', 'post', lambda: oauth.post(url, json=payload))
                 
                 if response.status_code == 201:
                     data = response.json()
@@ -0,0 +1,235 @@
+"""
+social_outbox.py - Persistent announcement outbox for OpenClaw agent
+Deploy paths enqueue casts; a background worker posts them with retries and backoff
+"""
+
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    cast_hash TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+"""
+
+
+class SocialOutbox:
+    """
+    Farcaster posts queued in SQLite and sent by a background thread
+
+    Jobs move pending -> sent (or skipped without an API key) and are retried with
+    exponential backoff and jitter on errors, until max_attempts marks them dead. A
+    job may reply to an earlier job; it waits until that one is sent so the parent
+    cast hash is known.
+    """
+
+    def __init__(
+        self,
+        social,
+        path: str = "outbox.db",
+        max_attempts: int = 8,
+        base_delay: float = 5.0,
+        max_delay: float = 600.0,
+        poll_interval: float = 5.0
+    ):
+        """
+        Initialize social outbox
+
+        Args:
+            social: SocialMediaManager used to build image URLs and post
+            path: SQLite database file
+            max_attempts: Posting attempts before a job is given up
+            base_delay: Seconds before the first retry, doubled per attempt
+            max_delay: Cap for the retry delay
+            poll_interval: Seconds between checks for due retries while jobs are pending
+        """
+        self.social = social
+        self.path = path
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+
+        self._db = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def enqueue(
+        self,
+        message: str,
+        image_url: Optional[str] = None,
+        image_prompt: Optional[str] = None,
+        parent_hash: Optional[str] = None,
+        parent_job: Optional[int] = None
+    ) -> int:
+        """
+        Queue a cast
+
+        Args:
+            message: Cast text
+            image_url: Embed URL
+            image_prompt: Prompt for an AI image, turned into an embed URL when the job is sent
+            parent_hash: Cast to reply to
+            parent_job: Outbox job to reply to, once it has been sent
+
+        Returns:
+            Job id
+        """
+        payload = {
+            'message': message,
+            'image_url': image_url,
+            'image_prompt': image_prompt,
+            'parent_hash': parent_hash,
+            'parent_job': parent_job
+        }
+        now = time.time()
+        with self._lock:
+            job_id = self._db.execute(
+                "INSERT INTO outbox (payload, next_attempt_at, created_at) VALUES (?, ?, ?)",
+                (json.dumps(payload), now, now)
+            ).lastrowid
+        self._ensure_running()
+        self._wakeup.set()
+        return job_id
+
+    def job(self, job_id: int) -> Optional[Dict]:
+        """Status, attempts, cast hash and error of a job"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, status, attempts, cast_hash, error FROM outbox WHERE id = ?", (job_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def pending_count(self) -> int:
+        """Jobs not yet sent or given up"""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM outbox WHERE status = 'pending'").fetchone()[0]
+
+    def _ensure_running(self):
+        """Start the sender thread on first use"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="social-outbox", daemon=True)
+            self._thread.start()
+
+    def start(self):
+        """Start sending jobs left over from a previous run"""
+        if self.pending_count():
+            self._ensure_running()
+
+    def stop(self):
+        """Stop the sender thread"""
+        self._stopped.set()
+        self._wakeup.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            if self.pending_count() == 0:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            try:
+                self.drain_once()
+            except Exception as e:
+                logger.warning(f"⚠️ Outbox drain failed: {e}")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def drain_once(self) -> int:
+        """
+        Send every due job, oldest first
+
+        Returns:
+            Number of jobs sent
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, payload, attempts FROM outbox WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY id",
+                (time.time(),)
+            ).fetchall()
+        sent = 0
+        for row in rows:
+            if self._stopped.is_set():
+                break
+            sent += self._send(row['id'], json.loads(row['payload']), row['attempts'])
+        return sent
+
+    def _send(self, job_id: int, payload: Dict, attempts: int) -> int:
+        parent_hash = payload.get('parent_hash')
+        if payload.get('parent_job'):
+            parent = self.job(payload['parent_job'])
+            if parent and parent['status'] == 'pending':
+                self._defer(job_id, self.base_delay)
+                return 0
+            # A parent that was never posted leaves this as a top-level cast
+            parent_hash = parent_hash or (parent or {}).get('cast_hash')
+
+        image_url = payload.get('image_url')
+        if not image_url and payload.get('image_prompt'):
+            image_url = self.social.generate_ai_image(payload['image_prompt'])
+
+        result = self.social.post_to_farcaster(payload['message'], image_url=image_url, parent_hash=parent_hash)
+        attempts += 1
+        if result.get('status') in ('success', 'skipped'):
+            cast = (result.get('response') or {}).get('cast') or {}
+            with self._lock:
+                self._db.execute(
+                    "UPDATE outbox SET status = ?, attempts = ?, cast_hash = ?, error = NULL WHERE id = ?",
+                    ('sent' if result['status'] == 'success' else 'skipped', attempts, cast.get('hash'), job_id)
+                )
+            return 1
+
+        error = str(result.get('error', 'unknown error'))[:500]
+        if attempts >= self.max_attempts:
+            logger.error(f"❌ Giving up on outbox job {job_id} after {attempts} attempts: {error}")
+            with self._lock:
+                self._db.execute(
+                    "UPDATE outbox SET status = 'dead', attempts = ?, error = ? WHERE id = ?", (attempts, error, job_id)
+                )
+            return 0
+
+        delay = min(self.base_delay * 2 ** (attempts - 1), self.max_delay) * random.uniform(0.8, 1.2)
+        logger.warning(f"⚠️ Outbox job {job_id} failed (attempt {attempts}), retrying in {delay:.0f}s")
+        with self._lock:
+            self._db.execute(
+                "UPDATE outbox SET attempts = ?, error = ?, next_attempt_at = ? WHERE id = ?",
+                (attempts, error, time.time() + delay, job_id)
+            )
+        return 0
+
+    def _defer(self, job_id: int, delay: float):
+        with self._lock:
+            self._db.execute("UPDATE outbox SET next_attempt_at = ? WHERE id = ?", (time.time() + delay, job_id))
+
+    def flush(self, timeout: float = 60.0) -> bool:
+        """
+        Wait until the sender thread has no pending jobs left or timeout passes
+
+        Returns:
+            True if the outbox is empty
+        """
+        self.start()
+        deadline = time.time() + timeout
+        while self.pending_count() and time.time() < deadline:
+            time.sleep(0.2)
+        return self.pending_count() == 0
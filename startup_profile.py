@@ -0,0 +1,168 @@
+"""
+startup_profile.py - Cold start profiling for OpenClaw agent
+Import-time and init-time breakdown printed with --startup-profile
+"""
+
+import sys
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _TimedLoader:
+    """Wraps a module's loader for the duration of exec_module to time it"""
+
+    def __init__(self, loader, finder: '_ImportTimer'):
+        self._loader = loader
+        self._finder = finder
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Put the real loader back first, so module code and later reloads see it
+        module.__loader__ = module.__spec__.loader = self._loader
+        self._finder.enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._finder.leave(module.__name__)
+
+
+class _ImportTimer(MetaPathFinder):
+    """
+    Meta path finder that times every module executed after it was installed
+
+    Same numbers as python -X importtime: cumulative time includes the module's own
+    imports, self time excludes them.
+    """
+
+    def __init__(self):
+        self.records: List[Tuple[str, int, float, float]] = []  # (name, depth, cumulative, self)
+        self._local = threading.local()
+
+    def _stack(self) -> List[List]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, 'finding', False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                        spec.loader = _TimedLoader(spec.loader, self)
+                    return spec
+            return None
+        finally:
+            self._local.finding = False
+
+    def enter(self, name: str):
+        self._stack().append([name, time.perf_counter(), 0.0])
+
+    def leave(self, name: str):
+        stack = self._stack()
+        _, started, children = stack.pop()
+        cumulative = time.perf_counter() - started
+        if stack:
+            stack[-1][2] += cumulative
+        self.records.append((name, len(stack), cumulative, cumulative - children))
+
+
+class StartupProfile:
+    """
+    Startup timeline: named init phases plus, once enabled, every import
+
+    Phases are cheap no-ops until enable() is called, so the agent can mark them
+    unconditionally.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float, float]] = []  # (name, offset from start, duration)
+        self._imports: Optional[_ImportTimer] = None
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """
+        Start profiling
+
+        Time since this module was imported (normally the top of agent.py) is recorded as
+        one phase; imports after this point are timed per module.
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        self.add_phase("imports before profiling started", self.started, time.perf_counter() - self.started)
+        self._imports = _ImportTimer()
+        sys.meta_path.insert(0, self._imports)
+
+    def add_phase(self, name: str, started: float, duration: float):
+        """Record a phase measured elsewhere"""
+        if self.enabled:
+            with self._lock:
+                self.phases.append((name, started - self.started, duration))
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the with-block as a named phase"""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, started, time.perf_counter() - started)
+
+    def report(self, title: str = "Startup profile", top: int = 12) -> str:
+        """Phase timeline, the slowest top-level imports and the slowest modules by self time"""
+        elapsed = (time.perf_counter() - self.started) * 1000
+        lines = [f"⏱️  {title}: {elapsed:.0f} ms since start"]
+        with self._lock:
+            phases = list(self.phases)
+        if phases:
+            lines.append("   Init phases (offset, duration):")
+            for name, offset, duration in sorted(phases, key=lambda p: p[1]):
+                lines.append(f"     +{offset * 1000:7.0f} ms  {duration * 1000:8.1f} ms  {name}")
+
+        records = list(self._imports.records) if self._imports else []
+        if records:
+            top_level: Dict[str, float] = {}
+            for name, depth, cumulative, _ in records:
+                if depth == 0:
+                    top_level[name] = top_level.get(name, 0.0) + cumulative
+            total = sum(top_level.values())
+            lines.append(f"   Imports after profiling started: {len(records)} modules, {total * 1000:.0f} ms")
+            for name, cumulative in sorted(top_level.items(), key=lambda kv: -kv[1])[:top]:
+                lines.append(f"     {cumulative * 1000:8.1f} ms  {name}")
+            lines.append("   Slowest modules by self time:")
+            for name, _, _, own in sorted(records, key=lambda r: -r[3])[:top]:
+                lines.append(f"     {own * 1000:8.1f} ms  {name}")
+        return "\n".join(lines)
+
+    def log_report(self, title: str = "Startup profile"):
+        """Write the report to the log if profiling is enabled"""
+        if self.enabled:
+            for line in self.report(title).splitlines():
+                logger.info(line)
+
+
+# Process-wide profile the agent marks its startup phases in
+PROFILE = StartupProfile()
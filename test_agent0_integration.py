@@ -0,0 +1,76 @@
+"""
+test_agent0_integration.py - Agent0 SDK calls go through the caller's pooled provider
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("agent0_sdk")
+pytest.importorskip("eth_tester")
+
+from eth_account import Account
+from web3 import Web3
+
+from agent0_integration import Agent0Integration
+from loadtest import ChainStandIn, Faults
+from rpc_pool import PooledHTTPProvider
+
+
+class RecordingProvider(PooledHTTPProvider):
+    """Pooled provider that remembers every method sent through it"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.methods = []
+
+    def make_request(self, method, params):
+        self.methods.append(method)
+        return super().make_request(method, params)
+
+
+@pytest.fixture
+def chain():
+    stand_in = ChainStandIn(Faults()).start()
+    yield stand_in
+    stand_in.stop()
+
+
+def first_view_call(contract):
+    """Call any argument-less view function of contract"""
+    for item in contract.abi:
+        if item.get('type') == 'function' and item.get('stateMutability') == 'view' and not item.get('inputs'):
+            try:
+                getattr(contract.functions, item['name'])().call()
+            except Exception:
+                pass  # No registry deployed on the stand-in; only the routing matters
+            return
+    pytest.skip("registry ABI has no argument-less view function")
+
+
+def test_registry_calls_use_the_shared_provider(chain, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    provider = RecordingProvider([chain.url])
+    w3 = Web3(provider)
+    integration = Agent0Integration(w3, Account.from_key(chain.private_key), chain_id=84532)
+
+    sdk = integration.sdk
+    assert sdk.web3_client.w3 is w3
+    assert sdk.feedback_manager.reputation_registry.w3.provider is provider
+    assert sdk.feedback_manager.identity_registry.w3.provider is provider
+
+    provider.methods.clear()
+    first_view_call(sdk.feedback_manager.reputation_registry)
+    assert 'eth_call' in provider.methods
+
+
+def test_unknown_sdk_layout_keeps_its_own_provider(caplog):
+    own_w3 = object()
+    sdk = SimpleNamespace(web3_client=SimpleNamespace(w3=own_w3), feedback_manager=SimpleNamespace())
+    integration = Agent0Integration.__new__(Agent0Integration)
+    integration.w3 = Web3(RecordingProvider(["http://127.0.0.1:1"]))
+
+    integration._share_provider(sdk)
+
+    assert sdk.web3_client.w3 is own_w3
+    assert "keeps its own RPC provider" in caplog.text
@@ -0,0 +1,26 @@
+"""
+test_app.py - Dashboard API and its command queue
+"""
+
+import sys
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+
+def test_import_has_no_side_effects_and_first_command_opens_the_queue(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('COMMAND_QUEUE', 'sqlite')
+    monkeypatch.delenv('COMMANDS_DB', raising=False)
+    monkeypatch.delitem(sys.modules, 'app', raising=False)
+    import app as dashboard
+
+    assert not (tmp_path / "commands.db").exists()
+
+    response = dashboard.app.test_client().post('/api/command', json={'type': 'post', 'params': {'text': 'gm'}})
+
+    assert response.status_code == 200
+    assert (tmp_path / "commands.db").exists()
+    assert [cmd['params'] for cmd in dashboard.command_queue().claim(5)] == [{'text': 'gm'}]
@@ -0,0 +1,102 @@
+"""
+test_cast_cursor.py - Watermarks, bounded LRU dedupe and persistence of the Farcaster cast cursor
+"""
+
+import time
+
+from cast_cursor import CastCursor
+
+
+def cast(number, timestamp="2026-01-01T12:00:00.000Z"):
+    return {'hash': "0x%040x" % number, 'timestamp': timestamp}
+
+
+def resumed(path, **kwargs):
+    """Cursor resuming from an existing (empty) state file, so no start-time floor applies"""
+    path.write_text("{}")
+    return CastCursor(str(path), **kwargs)
+
+
+def test_marked_casts_are_not_new(tmp_path):
+    cursor = resumed(tmp_path / "cursor.json")
+    cursor.mark('mentions', cast(1))
+
+    assert not cursor.is_new('mentions', cast(1))
+    # Digests are shared across sources: a cast is handled once
+    assert not cursor.is_new('profile', cast(1))
+    assert cursor.is_new('mentions', cast(2))
+    assert not cursor.is_new('mentions', {'text': "no hash"})
+
+
+def test_watermark_skips_casts_older_than_the_grace_window(tmp_path):
+    cursor = resumed(tmp_path / "cursor.json", grace=600)
+    cursor.mark('mentions', cast(1, "2026-01-01T12:00:00Z"))
+    # An older cast marked later does not move the watermark back
+    cursor.mark('mentions', cast(2, "2026-01-01T11:00:00Z"))
+    assert cursor.watermarks['mentions']['hash'] == cast(1)['hash']
+
+    assert cursor.is_new('mentions', cast(3, "2026-01-01T11:55:00Z"))
+    assert not cursor.is_new('mentions', cast(4, "2026-01-01T11:49:59Z"))
+    # Watermarks are per source
+    assert cursor.is_new('profile', cast(4, "2026-01-01T11:49:59Z"))
+    # No timestamp: only the digest check applies
+    assert cursor.is_new('mentions', {'hash': cast(5)['hash']})
+
+
+def test_seen_digests_are_bounded_and_evict_least_recently_used(tmp_path):
+    cursor = resumed(tmp_path / "cursor.json", max_seen=2)
+    cursor.mark('profile', {'hash': cast(1)['hash']})
+    cursor.mark('profile', {'hash': cast(2)['hash']})
+    # Seen again in the feed, so cast 2 is now the oldest
+    assert not cursor.is_new('profile', {'hash': cast(1)['hash']})
+    cursor.mark('profile', {'hash': cast(3)['hash']})
+
+    assert len(cursor._seen) == 2
+    assert not cursor.is_new('profile', {'hash': cast(1)['hash']})
+    assert cursor.is_new('profile', {'hash': cast(2)['hash']})
+
+
+def test_cursor_survives_a_restart(tmp_path):
+    path = str(tmp_path / "cursor.json")
+    cursor = resumed(tmp_path / "cursor.json", max_seen=3)
+    for number in range(1, 5):
+        cursor.mark('mentions', cast(number))
+    cursor.save()
+
+    restarted = CastCursor(path, max_seen=2)
+    assert restarted.watermarks == cursor.watermarks
+    assert [restarted.is_new('mentions', {'hash': cast(n)['hash']}) for n in range(1, 5)] == [True, True, False, False]
+
+
+def test_save_only_writes_changes(tmp_path):
+    path = tmp_path / "cursor.json"
+    cursor = resumed(path)
+    path.unlink()
+    cursor.save()
+    assert not path.exists()
+
+    cursor.mark('mentions', cast(1))
+    cursor.save()
+    path.unlink()
+    cursor.save()
+    assert not path.exists()
+
+
+def test_first_start_skips_casts_already_in_the_feed(tmp_path):
+    path = tmp_path / "cursor.json"
+    cursor = CastCursor(str(path))
+    now = time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
+
+    assert not cursor.is_new('mentions', cast(1, "2026-01-01T12:00:00Z"))
+    assert not cursor.is_new('profile', cast(2, "2026-01-01T12:00:00Z"))
+    assert cursor.is_new('mentions', cast(3, now))
+
+    # The start time is persisted: a restart before any mark still skips the old casts
+    cursor.save()
+    assert not CastCursor(str(path)).is_new('mentions', cast(1, "2026-01-01T12:00:00Z"))
+
+
+def test_unreadable_cursor_starts_fresh_instead_of_replaying(tmp_path):
+    path = tmp_path / "cursor.json"
+    path.write_text("{not json")
+    assert not CastCursor(str(path)).is_new('mentions', cast(1, "2026-01-01T12:00:00Z"))
@@ -0,0 +1,97 @@
+"""
+test_chain_cache.py - TTL expiry, memoized chain id and invalidation of the chain state cache
+"""
+
+import chain_cache
+from chain_cache import ChainStateCache
+
+ALICE = "0x" + "a1" * 20
+BOB = "0x" + "b0" * 20
+
+
+class FakeEth:
+    def __init__(self):
+        self.calls = []
+        self.balances = {ALICE: 10, BOB: 20}
+        self.gas_price_value = 1000
+
+    @property
+    def chain_id(self):
+        self.calls.append('chain_id')
+        return 84532
+
+    @property
+    def gas_price(self):
+        self.calls.append('gas_price')
+        return self.gas_price_value
+
+    def get_balance(self, address):
+        self.calls.append(('balance', address))
+        return self.balances[address]
+
+
+class FakeW3:
+    def __init__(self):
+        self.eth = FakeEth()
+
+
+def make_cache(monkeypatch, ttl=5.0):
+    clock = {'now': 100.0}
+    monkeypatch.setattr(chain_cache.time, 'monotonic', lambda: clock['now'])
+    return ChainStateCache(FakeW3(), ttl=ttl), clock
+
+
+def test_gas_price_is_refetched_once_the_ttl_expires(monkeypatch):
+    cache, clock = make_cache(monkeypatch)
+    eth = cache.w3.eth
+
+    assert cache.gas_price() == 1000
+    eth.gas_price_value = 2000
+    clock['now'] += 4.9
+    assert cache.gas_price() == 1000
+    clock['now'] += 0.1
+    assert cache.gas_price() == 2000
+    assert eth.calls == ['gas_price', 'gas_price']
+
+
+def test_chain_id_never_expires_or_invalidates(monkeypatch):
+    cache, clock = make_cache(monkeypatch)
+
+    cache.chain_id()
+    clock['now'] += 3600
+    cache.invalidate()
+    assert cache.chain_id() == 84532
+    assert cache.w3.eth.calls == ['chain_id']
+
+
+def test_balances_are_cached_per_address(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+
+    assert (cache.balance(ALICE), cache.balance(BOB), cache.balance(ALICE)) == (10, 20, 10)
+    assert cache.w3.eth.calls == [('balance', ALICE), ('balance', BOB)]
+
+
+def test_invalidate_balance_drops_only_that_address(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    cache.balance(ALICE)
+    cache.balance(BOB)
+    cache.gas_price()
+
+    cache.w3.eth.balances[ALICE] = 5
+    cache.invalidate_balance(ALICE)
+
+    assert cache.balance(ALICE) == 5
+    assert cache.balance(BOB) == 20
+    cache.gas_price()
+    assert cache.w3.eth.calls.count(('balance', ALICE)) == 2
+    assert cache.w3.eth.calls.count(('balance', BOB)) == 1
+    assert cache.w3.eth.calls.count('gas_price') == 1
+
+
+def test_stats_count_hits_and_misses(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    assert cache.stats() == {'hits': 0, 'misses': 0, 'hit_rate': 0.0}
+
+    for _ in range(4):
+        cache.gas_price()
+    assert cache.stats() == {'hits': 3, 'misses': 1, 'hit_rate': 0.75}
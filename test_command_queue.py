@@ -0,0 +1,160 @@
+"""
+test_command_queue.py - Claims, acks, redelivery and exactly-once execution of dashboard commands
+"""
+
+import asyncio
+import threading
+import time
+
+from agent import OpenClawAgent
+from command_executor import CommandExecutor
+from command_queue import SQLiteCommandQueue
+
+
+def test_claim_hides_command_until_ack(tmp_path):
+    queue = SQLiteCommandQueue(str(tmp_path / "commands.db"))
+    command_id = queue.enqueue("deploy", {"name": "Nova"})
+
+    [cmd] = queue.claim(5)
+    assert cmd == {'id': command_id, 'type': "deploy", 'params': {"name": "Nova"}, 'attempts': 1}
+    assert queue.claim(5) == []
+
+    queue.ack(command_id)
+    assert queue.counts() == {'acked': 1}
+
+
+def test_expired_claim_is_redelivered_until_max_attempts(tmp_path):
+    queue = SQLiteCommandQueue(str(tmp_path / "commands.db"), visibility_timeout=0, max_attempts=2)
+    queue.enqueue("deploy")
+
+    assert [cmd['attempts'] for cmd in queue.claim()] == [1]
+    assert [cmd['attempts'] for cmd in queue.claim()] == [2]
+    assert queue.claim() == []
+    assert queue.counts() == {'failed': 1}
+
+
+def test_release_does_not_count_a_delivery(tmp_path):
+    queue = SQLiteCommandQueue(str(tmp_path / "commands.db"), max_attempts=1)
+    queue.enqueue("deploy")
+
+    [cmd] = queue.claim()
+    queue.release(cmd['id'], delay=0)
+    assert [cmd['attempts'] for cmd in queue.claim()] == [1]
+
+
+def test_touch_keeps_a_claim_hidden(tmp_path):
+    queue = SQLiteCommandQueue(str(tmp_path / "commands.db"), visibility_timeout=0.2)
+    queue.enqueue("deploy")
+    [cmd] = queue.claim()
+
+    for _ in range(3):
+        time.sleep(0.1)
+        queue.touch(cmd['id'])
+        assert queue.claim() == []
+
+
+def make_agent(queue, run):
+    """Agent with only the dashboard intake wired up"""
+    agent = OpenClawAgent.__new__(OpenClawAgent)
+    agent.command_queue = queue
+    agent._in_flight = set()
+    agent._in_flight_lock = threading.Lock()
+    agent.execute_command = run
+    agent.command_lane = lambda cmd: 'social'
+    return agent
+
+
+async def run_intake(agent, seconds, heartbeat, workers=2, on_start=None, rescan_interval=0.02, retry_delay=1.0):
+    agent._loop = asyncio.get_running_loop()
+    agent.executor = CommandExecutor(agent.run_command, agent.command_lane, {'social': (workers, 10)})
+    tasks = [asyncio.create_task(agent._dashboard_intake(
+        check_interval=0.02, rescan_interval=rescan_interval, retry_delay=retry_delay
+    ))]
+    if heartbeat:
+        tasks.append(asyncio.create_task(agent._claim_heartbeat(interval=0.05)))
+    if on_start:
+        await on_start(agent)
+    await asyncio.sleep(seconds)
+    for task in tasks:
+        task.cancel()
+    agent.executor.shutdown()
+
+
+def slow_command(executions, seconds=0.6):
+    def run(cmd):
+        executions.append(cmd['id'])
+        time.sleep(seconds)
+    return run
+
+
+def test_command_outliving_the_visibility_timeout_runs_once(tmp_path):
+    queue = SQLiteCommandQueue(str(tmp_path / "commands.db"), visibility_timeout=0.15)
+    command_id = queue.enqueue("deploy")
+    executions = []
+
+    asyncio.run(run_intake(make_agent(queue, slow_command(executions)), 1.0, heartbeat=True))
+
+    assert executions == [command_id]
+    assert queue.counts() == {'acked': 1}
+
+
+def test_redelivered_copy_is_dropped_while_first_runs(tmp_path):
+    # No heartbeat: the claim expires mid-run and is handed out again
+    queue = SQLiteCommandQueue(str(tmp_path / "commands.db"), visibility_timeout=0.1, max_attempts=10)
+    command_id = queue.enqueue("deploy")
+    executions = []
+
+    asyncio.run(run_intake(make_agent(queue, slow_command(executions)), 1.0, heartbeat=False))
+
+    assert executions == [command_id]
+    assert queue.counts() == {'acked': 1}
+
+
+def test_commands_for_a_busy_lane_are_not_held_claimed(tmp_path):
+    queue = SQLiteCommandQueue(str(tmp_path / "commands.db"))
+    first = queue.enqueue("deploy")
+    queue.enqueue("deploy")
+    executions = []
+    counts = []
+
+    async def check_while_first_runs(agent):
+        await asyncio.sleep(0.3)
+        counts.append(queue.counts())
+
+    agent = make_agent(queue, slow_command(executions, seconds=0.5))
+    asyncio.run(run_intake(agent, 0.1, heartbeat=False, workers=1, on_start=check_while_first_runs))
+
+    # While the single worker ran the first command, the second was handed back, not buffered
+    assert counts == [{'claimed': 1, 'pending': 1}]
+    assert executions == [first]
+
+
+def test_handed_back_commands_run_once_the_lane_frees(tmp_path):
+    queue = SQLiteCommandQueue(str(tmp_path / "commands.db"))
+    ids = [queue.enqueue("deploy") for _ in range(3)]
+    executions = []
+
+    agent = make_agent(queue, slow_command(executions, seconds=0.1))
+    asyncio.run(run_intake(agent, 1.0, heartbeat=False, workers=1, rescan_interval=30, retry_delay=0.1))
+
+    # No periodic rescan within the run: the retries alone pick them up, in order
+    assert executions == ids
+    assert queue.counts() == {'acked': 3}
+
+
+def test_routing_runs_off_the_event_loop(tmp_path):
+    queue = SQLiteCommandQueue(str(tmp_path / "commands.db"))
+    queue.enqueue("deploy")
+    routed_on = []
+
+    def command_lane(cmd):
+        # Lazy mode builds the chain side here
+        routed_on.append(threading.current_thread())
+        return 'social'
+
+    agent = make_agent(queue, lambda cmd: None)
+    agent.command_lane = command_lane
+    asyncio.run(run_intake(agent, 0.2, heartbeat=False))
+
+    assert routed_on and threading.main_thread() not in routed_on
+    assert queue.counts() == {'acked': 1}
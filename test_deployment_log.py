@@ -0,0 +1,79 @@
+"""
+test_deployment_log.py - Torn-line recovery, indexes, compaction and export of the deployment log
+"""
+
+import json
+
+from deployment_log import DeploymentLog
+
+
+def record(number, tx_hash=None, **fields):
+    return {'deployment_number': number, 'transaction_hash': tx_hash or "0x%064x" % number, **fields}
+
+
+def make_log(tmp_path):
+    return DeploymentLog(str(tmp_path / "deployments.jsonl"), str(tmp_path / "deployments.json"))
+
+
+def test_indexes_survive_a_reload(tmp_path):
+    log = make_log(tmp_path)
+    log.append(record(1, token_symbol="AAA"))
+    # Two tokens from one factory transaction
+    log.append(record(2, tx_hash="0x" + "ab" * 32, token_symbol="BBB"))
+    log.append(record(3, tx_hash="0x" + "ab" * 32, token_symbol="CCC"))
+
+    reloaded = make_log(tmp_path)
+    assert len(reloaded) == 3
+    assert reloaded.last_deployment_number() == 3
+    assert reloaded.by_number(1)['token_symbol'] == "AAA"
+    assert [r['token_symbol'] for r in reloaded.by_tx_hash("0X" + "AB" * 32)] == ["BBB", "CCC"]
+    assert reloaded.by_tx_hash("ab" * 32) == reloaded.by_tx_hash("0x0x" + "ab" * 32)
+
+
+def test_torn_final_line_is_cut_off_and_appends_continue(tmp_path):
+    log = make_log(tmp_path)
+    log.append(record(1))
+    log.append(record(2))
+    path = tmp_path / "deployments.jsonl"
+    intact = path.read_bytes()
+    with open(path, 'ab') as f:
+        f.write(b'{"deployment_number":3,"transac')  # Crash mid-append
+
+    log = make_log(tmp_path)
+    assert len(log) == 2
+    assert path.read_bytes() == intact
+
+    log.append(record(3))
+    assert [r['deployment_number'] for r in make_log(tmp_path).records()] == [1, 2, 3]
+
+
+def test_compaction_drops_unreadable_lines_and_duplicates(tmp_path):
+    path = tmp_path / "deployments.jsonl"
+    lines = [record(1), record(2), record(1), "not json", record(3)]
+    path.write_text("".join((line if isinstance(line, str) else json.dumps(line)) + "\n" for line in lines))
+
+    log = make_log(tmp_path)
+    assert len(log) == 4
+    assert log.compact() == 2
+
+    assert [r['deployment_number'] for r in log.records()] == [1, 2, 3]
+    assert log.by_number(3) == record(3)
+    assert [r['deployment_number'] for r in make_log(tmp_path).records()] == [1, 2, 3]
+    assert log.compact() == 0
+
+
+def test_export_and_import(tmp_path):
+    log = make_log(tmp_path)
+    assert list(log.records()) == []
+    assert log.export() == 0
+
+    log.append(record(1))
+    log.append(record(2))
+    assert log.dirty
+    assert log.export() == 2
+    assert not log.dirty
+    assert json.loads((tmp_path / "deployments.json").read_text()) == [record(1), record(2)]
+
+    # An existing deployments.json seeds a fresh log
+    (tmp_path / "deployments.jsonl").unlink()
+    assert [r['deployment_number'] for r in make_log(tmp_path).records()] == [1, 2]
@@ -0,0 +1,86 @@
+"""
+test_fee_oracle.py - Fee history sampling keyed on the head block
+"""
+
+import fee_oracle
+from fee_oracle import FeeOracle
+
+
+class FakeEth:
+    def __init__(self, block_number=100):
+        self.block_number_value = block_number
+        self.block_number_calls = 0
+        self.history_calls = []
+
+    @property
+    def block_number(self):
+        self.block_number_calls += 1
+        return self.block_number_value
+
+    def fee_history(self, block_count, newest_block, percentiles):
+        self.history_calls.append(newest_block)
+        return {
+            'oldestBlock': newest_block - 1,
+            'baseFeePerGas': [100, 110, 120],
+            'reward': [[1, 2, 3, 4, 5], [3, 4, 5, 6, 7]],
+        }
+
+
+class FakeW3:
+    def __init__(self, eth):
+        self.eth = eth
+
+
+def test_one_fetch_per_block():
+    eth = FakeEth()
+    oracle = FeeOracle(FakeW3(eth), head_ttl=0)
+
+    first = oracle.fees('standard')
+    oracle.fees('fast')
+    assert eth.history_calls == [100]
+
+    eth.block_number_value = 101
+    oracle.fees('standard')
+    assert eth.history_calls == [100, 101]
+    # Column medians across blocks; next base fee is the last baseFeePerGas entry
+    assert first == {'maxFeePerGas': int(120 * 1.25) + 1_000_000, 'maxPriorityFeePerGas': 1_000_000}
+    assert oracle.sample()['priority_fees'] == {10: 2, 25: 3, 50: 4, 75: 5, 90: 6}
+
+
+def test_pushed_head_replaces_block_number_reads():
+    eth = FakeEth()
+    head = {'block': 500}
+    oracle = FeeOracle(FakeW3(eth), head=lambda: head['block'])
+
+    oracle.sample()
+    oracle.sample()
+    head['block'] = 501
+    oracle.sample()
+
+    assert eth.history_calls == [500, 501]
+    assert eth.block_number_calls == 0
+
+
+def test_disconnected_head_falls_back_to_block_number():
+    eth = FakeEth(block_number=42)
+    oracle = FeeOracle(FakeW3(eth), head=lambda: None)
+
+    assert oracle.sample()['block'] == 42
+    assert eth.block_number_calls == 1
+
+
+def test_block_number_read_is_reused_within_the_ttl(monkeypatch):
+    clock = {'now': 1000.0}
+    monkeypatch.setattr(fee_oracle.time, 'monotonic', lambda: clock['now'])
+    eth = FakeEth(block_number=42)
+    oracle = FeeOracle(FakeW3(eth), head=lambda: None, head_ttl=2.0)
+
+    for _ in range(5):
+        oracle.fees('standard')
+    assert eth.block_number_calls == 1
+
+    eth.block_number_value = 43
+    clock['now'] += 2.0
+    oracle.fees('standard')
+    assert eth.block_number_calls == 2
+    assert eth.history_calls == [42, 43]
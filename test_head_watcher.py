@@ -0,0 +1,127 @@
+"""
+test_head_watcher.py - Stall detection, reconnect backoff and callback isolation of the newHeads watcher
+"""
+
+import asyncio
+
+import head_watcher
+from head_watcher import NewHeadsWatcher
+
+
+class FakeSocket:
+    """One WebSocket connection: fails to subscribe, or yields headers and then goes silent"""
+
+    def __init__(self, blocks=(), fail=None):
+        self.blocks = blocks
+        self.fail = fail
+
+    async def subscribe(self, kind):
+        if self.fail:
+            raise self.fail
+
+    async def _stream(self):
+        for number in self.blocks:
+            yield {'result': {'number': number}}
+        # No more headers, but the socket never closes
+        await asyncio.Event().wait()
+
+    def process_subscriptions(self):
+        return self._stream()
+
+
+class FakeConnection:
+    def __init__(self, socket):
+        self.socket = socket
+
+    async def __aenter__(self):
+        return type("FakeW3", (), {'eth': self.socket, 'ws': self.socket})()
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeAsyncWeb3:
+    """Hands out the scripted connections in order"""
+
+    def __init__(self, sockets):
+        self.sockets = list(sockets)
+        self.opened = 0
+
+    def persistent_websocket(self, provider):
+        self.opened += 1
+        return FakeConnection(self.sockets.pop(0))
+
+
+def run_watcher(monkeypatch, sockets, stop_at, on_block=None, **kwargs):
+    """Run the watcher loop over scripted connections until block stop_at arrives"""
+    fake = FakeAsyncWeb3(sockets)
+    monkeypatch.setattr(head_watcher, 'AsyncWeb3', fake)
+    monkeypatch.setattr(head_watcher, 'WebsocketProviderV2', lambda url: url)
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(head_watcher.asyncio, 'sleep', sleep)
+    seen = []
+
+    def callback(number):
+        seen.append(number)
+        if number == stop_at:
+            watcher.stop()
+        if on_block:
+            on_block(number)
+
+    watcher = NewHeadsWatcher("ws://node", callback, **kwargs)
+    asyncio.run(asyncio.wait_for(watcher._run(), timeout=5))
+    return watcher, fake, delays, seen
+
+
+def test_stalled_subscription_reconnects_with_backoff(monkeypatch):
+    sockets = [
+        FakeSocket(blocks=["0xa"]),
+        FakeSocket(fail=ConnectionError("refused")),
+        FakeSocket(fail=ConnectionError("refused")),
+        FakeSocket(fail=ConnectionError("refused")),
+        FakeSocket(blocks=[11, "0xc"]),
+    ]
+    watcher, fake, delays, seen = run_watcher(
+        monkeypatch, sockets, stop_at=12, stall_timeout=0.05, reconnect_delay=1.0, max_reconnect_delay=3.0
+    )
+
+    assert seen == [10, 11, 12]
+    assert fake.opened == 5
+    # Doubled per failed attempt and capped
+    assert delays == [1.0, 2.0, 3.0, 3.0]
+    assert (watcher.last_block, watcher.blocks_seen) == (12, 3)
+    assert not watcher.connected.is_set()
+
+
+def test_backoff_resets_after_a_successful_subscription(monkeypatch):
+    sockets = [
+        FakeSocket(fail=ConnectionError("refused")),
+        FakeSocket(fail=ConnectionError("refused")),
+        FakeSocket(blocks=[1]),
+        FakeSocket(fail=ConnectionError("refused")),
+        FakeSocket(blocks=[2]),
+    ]
+    _, _, delays, seen = run_watcher(monkeypatch, sockets, stop_at=2, stall_timeout=0.05, reconnect_delay=1.0)
+
+    assert seen == [1, 2]
+    assert delays == [1.0, 2.0, 1.0, 2.0]
+
+
+def test_callback_errors_do_not_drop_the_subscription(monkeypatch):
+    def fail_on_first(number):
+        if number == 1:
+            raise RuntimeError("handler bug")
+
+    _, fake, delays, seen = run_watcher(
+        monkeypatch, [FakeSocket(blocks=[1, 2, 3])], stop_at=3, on_block=fail_on_first, stall_timeout=0.05
+    )
+
+    assert seen == [1, 2, 3]
+    assert fake.opened == 1
+    assert delays == []
@@ -0,0 +1,154 @@
+"""
+test_indexer.py - Range halving, rate-limit backoff, checkpoint resume and chain filtering of the Transfer indexer
+"""
+
+import json
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Web3
+
+from indexer import TRANSFER_TOPIC, TransferIndexer
+
+TOKEN = Web3.to_checksum_address("0x" + "ab" * 20)
+OTHER_CHAIN_TOKEN = Web3.to_checksum_address("0x" + "cd" * 20)
+ALICE = Web3.to_checksum_address("0x" + "a1" * 20)
+BOB = Web3.to_checksum_address("0x" + "b0" * 20)
+ZERO = "0x" + "0" * 40
+
+
+def topic(address):
+    return HexBytes("0x" + "0" * 24 + address[2:].lower())
+
+
+def transfer(block, sender, receiver, value):
+    """ERC20 Transfer log as eth_getLogs returns it"""
+    return {
+        'address': TOKEN,
+        'topics': [HexBytes(TRANSFER_TOPIC), topic(sender), topic(receiver)],
+        'data': HexBytes(value.to_bytes(32, 'big')),
+        'blockNumber': block,
+        'blockHash': HexBytes(b"\x00" * 32),
+        'transactionHash': HexBytes(block.to_bytes(32, 'big')),
+        'transactionIndex': 0,
+        'logIndex': 0,
+        'removed': False,
+    }
+
+
+LOGS = [
+    transfer(12, ZERO, ALICE, 1000),
+    transfer(20, ALICE, BOB, 300),
+    transfer(35, BOB, ALICE, 100),
+]
+
+
+class LimitedProvider:
+    """eth_getLogs over LOGS that rejects ranges wider than max_range blocks"""
+
+    def __init__(self, max_range=8):
+        self.max_range = max_range
+        self.requests = []
+
+    def __call__(self, addresses, from_block, to_block):
+        self.requests.append((from_block, to_block))
+        if to_block - from_block + 1 > self.max_range:
+            raise ValueError({'code': -32005, 'message': 'block range too large'})
+        return [log for log in LOGS if from_block <= log['blockNumber'] <= to_block and log['address'] in addresses]
+
+
+class ThrottledProvider(LimitedProvider):
+    """LimitedProvider that answers the first `throttled` requests with a rate-limit error"""
+
+    def __init__(self, throttled, message="429 Client Error: Too Many Requests"):
+        super().__init__(max_range=100)
+        self.throttled = throttled
+        self.message = message
+
+    def __call__(self, addresses, from_block, to_block):
+        if self.throttled:
+            self.throttled -= 1
+            self.requests.append((from_block, to_block))
+            raise ValueError(self.message)
+        return super().__call__(addresses, from_block, to_block)
+
+
+def make_indexer(tmp_path, provider, chunk_size=32, **kwargs):
+    indexer = TransferIndexer(
+        Web3(), db_path=str(tmp_path / "indexer.db"), deployments_file=str(tmp_path / "deployments.json"),
+        chunk_size=chunk_size, chain_id=84532, rate_limit_delay=0, **kwargs
+    )
+    indexer._get_logs = provider
+    return indexer
+
+
+def write_deployments(tmp_path):
+    records = [
+        {'contract_address': TOKEN, 'transaction_hash': "0x01", 'block_number': 10, 'chain_id': 84532},
+        {'contract_address': OTHER_CHAIN_TOKEN, 'transaction_hash': "0x02", 'block_number': 5, 'chain_id': 8453},
+        {'contract_address': "0x" + "b" * 40, 'transaction_hash': "0x03", 'block_number': 7, 'chain_id': 84532},
+    ]
+    (tmp_path / "deployments.json").write_text(json.dumps(records))
+
+
+def test_range_errors_halve_the_chunk_and_lose_no_logs(tmp_path):
+    write_deployments(tmp_path)
+    provider = LimitedProvider(max_range=8)
+    indexer = make_indexer(tmp_path, provider)
+
+    assert indexer.run_once(to_block=40) == 3
+
+    # Starts the block after deployment, 32 -> 16 -> 8 before the first chunk succeeds
+    assert provider.requests[:3] == [(10, 40), (10, 25), (10, 17)]
+    served = [r for r in provider.requests if r[1] - r[0] + 1 <= 8]
+    assert [r[0] for r in served] == [10, 18, 26, 34]
+    assert indexer.balances(TOKEN) == {ALICE: 800, BOB: 200}
+    assert indexer.checkpoint(TOKEN) == 40
+
+
+@pytest.mark.parametrize("message", [
+    "429 Client Error: Too Many Requests",
+    "{'code': -32005, 'message': 'daily request count exceeded, request rate limited'}",
+])
+def test_rate_limits_are_retried_without_shrinking_the_range(tmp_path, message):
+    write_deployments(tmp_path)
+    provider = ThrottledProvider(throttled=3, message=message)
+    indexer = make_indexer(tmp_path, provider)
+
+    assert indexer.run_once(to_block=40) == 3
+    assert provider.requests[:4] == [(10, 40)] * 4
+    assert indexer.chunk_size == 64
+
+
+def test_persistent_rate_limit_gives_up_after_max_retries(tmp_path):
+    write_deployments(tmp_path)
+    provider = ThrottledProvider(throttled=10)
+    indexer = make_indexer(tmp_path, provider, max_rate_limit_retries=2)
+
+    with pytest.raises(ValueError, match="Too Many Requests"):
+        indexer.run_once(to_block=40)
+    assert len(provider.requests) == 3
+    assert indexer.chunk_size == 32
+    assert indexer.checkpoint(TOKEN) == 9
+
+
+def test_checkpoint_resume_does_not_reapply_events(tmp_path):
+    write_deployments(tmp_path)
+    assert make_indexer(tmp_path, LimitedProvider(max_range=100)).run_once(to_block=25) == 2
+
+    provider = LimitedProvider(max_range=100)
+    resumed = make_indexer(tmp_path, provider)
+    assert resumed.checkpoint(TOKEN) == 25
+    assert resumed.run_once(to_block=40) == 1
+
+    assert provider.requests == [(26, 40)]
+    assert resumed.balances(TOKEN) == {ALICE: 800, BOB: 200}
+
+
+def test_only_this_chains_deployments_are_tracked(tmp_path):
+    write_deployments(tmp_path)
+    indexer = make_indexer(tmp_path, LimitedProvider())
+
+    assert indexer.sync_contracts() == 1
+    assert indexer.checkpoint(TOKEN) == 9
+    assert indexer.checkpoint(OTHER_CHAIN_TOKEN) is None
@@ -0,0 +1,81 @@
+"""
+test_metrics.py - Cumulative histogram buckets, collectors and Prometheus text rendering
+"""
+
+import json
+
+from metrics import MetricsRegistry, render
+
+
+def samples(snapshot, name):
+    return {tuple(s['labels'].values()): s['value'] for s in snapshot['metrics'][name]}
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry(buckets=(0.1, 1.0, 10.0))
+    for value in (0.05, 0.1, 0.5, 3.0, 30.0):
+        registry.observe('openclaw_rpc_request_seconds', value, method='eth_call')
+
+    hist = samples(registry.snapshot(), 'openclaw_rpc_request_seconds')[('eth_call',)]
+    # Upper bounds are inclusive; 30.0 only counts towards +Inf (count)
+    assert hist == {'buckets': [2, 3, 4], 'sum': 33.65, 'count': 5}
+
+
+def test_counters_and_gauges_are_kept_per_label_set():
+    registry = MetricsRegistry()
+    registry.inc('openclaw_commands_total', type='deploy', outcome='ok')
+    registry.inc('openclaw_commands_total', 2, type='deploy', outcome='ok')
+    registry.inc('openclaw_commands_total', type='deploy', outcome='error')
+    registry.set('openclaw_queue_depth', 7, queue='commands')
+    registry.set('openclaw_queue_depth', 3, queue='commands')
+
+    snapshot = registry.snapshot()
+    assert samples(snapshot, 'openclaw_commands_total') == {('deploy', 'ok'): 3, ('deploy', 'error'): 1}
+    assert samples(snapshot, 'openclaw_queue_depth') == {('commands',): 3}
+
+
+def test_collectors_run_at_snapshot_time_and_failures_are_ignored():
+    registry = MetricsRegistry()
+    depth = {'outbox': 4}
+    registry.add_collector(lambda r: r.set('openclaw_queue_depth', depth['outbox'], queue='outbox'))
+    registry.add_collector(lambda r: 1 / 0)
+
+    depth['outbox'] = 9
+    assert samples(registry.snapshot(), 'openclaw_queue_depth') == {('outbox',): 9}
+
+
+def test_timer_records_also_when_the_block_raises():
+    registry = MetricsRegistry()
+    try:
+        with registry.time('openclaw_command_seconds', type='deploy'):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert samples(registry.snapshot(), 'openclaw_command_seconds')[('deploy',)]['count'] == 1
+
+
+def test_render_prometheus_text(tmp_path):
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.observe('openclaw_tx_stage_seconds', 0.5, stage='sign')
+    registry.inc('openclaw_rpc_requests_total', method='eth_call', outcome='ok')
+    registry.set('openclaw_lane_busy', 1, lane='say "hi"\n')
+
+    path = tmp_path / "metrics.json"
+    registry.write(str(path))
+    text = render(json.loads(path.read_text()))
+    lines = text.splitlines()
+
+    assert text.endswith("\n")
+    assert "# TYPE openclaw_tx_stage_seconds histogram" in lines
+    histogram = [line for line in lines if line.startswith("openclaw_tx_stage_seconds")]
+    assert histogram == [
+        'openclaw_tx_stage_seconds_bucket{stage="sign",le="0.1"} 0',
+        'openclaw_tx_stage_seconds_bucket{stage="sign",le="1.0"} 1',
+        'openclaw_tx_stage_seconds_bucket{stage="sign",le="+Inf"} 1',
+        'openclaw_tx_stage_seconds_sum{stage="sign"} 0.5',
+        'openclaw_tx_stage_seconds_count{stage="sign"} 1',
+    ]
+    assert 'openclaw_rpc_requests_total{method="eth_call",outcome="ok"} 1' in lines
+    assert 'openclaw_lane_busy{lane="say \\"hi\\"\\n"} 1' in lines
+    assert "# TYPE openclaw_metrics_age_seconds gauge" in lines
+    assert not (tmp_path / "metrics.json.tmp").exists()
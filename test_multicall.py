@@ -0,0 +1,82 @@
+"""
+test_multicall.py - Calldata-size chunking and result decoding of Multicall3 batches
+"""
+
+from types import SimpleNamespace
+
+from eth_abi import encode
+from web3 import Web3
+
+from multicall import Multicall, decode_string, decode_uint, selector
+
+TOKEN = "0x" + "ab" * 20
+
+
+class FakeAggregate:
+    """aggregate3 stand-in echoing each call's calldata back as its return data"""
+
+    def __init__(self):
+        self.payloads = []
+
+    def __call__(self, payload):
+        self.payloads.append(payload)
+        return SimpleNamespace(call=lambda: [(not data.startswith(b"\xff"), data[4:]) for _, _, data in payload])
+
+
+def make_multicall(max_calldata_bytes):
+    multicall = Multicall(Web3(), max_calldata_bytes=max_calldata_bytes)
+    aggregate = FakeAggregate()
+    real = multicall.contract
+    multicall.contract = SimpleNamespace(functions=SimpleNamespace(aggregate3=aggregate))
+    return multicall, aggregate, real
+
+
+def encoded_size(contract, payload):
+    """Bytes of one aggregate3 call's arguments, without the selector and outer array head"""
+    calldata = bytes.fromhex(contract.encodeABI('aggregate3', [payload])[2:])
+    return len(calldata) - 4 - 2 * 32
+
+
+def uint_call(value, padding=0):
+    return (TOKEN, selector("f(uint256)") + encode(['uint256'], [value]) + b"\x00" * padding, decode_uint)
+
+
+def test_chunks_stay_under_the_calldata_budget():
+    multicall, aggregate, real = make_multicall(max_calldata_bytes=1000)
+    calls = [uint_call(i, padding=i * 7) for i in range(40)]
+
+    assert multicall.execute(calls) == list(range(40))
+    assert len(aggregate.payloads) > 1
+    assert sum(len(p) for p in aggregate.payloads) == 40
+    for payload in aggregate.payloads:
+        assert encoded_size(real, payload) <= 1000
+
+
+def test_size_estimate_matches_the_abi_encoding():
+    multicall, _, real = make_multicall(max_calldata_bytes=10 ** 6)
+    calls = [uint_call(i, padding=i) for i in range(10)]
+
+    [chunk] = multicall._chunks(calls)
+    payload = [(Web3.to_checksum_address(t), True, data) for t, data, _ in chunk]
+    # The estimate covers each Call3 entry exactly, so the budget is never undercounted
+    assert encoded_size(real, payload) == sum(160 + 32 * ((len(data) + 31) // 32) for _, data, _ in calls)
+
+
+def test_oversize_call_still_goes_out_on_its_own():
+    multicall, aggregate, _ = make_multicall(max_calldata_bytes=100)
+
+    assert multicall.execute([uint_call(1), uint_call(2, padding=500), uint_call(3)]) == [1, 2, 3]
+    assert [len(p) for p in aggregate.payloads] == [1, 1, 1]
+
+
+def test_failed_and_undecodable_calls_become_none():
+    multicall, _, _ = make_multicall(max_calldata_bytes=24_000)
+    failing = (TOKEN, b"\xff" * 36, decode_uint)
+    garbled = (TOKEN, selector("name()") + b"\x01\x02", decode_string)
+
+    assert multicall.execute([uint_call(7), failing, garbled]) == [7, None, None]
+
+
+def test_bytes32_strings_are_accepted():
+    assert decode_string(b"MKR".ljust(32, b"\x00")) == "MKR"
+    assert decode_string(encode(['string'], ["Maker"])) == "Maker"
@@ -0,0 +1,51 @@
+"""
+test_networks.py - Network name resolution and per-network RPC settings
+"""
+
+import pytest
+
+from networks import default_network, explorer_tx_url, resolve_network, rpc_settings
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("base", "base"),
+    ("Base-Sepolia", "base-sepolia"),
+    (" base_sepolia ", "base-sepolia"),
+    (8453, "base"),
+    ("84532", "base-sepolia"),
+    (1, None),
+    ("mainnet", None),
+    ("", None),
+    (None, None),
+])
+def test_resolve_network(value, expected):
+    assert resolve_network(value) == expected
+
+
+def test_default_network_follows_network_env(monkeypatch):
+    monkeypatch.delenv("NETWORK", raising=False)
+    assert default_network() == "base-sepolia"
+    monkeypatch.setenv("NETWORK", "8453")
+    assert default_network() == "base"
+    monkeypatch.setenv("NETWORK", "optimism")
+    assert default_network() == "base-sepolia"
+
+
+def test_explorer_links_fall_back_to_base_sepolia():
+    assert explorer_tx_url(8453, "0xabc") == "https://basescan.org/tx/0xabc"
+    assert explorer_tx_url(None, "0xabc") == "https://sepolia.basescan.org/tx/0xabc"
+
+
+def test_rpc_settings_split_write_and_read_endpoints(monkeypatch):
+    monkeypatch.setenv("BASE_RPC_URL", " https://mainnet.base.org , https://base.llamarpc.com,, ")
+    monkeypatch.setenv("BASE_WS_URL", "wss://base.example")
+    assert rpc_settings("base") == ("https://mainnet.base.org", ["https://base.llamarpc.com"], "wss://base.example")
+
+
+def test_rpc_settings_prefix_and_missing_config(monkeypatch):
+    monkeypatch.setenv("BASE_SEPOLIA_RPC_URL", "https://sepolia.base.org")
+    monkeypatch.setenv("BASE_SEPOLIA_WS_URL", "")
+    monkeypatch.delenv("BASE_RPC_URL", raising=False)
+
+    assert rpc_settings("base-sepolia") == ("https://sepolia.base.org", [], None)
+    assert rpc_settings("base") is None
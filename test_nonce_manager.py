@@ -0,0 +1,201 @@
+"""
+test_nonce_manager.py - Nonce allocation and the _send_transaction retry path
+"""
+
+import threading
+
+import pytest
+from eth_account import Account
+from hexbytes import HexBytes
+
+from blockchain import BlockchainManager
+from nonce_manager import NonceManager
+
+KEY = "0x" + "11" * 32
+
+
+class FakeEth:
+    """eth namespace with a scripted pending count and send results"""
+
+    def __init__(self, pending_count=0, send_errors=()):
+        self.pending_count = pending_count
+        self.send_errors = list(send_errors)
+        self.sent = []
+
+    def get_transaction_count(self, address, block):
+        return self.pending_count
+
+    def send_raw_transaction(self, raw_tx):
+        self.sent.append(raw_tx)
+        if self.send_errors:
+            error = self.send_errors.pop(0)
+            if error:
+                raise ValueError({'code': -32000, 'message': error})
+        return HexBytes(b"\x01" * 32)
+
+
+class FakeW3:
+    def __init__(self, eth):
+        self.eth = eth
+
+
+class FakeCache:
+    def invalidate_balance(self, address):
+        pass
+
+
+class FakeSupervisor:
+    def __init__(self):
+        self.watched = []
+
+    def watch(self, nonce, tx, tx_hash):
+        self.watched.append((nonce, tx_hash))
+
+
+def make_manager(eth):
+    """BlockchainManager with the send path wired to fakes, without connecting to a node"""
+    manager = BlockchainManager.__new__(BlockchainManager)
+    manager.w3 = FakeW3(eth)
+    manager.account = Account.from_key(KEY)
+    manager.address = manager.account.address
+    manager.nonces = NonceManager(manager.w3, manager.address)
+    manager._send_lock = threading.Lock()
+    manager.cache = FakeCache()
+    manager.supervisor = FakeSupervisor()
+    return manager
+
+
+def build(nonce):
+    return {'to': "0x" + "22" * 20, 'value': 1, 'gas': 21000, 'gasPrice': 10**9, 'nonce': nonce, 'chainId': 84532}
+
+
+def test_allocate_is_sequential_and_release_hands_back_last():
+    nonces = NonceManager(FakeW3(FakeEth(pending_count=7)), "0x" + "00" * 20)
+    assert nonces.allocate() == 7
+    assert list(nonces.allocate_range(3)) == [8, 9, 10]
+    nonces.release(10)
+    assert nonces.allocate() == 10
+
+
+def test_resync_never_moves_backwards():
+    eth = FakeEth(pending_count=3)
+    nonces = NonceManager(FakeW3(eth), "0x" + "00" * 20)
+    nonces.allocate_range(5)
+    assert nonces.resync() == 8
+    eth.pending_count = 9
+    assert nonces.resync() == 9
+
+
+def test_nonce_too_low_resyncs_and_retries_at_chain_nonce():
+    eth = FakeEth(pending_count=0, send_errors=["nonce too low", None])
+    manager = make_manager(eth)
+    manager.nonces.allocate()
+    eth.pending_count = 4
+    manager.nonces.release(0)
+
+    manager._send_transaction(build)
+
+    assert len(eth.sent) == 2
+    assert [nonce for nonce, _ in manager.supervisor.watched] == [4]
+
+
+def test_already_known_counts_as_sent_without_resync():
+    eth = FakeEth(pending_count=2, send_errors=["already known"])
+    manager = make_manager(eth)
+
+    tx_hash = manager._send_transaction(build)
+
+    # One broadcast, the locally computed hash, and no second deployment at the next nonce
+    signed = manager.account.sign_transaction(build(2))
+    assert len(eth.sent) == 1
+    assert tx_hash == HexBytes(signed.hash)
+    assert manager.supervisor.watched == [(2, tx_hash)]
+    assert manager.nonces.allocate() == 3
+
+
+def test_underpriced_releases_the_nonce_instead_of_resyncing():
+    eth = FakeEth(pending_count=5, send_errors=["replacement transaction underpriced"])
+    manager = make_manager(eth)
+
+    with pytest.raises(ValueError):
+        manager._send_transaction(build)
+
+    eth.pending_count = 6
+    assert len(eth.sent) == 1
+    assert manager.supervisor.watched == []
+    # Still the same nonce: released, not skipped past by a resync
+    assert manager.nonces.allocate() == 5
+
+
+def test_error_classification():
+    assert NonceManager.is_nonce_too_low(ValueError("Nonce too low"))
+    assert not NonceManager.is_nonce_too_low(ValueError("already known"))
+    assert not NonceManager.is_nonce_too_low(ValueError("replacement transaction underpriced"))
+    assert NonceManager.is_already_known(ValueError("already known"))
+    assert NonceManager.is_underpriced(ValueError("replacement transaction underpriced"))
+
+
+def test_reset_waits_for_outstanding_ranges():
+    eth = FakeEth(pending_count=5)
+    nonces = NonceManager(FakeW3(eth), "0x" + "00" * 20)
+    batch = nonces.allocate_range(3)
+
+    nonces.reset()
+    nonces.release(2)  # Not the last nonce: would also reseed
+    # The node still reports 5: reseeding now would hand out the batch's nonces again
+    assert nonces.allocate() == 8
+
+    eth.pending_count = 9
+    nonces.settle_range(batch, 3)
+    assert nonces.allocate() == 9
+
+
+def test_unsent_tail_of_the_last_range_is_reused():
+    nonces = NonceManager(FakeW3(FakeEth(pending_count=5)), "0x" + "00" * 20)
+    nonces.settle_range(nonces.allocate_range(3), 1)
+    assert nonces.allocate() == 6
+
+
+class BlockingSigner:
+    """BatchSigner stand-in that holds the batch between nonce reservation and broadcast"""
+
+    def __init__(self):
+        self.entered = threading.Event()
+        self.proceed = threading.Event()
+
+    def sign(self, template, jobs):
+        self.entered.set()
+        self.proceed.wait(5)
+        return [
+            {'tx': tx, 'raw_tx': b"batch", 'tx_hash': HexBytes(tx['nonce'].to_bytes(32, 'big'))}
+            for _, tx in jobs
+        ]
+
+
+class FixedGas:
+    def gas_limit(self, key, w3, tx):
+        return 100_000
+
+
+def test_single_send_during_a_batch_never_reuses_its_nonces():
+    eth = FakeEth(pending_count=5)
+    manager = make_manager(eth)
+    manager.signer = BlockingSigner()
+    manager.gas_estimates = FixedGas()
+    manager.cache.chain_id = lambda: 84532
+    manager._fee_params = lambda urgency='standard': {'gasPrice': 10**9}
+
+    prepared = []
+    batch = threading.Thread(target=lambda: prepared.extend(manager.prepare_erc20_batch([("A", "A", 1)] * 3)))
+    batch.start()
+    assert manager.signer.entered.wait(5)
+
+    # A failed send elsewhere drops the local nonce while the batch is still signing
+    manager.nonces.reset()
+    manager._send_transaction(build)
+    manager.signer.proceed.set()
+    batch.join(5)
+    manager.broadcast_prepared(prepared)
+
+    watched = [nonce for nonce, _ in manager.supervisor.watched]
+    assert sorted(watched) == [5, 6, 7, 8]
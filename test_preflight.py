@@ -0,0 +1,93 @@
+"""
+test_preflight.py - Simulation before signing and gas limit caching
+"""
+
+import pytest
+from web3.exceptions import ContractLogicError
+
+from preflight import GasEstimateCache, PreflightError, is_revert
+
+BYTECODE = "0x6080604052"
+
+
+class FakeEth:
+    def __init__(self, gas=100_000, call_error=None, estimate_error=None):
+        self.gas = gas
+        self.call_error = call_error
+        self.estimate_error = estimate_error
+        self.calls = 0
+        self.estimates = 0
+
+    def call(self, tx):
+        self.calls += 1
+        if self.call_error:
+            raise self.call_error
+        return b""
+
+    def estimate_gas(self, tx):
+        self.estimates += 1
+        if self.estimate_error:
+            raise self.estimate_error
+        return self.gas
+
+
+class FakeW3:
+    def __init__(self, eth):
+        self.eth = eth
+
+
+TX = {'from': "0x" + "11" * 20, 'data': BYTECODE}
+
+
+def test_hit_reuses_gas_but_still_simulates():
+    eth = FakeEth(gas=100_000)
+    cache = GasEstimateCache(margin=1.2)
+    key = GasEstimateCache.shape_key(BYTECODE, ("Name", "SYM", 10**18))
+
+    assert cache.gas_limit(key, FakeW3(eth), TX) == 120_000
+    assert cache.gas_limit(key, FakeW3(eth), TX) == 120_000
+
+    assert eth.estimates == 1
+    assert eth.calls == 1
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'entries': 1}
+
+
+def test_revert_on_a_cache_hit_is_caught():
+    cache = GasEstimateCache()
+    key = GasEstimateCache.shape_key(BYTECODE, ("Name", "SYM", 10**18))
+    cache.gas_limit(key, FakeW3(FakeEth()), TX)
+
+    # Same shape, different values: this constructor call reverts
+    reverting = FakeEth(call_error=ContractLogicError("execution reverted: supply too large"))
+    with pytest.raises(PreflightError):
+        cache.gas_limit(key, FakeW3(reverting), TX)
+
+
+@pytest.mark.parametrize("error", [
+    ContractLogicError("execution reverted"),
+    ValueError({'code': 3, 'message': 'execution reverted', 'data': '0x08c379a0'}),
+    ValueError({'code': -32000, 'message': 'gas required exceeds allowance (30000000)'}),
+])
+def test_execution_failures_are_preflight_errors(error):
+    assert is_revert(error)
+    with pytest.raises(PreflightError):
+        GasEstimateCache().gas_limit(('k', ()), FakeW3(FakeEth(estimate_error=error)), TX)
+
+
+@pytest.mark.parametrize("error", [
+    TimeoutError("read timed out"),
+    ConnectionError("connection reset by peer"),
+    ValueError({'code': 429, 'message': 'Too Many Requests'}),
+])
+def test_transport_errors_propagate_unchanged(error):
+    assert not is_revert(error)
+    cache = GasEstimateCache()
+    with pytest.raises(type(error)) as raised:
+        cache.gas_limit(('k', ()), FakeW3(FakeEth(estimate_error=error)), TX)
+    assert not isinstance(raised.value, PreflightError)
+    assert cache.stats()['entries'] == 0
+
+
+def test_shape_key_ignores_values_of_the_same_width():
+    assert GasEstimateCache.shape_key(BYTECODE, ("A", "B", 1)) == GasEstimateCache.shape_key(BYTECODE, ("Z", "Y", 2))
+    assert GasEstimateCache.shape_key(BYTECODE, ("A", "B", 1)) != GasEstimateCache.shape_key(BYTECODE, ("A" * 40, "B", 1))
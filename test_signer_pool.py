@@ -0,0 +1,144 @@
+"""
+test_signer_pool.py - Load-based signer assignment, release accounting and treasury top-ups
+"""
+
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+from web3 import Web3
+
+from signer_pool import SignerPool
+
+ETH = 10 ** 18
+
+
+class FakeChain:
+    """Balances shared by every manager, as on the node"""
+
+    def __init__(self):
+        self.balances = {}
+        self.transfers = []
+
+
+class FakeSupervisor:
+    def __init__(self):
+        self.pending = 0
+        self.futures = []
+
+    def pending_count(self):
+        return self.pending
+
+    def track(self, tx_hash):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+
+class FakeCache:
+    def __init__(self, chain):
+        self.chain = chain
+        self.invalidated = []
+
+    def balance(self, address):
+        return self.chain.balances[address]
+
+    def invalidate_balance(self, address):
+        self.invalidated.append(address)
+
+
+class FakeManager:
+    """The parts of BlockchainManager the pool uses; the key doubles as the address"""
+
+    def __init__(self, chain, key):
+        self.chain = chain
+        self.address = key
+        self.w3 = SimpleNamespace(from_wei=Web3.from_wei)
+        self.cache = FakeCache(chain)
+        self.supervisor = FakeSupervisor()
+        chain.balances.setdefault(key, ETH)
+
+    def with_signer(self, key):
+        return FakeManager(self.chain, key)
+
+    def transfer_eth(self, to, amount):
+        self.chain.transfers.append((self.address, to, amount))
+        return bytes([len(self.chain.transfers)]) * 32
+
+
+def make_pool(keys=("B", "C"), **kwargs):
+    primary = FakeManager(FakeChain(), "A")
+    kwargs.setdefault('min_balance', 0.002)
+    kwargs.setdefault('top_up', 0.01)
+    return SignerPool(primary, keys=list(keys), **kwargs)
+
+
+def test_acquire_spreads_work_by_load():
+    pool = make_pool()
+    assigned = [pool.acquire().address for _ in range(6)]
+    assert sorted(assigned) == ["A", "A", "B", "B", "C", "C"]
+
+    # In-flight transactions count towards the load
+    pool.release("C")
+    pool.release("C")
+    pool.signers["C"].supervisor.pending = 3
+    pool.release("B")
+    assert pool.acquire().address == "B"
+
+
+def test_release_counts_outcomes_and_never_goes_negative():
+    pool = make_pool(keys=())
+    pool.acquire()
+    pool.acquire()
+    pool.acquire()
+    pool.release("A")
+    pool.release("A", succeeded=False)
+    pool.release("A", succeeded=None)
+    pool.release("A")
+    pool.release("unknown")
+
+    stats = pool.stats()["A"]
+    assert (stats['assigned'], stats['completed'], stats['failed']) == (0, 2, 1)
+
+
+def test_underfunded_signers_are_skipped_until_none_is_funded():
+    pool = make_pool()
+    chain = pool.primary.chain
+    chain.balances["B"] = chain.balances["C"] = ETH // 10000
+    pool.refresh_balances()
+
+    assert {pool.acquire().address for _ in range(3)} == {"A"}
+
+    chain.balances["A"] = 0
+    pool.refresh_balances()
+    # Nobody funded: fall back to the least loaded of all signers
+    assert pool.acquire().address in ("B", "C")
+
+
+def test_rebalance_tops_up_once_per_signer_until_confirmed():
+    pool = make_pool()
+    chain = pool.primary.chain
+    chain.balances["B"] = 0
+
+    assert pool.rebalance() == 1
+    assert chain.transfers == [("A", "B", 0.01)]
+    assert pool.stats()["B"]['topping_up']
+    # Still in flight: no second top-up
+    assert pool.rebalance() == 0
+
+    pool.treasury.supervisor.futures[0].set_result({'status': 1})
+    assert not pool.stats()["B"]['topping_up']
+    assert "B" in pool.primary.cache.invalidated
+    assert pool.rebalance() == 1
+    assert pool.stats()["B"]['top_ups'] == 2
+
+
+def test_treasury_keeps_its_minimum_balance():
+    pool = make_pool(treasury_key="T")
+    chain = pool.primary.chain
+    chain.balances["T"] = int(0.015 * ETH)
+    chain.balances["B"] = chain.balances["C"] = 0
+
+    # One top-up leaves 0.005 ETH; a second would take the treasury under min_balance
+    assert pool.rebalance() == 1
+    assert chain.transfers == [("T", "B", 0.01)]
+    assert "T" not in pool.signers
@@ -0,0 +1,131 @@
+"""
+test_social_outbox.py - Retry backoff, reply ordering and flushing of the announcement outbox
+"""
+
+import pytest
+
+import social_outbox
+from social_outbox import SocialOutbox
+
+
+class FakeSocial:
+    """post_to_farcaster that fails the first `failures` posts, then hands out cast hashes"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.posts = []
+
+    def generate_ai_image(self, prompt):
+        return f"https://images.example/{prompt}"
+
+    def post_to_farcaster(self, message, image_url=None, parent_hash=None):
+        self.posts.append((message, image_url, parent_hash))
+        if self.failures:
+            self.failures -= 1
+            return {'status': 'error', 'error': "503 Service Unavailable"}
+        return {'status': 'success', 'response': {'cast': {'hash': f"0xcast{len(self.posts)}"}}}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {'t': 1000.0}
+    monkeypatch.setattr(social_outbox.time, 'time', lambda: now['t'])
+    monkeypatch.setattr(social_outbox.random, 'uniform', lambda a, b: 1.0)
+    return now
+
+
+def make_outbox(tmp_path, social, **kwargs):
+    outbox = SocialOutbox(social, path=str(tmp_path / "outbox.db"), **kwargs)
+    # Drain from the test instead of the sender thread
+    outbox._ensure_running = lambda: None
+    return outbox
+
+
+def test_failed_posts_back_off_exponentially_until_dead(tmp_path, clock):
+    social = FakeSocial(failures=10)
+    outbox = make_outbox(tmp_path, social, max_attempts=4, base_delay=5, max_delay=12)
+    job_id = outbox.enqueue("Deployed NOVA")
+
+    waits = []
+    while outbox.job(job_id)['status'] == 'pending':
+        assert outbox.drain_once() == 0
+        row = outbox._db.execute("SELECT next_attempt_at FROM outbox WHERE id = ?", (job_id,)).fetchone()
+        waits.append(row[0] - clock['t'])
+        # Not due before its retry time
+        posted = len(social.posts)
+        clock['t'] = row[0] - 0.1
+        outbox.drain_once()
+        assert len(social.posts) == posted
+        clock['t'] = row[0]
+
+    # 5s, 10s, then capped at 12s; the fourth attempt is the last
+    assert waits[:3] == [5, 10, 12]
+    assert len(social.posts) == 4
+    assert outbox.job(job_id) == {
+        'id': job_id, 'status': 'dead', 'attempts': 4, 'cast_hash': None, 'error': "503 Service Unavailable"
+    }
+
+
+def test_retry_succeeds_and_records_the_cast_hash(tmp_path, clock):
+    social = FakeSocial(failures=1)
+    outbox = make_outbox(tmp_path, social, base_delay=5)
+    job_id = outbox.enqueue("Deployed NOVA", image_prompt="nova")
+
+    assert outbox.drain_once() == 0
+    clock['t'] += 5
+    assert outbox.drain_once() == 1
+
+    assert outbox.job(job_id) == {'id': job_id, 'status': 'sent', 'attempts': 2, 'cast_hash': "0xcast2", 'error': None}
+    assert social.posts[-1] == ("Deployed NOVA", "https://images.example/nova", None)
+    assert outbox.pending_count() == 0
+
+
+def test_reply_waits_for_its_parent_and_threads_under_it(tmp_path, clock):
+    social = FakeSocial(failures=1)
+    outbox = make_outbox(tmp_path, social, base_delay=5)
+    parent = outbox.enqueue("Batch deployed")
+    reply = outbox.enqueue("Token 1", parent_job=parent)
+
+    # Parent fails, reply is held back rather than posted top-level
+    outbox.drain_once()
+    assert [post[0] for post in social.posts] == ["Batch deployed"]
+    assert outbox.job(reply)['attempts'] == 0
+
+    clock['t'] += 5
+    assert outbox.drain_once() == 2
+    assert social.posts[1:] == [("Batch deployed", None, None), ("Token 1", None, "0xcast2")]
+
+
+def test_reply_to_a_dead_parent_is_posted_top_level(tmp_path, clock):
+    social = FakeSocial(failures=1)
+    outbox = make_outbox(tmp_path, social, max_attempts=1)
+    parent = outbox.enqueue("Batch deployed")
+    reply = outbox.enqueue("Token 1", parent_job=parent)
+
+    assert outbox.drain_once() == 1
+    assert outbox.job(parent)['status'] == 'dead'
+    assert outbox.job(reply)['status'] == 'sent'
+    assert social.posts[-1] == ("Token 1", None, None)
+
+
+def test_flush_waits_for_the_sender_thread(tmp_path):
+    social = FakeSocial()
+    outbox = SocialOutbox(social, path=str(tmp_path / "outbox.db"), poll_interval=0.05)
+    for i in range(3):
+        outbox.enqueue(f"Deployed T{i}")
+    try:
+        assert outbox.flush(timeout=5)
+    finally:
+        outbox.stop()
+
+    assert [post[0] for post in social.posts] == ["Deployed T0", "Deployed T1", "Deployed T2"]
+
+
+def test_jobs_survive_a_restart(tmp_path, clock):
+    make_outbox(tmp_path, FakeSocial()).enqueue("Deployed NOVA")
+
+    social = FakeSocial()
+    resumed = make_outbox(tmp_path, social)
+    assert resumed.pending_count() == 1
+    assert resumed.drain_once() == 1
+    assert social.posts == [("Deployed NOVA", None, None)]
@@ -0,0 +1,65 @@
+"""
+test_token_factory.py - Off-chain contract address prediction
+"""
+
+import pytest
+
+from blockchain import BlockchainManager
+from token_factory import MAX_BATCH, create2_address, create_address, fits_factory
+
+ZERO = "0x0000000000000000000000000000000000000000"
+DEADBEEF = "0x00000000000000000000000000000000deadbeef"
+SENDER = "0x6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0"
+
+
+# Examples from EIP-1014
+@pytest.mark.parametrize("deployer, salt, init_code, expected", [
+    (ZERO, "00" * 32, "00", "0x4D1A2e2bB4F88F0250f26Ffff098B0b30B26BF38"),
+    ("0xdeadbeef00000000000000000000000000000000", "00" * 32, "00", "0xB928f69Bb1D91Cd65274e3c79d8986362984fDA3"),
+    ("0xdeadbeef00000000000000000000000000000000", "00" * 12 + "feed" + "00" * 18, "00", "0xD04116cDd17beBE565EB2422F2497E06cC1C9833"),
+    (ZERO, "00" * 32, "deadbeef", "0x70f2b2914A2a4b783FaEFb75f459A580616Fcb5e"),
+    (DEADBEEF, "00" * 28 + "cafebabe", "deadbeef", "0x60f3f640a8508fC6a86d45DF051962668E1e8AC7"),
+    (DEADBEEF, "00" * 28 + "cafebabe", "deadbeef" * 11, "0x1d8bfDC5D46DC4f61D6b6115972536eBE6A8854C"),
+    (ZERO, "00" * 32, "", "0xE33C0C7F7df4809055C3ebA6c09CFe4BaF1BD9e0"),
+])
+def test_create2_address(deployer, salt, init_code, expected):
+    assert create2_address(deployer, bytes.fromhex(salt), bytes.fromhex(init_code)) == expected
+
+
+# Nonces across the RLP encodings: empty (0), single byte (< 0x80) and length-prefixed
+@pytest.mark.parametrize("nonce, expected", [
+    (0, "0xcd234A471b72ba2F1Ccf0A70FCABA648a5eeCD8d"),
+    (1, "0x343c43A37D37dfF08AE8C4A11544c718AbB4fCF8"),
+    (2, "0xf778B86FA74E846c4f0a1fBd1335FE81c00a0C91"),
+    (3, "0xffFd933A0bC612844eaF0C6Fe3E5b8E9B6C1d19c"),
+    (127, "0x06d9a77f5E4b311Bae8D559DB9CDB4dF94104aA0"),
+    (128, "0x08e190dcB7b73F5fcDAbb43e102215c83659A76D"),
+    (1024, "0x4851395a7875CfF1cEd5a731d9bF534A57ed0d8c"),
+    (2 ** 32, "0xf4bf328880432064068338F915C49f817dC4Ce18"),
+])
+def test_create_address(nonce, expected):
+    assert create_address(SENDER, nonce) == expected
+
+
+def test_factory_limits_count_utf8_bytes():
+    assert fits_factory("N" * 64, "S" * 32)
+    assert not fits_factory("N" * 65, "NOVA")
+    assert not fits_factory("Nova", "S" * 33)
+    # 33 characters but 66 bytes
+    assert not fits_factory("é" * 33, "NOVA")
+
+
+def test_oversize_tokens_are_deployed_on_their_own():
+    manager = BlockchainManager.__new__(BlockchainManager)
+    chunks, singles = [], []
+    manager._deploy_erc20_chunk = lambda tokens, urgency: chunks.append(tokens) or [{'symbol': s} for _, s, _ in tokens]
+    manager.deploy_erc20_token = lambda name, symbol, supply, urgency: singles.append(symbol) or {'symbol': symbol}
+
+    tokens = [(f"Token {i}", f"T{i}", 1000) for i in range(MAX_BATCH + 1)]
+    tokens.insert(3, ("L" * 65, "LONG", 1000))
+    results = manager.deploy_erc20_batch(tokens)
+
+    assert singles == ["LONG"]
+    assert [len(chunk) for chunk in chunks] == [MAX_BATCH, 1]
+    assert all(name != "L" * 65 for chunk in chunks for name, _, _ in chunk)
+    assert [r['symbol'] for r in results] == [symbol for _, symbol, _ in tokens]
@@ -0,0 +1,71 @@
+"""
+test_tx_builder.py - Offline constructor encoding and batch signing match web3's build_transaction
+"""
+
+from eth_account import Account
+from web3 import Web3
+
+from blockchain import BlockchainManager
+from tx_builder import BatchSigner, ContractTemplate
+
+KEY = "0x" + "4c" * 32
+ARGS = [("Nova", "NOVA", 10 ** 24), ("Å Token", "ÅT", 1), ("", "", 0)]
+
+
+def web3_transaction(args, nonce):
+    """What the per-token path builds through web3's contract factory"""
+    token = Web3().eth.contract(abi=BlockchainManager.ERC20_ABI, bytecode=BlockchainManager.ERC20_BYTECODE)
+    return token.constructor(*args).build_transaction({
+        'from': Account.from_key(KEY).address,
+        'nonce': nonce,
+        'gas': 900_000,
+        'maxFeePerGas': 2 * 10 ** 9,
+        'maxPriorityFeePerGas': 10 ** 6,
+        'chainId': 84532,
+    })
+
+
+def jobs():
+    return [
+        (args, {'nonce': nonce, 'gas': 900_000, 'maxFeePerGas': 2 * 10 ** 9, 'maxPriorityFeePerGas': 10 ** 6,
+                'chainId': 84532, 'type': 2})
+        for nonce, args in enumerate(ARGS)
+    ]
+
+
+def test_init_code_matches_the_contract_factory():
+    template = ContractTemplate.for_contract(BlockchainManager.ERC20_ABI, BlockchainManager.ERC20_BYTECODE)
+    token = Web3().eth.contract(abi=BlockchainManager.ERC20_ABI, bytecode=BlockchainManager.ERC20_BYTECODE)
+
+    assert template.arg_types == ['string', 'string', 'uint256']
+    for args in ARGS:
+        assert "0x" + template.init_code(args).hex() == token.constructor(*args).data_in_transaction
+
+
+def test_templates_are_parsed_once_per_bytecode():
+    first = ContractTemplate.for_contract(BlockchainManager.ERC20_ABI, BlockchainManager.ERC20_BYTECODE)
+    assert ContractTemplate.for_contract(BlockchainManager.ERC20_ABI, BlockchainManager.ERC20_BYTECODE) is first
+
+
+def expected_signatures():
+    signed = [Account.from_key(KEY).sign_transaction(web3_transaction(args, nonce)) for nonce, args in enumerate(ARGS)]
+    return [(bytes(getattr(s, 'raw_transaction', None) or s.rawTransaction), bytes(s.hash)) for s in signed]
+
+
+def test_in_process_signing_matches_build_transaction():
+    template = ContractTemplate.for_contract(BlockchainManager.ERC20_ABI, BlockchainManager.ERC20_BYTECODE)
+    signed = BatchSigner(KEY, max_workers=1).sign(template, jobs())
+
+    assert [(job['raw_tx'], job['tx_hash']) for job in signed] == expected_signatures()
+    assert [job['tx']['nonce'] for job in signed] == [0, 1, 2]
+
+
+def test_pool_signing_keeps_job_order():
+    template = ContractTemplate.for_contract(BlockchainManager.ERC20_ABI, BlockchainManager.ERC20_BYTECODE)
+    signer = BatchSigner(KEY, max_workers=2, min_parallel=1)
+    try:
+        signed = signer.sign(template, jobs())
+    finally:
+        signer.shutdown()
+
+    assert [(job['raw_tx'], job['tx_hash']) for job in signed] == expected_signatures()
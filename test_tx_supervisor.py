@@ -0,0 +1,151 @@
+"""
+test_tx_supervisor.py - Fee bumps, replacement and resolution of stuck transactions
+"""
+
+from concurrent.futures import Future
+
+import pytest
+
+from tx_supervisor import TransactionSupervisor
+
+GWEI = 10 ** 9
+
+
+class FakeOracle:
+    def __init__(self, base_fee=1 * GWEI, max_fee=2 * GWEI, tip=1 * GWEI):
+        self.base_fee = base_fee
+        self.max_fee = max_fee
+        self.tip = tip
+
+    def sample(self):
+        return {'next_base_fee': self.base_fee}
+
+    def fees(self, urgency='standard'):
+        return {'maxFeePerGas': self.max_fee, 'maxPriorityFeePerGas': self.tip}
+
+
+class FakeTracker:
+    """Hands out one future per tracked hash; the test decides when each resolves"""
+
+    def __init__(self):
+        self.futures = {}
+        self.untracked = []
+
+    def track(self, tx_hash):
+        return self.futures.setdefault(tx_hash, Future())
+
+    def untrack(self, tx_hash):
+        self.untracked.append(tx_hash)
+        self.futures[tx_hash].cancel()
+
+
+class Broadcaster:
+    def __init__(self, error=None):
+        self.error = error
+        self.sent = []
+
+    def __call__(self, tx):
+        if self.error:
+            raise self.error
+        self.sent.append(tx)
+        return "0x%064x" % (len(self.sent) + 1)
+
+
+def make_supervisor(broadcast=None, oracle=None, **kwargs):
+    supervisor = TransactionSupervisor(FakeTracker(), oracle or FakeOracle(), broadcast or Broadcaster(), **kwargs)
+    # Drive check() from the test instead of the deadline thread
+    supervisor._ensure_running = lambda: None
+    return supervisor
+
+
+TX = {'nonce': 7, 'maxFeePerGas': 10 * GWEI, 'maxPriorityFeePerGas': 2 * GWEI, 'gas': 21000}
+FIRST = "0x%064x" % 1
+
+
+def test_bump_is_at_least_the_minimum_over_the_old_fees():
+    supervisor = make_supervisor(fee_bump=1.125)
+    fees = supervisor._bumped_fees(TX)
+    assert fees == {'maxFeePerGas': int(10 * GWEI * 1.125) + 1, 'maxPriorityFeePerGas': int(2 * GWEI * 1.125) + 1}
+
+
+def test_bump_follows_the_oracle_when_it_prices_higher():
+    supervisor = make_supervisor(oracle=FakeOracle(max_fee=50 * GWEI, tip=5 * GWEI))
+    assert supervisor._bumped_fees(TX) == {'maxFeePerGas': 50 * GWEI, 'maxPriorityFeePerGas': 5 * GWEI}
+
+
+def test_legacy_gas_price_is_bumped_into_both_fields():
+    supervisor = make_supervisor(oracle=FakeOracle(max_fee=0, tip=0))
+    fees = supervisor._bumped_fees({'gasPrice': 8 * GWEI})
+    assert fees['maxFeePerGas'] == fees['maxPriorityFeePerGas'] == int(8 * GWEI * 1.125) + 1
+
+
+def test_replacements_stop_at_max_replacements():
+    broadcast = Broadcaster()
+    supervisor = make_supervisor(broadcast, replace_after=0, max_replacements=2)
+    supervisor.watch(7, TX, FIRST)
+
+    assert [supervisor.check() for _ in range(4)] == [1, 1, 0, 0]
+    assert [tx['nonce'] for tx in broadcast.sent] == [7, 7]
+    assert broadcast.sent[1]['maxFeePerGas'] > broadcast.sent[0]['maxFeePerGas'] > TX['maxFeePerGas']
+
+
+def test_fresh_transaction_priced_above_base_fee_is_left_alone():
+    broadcast = Broadcaster()
+    supervisor = make_supervisor(broadcast, replace_after=60)
+    supervisor.watch(7, TX, FIRST)
+
+    assert supervisor.check() == 0
+    assert broadcast.sent == []
+
+
+def test_underpriced_transaction_is_replaced_before_its_deadline():
+    broadcast = Broadcaster()
+    supervisor = make_supervisor(broadcast, oracle=FakeOracle(base_fee=20 * GWEI, max_fee=41 * GWEI), replace_after=60)
+    supervisor.watch(7, TX, FIRST)
+
+    assert supervisor.check() == 1
+    assert broadcast.sent[0]['maxFeePerGas'] >= 20 * GWEI
+
+
+def test_original_mined_after_replacement_resolves_the_nonce():
+    broadcast = Broadcaster()
+    supervisor = make_supervisor(broadcast, replace_after=0)
+    future = supervisor.watch(7, TX, FIRST)
+    supervisor.check()
+    [replacement] = [h for h in supervisor.tracker.futures if h != FIRST]
+    assert supervisor.track(replacement) is future
+
+    supervisor.tracker.futures[FIRST].set_result({'status': 1, 'transactionHash': FIRST})
+
+    assert future.result(timeout=0) == {'status': 1, 'transactionHash': FIRST}
+    assert supervisor.tracker.untracked == [replacement]
+    assert supervisor.pending_count() == 0
+    assert supervisor.nonce_of(replacement) is None
+
+
+@pytest.mark.parametrize("message", ["nonce too low", "invalid nonce", "already known", "known transaction"])
+def test_replacement_of_an_already_mined_nonce_is_not_counted(message, caplog):
+    supervisor = make_supervisor(Broadcaster(ValueError({'code': -32000, 'message': message})), replace_after=0)
+    future = supervisor.watch(7, TX, FIRST)
+
+    with caplog.at_level("INFO", logger="tx_supervisor"):
+        assert supervisor.check() == 0
+    assert supervisor.replacements_sent == 0
+    assert not future.done()
+    # Recognised with the nonce manager's error fragments, so not reported as a rejection
+    assert [r.levelname for r in caplog.records] == ["INFO"]
+
+
+def test_dropped_replacement_fails_the_nonce_but_a_superseded_hash_does_not():
+    supervisor = make_supervisor(replace_after=0)
+    future = supervisor.watch(7, TX, FIRST)
+    supervisor.check()
+    [replacement] = [h for h in supervisor.tracker.futures if h != FIRST]
+
+    supervisor.tracker.futures[FIRST].set_exception(TimeoutError("dropped"))
+    assert not future.done()
+
+    supervisor.tracker.futures[replacement].set_exception(TimeoutError("dropped"))
+    with pytest.raises(TimeoutError):
+        future.result(timeout=0)
+    assert supervisor.pending_count() == 0
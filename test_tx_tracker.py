@@ -0,0 +1,104 @@
+"""
+test_tx_tracker.py - Batched receipt polling, timeouts and untracking
+"""
+
+import pytest
+from web3 import Web3
+
+from tx_tracker import ReceiptTracker
+
+HASH_A = "0x" + "aa" * 32
+HASH_B = "0x" + "bb" * 32
+
+
+class BatchProvider:
+    """make_batch_request over a dict of raw receipts; records every batch it is sent"""
+
+    def __init__(self, receipts=None):
+        self.receipts = receipts or {}
+        self.batches = []
+
+    def make_batch_request(self, payload):
+        self.batches.append([item['params'][0] for item in payload])
+        return [
+            {'jsonrpc': "2.0", 'id': item['id'], 'result': self.receipts.get(item['params'][0])}
+            for item in payload
+        ]
+
+
+def make_tracker(provider, timeout=300):
+    tracker = ReceiptTracker("http://unused", timeout=timeout, provider=provider)
+    # Poll from the test instead of the background thread
+    tracker._ensure_running = lambda: None
+    return tracker
+
+
+def raw_receipt(tx_hash, status="0x1"):
+    return {
+        'transactionHash': tx_hash,
+        'status': status,
+        'blockNumber': "0x10",
+        'gasUsed': "0x5208",
+        'contractAddress': "0x" + "ab" * 20,
+    }
+
+
+def test_all_pending_hashes_share_one_batch():
+    provider = BatchProvider()
+    tracker = make_tracker(provider)
+    tracker.track(HASH_A)
+    tracker.track(bytes.fromhex("bb" * 32))
+
+    assert tracker.poll_once() == 0
+    assert provider.batches == [[HASH_A, HASH_B]]
+    assert tracker.pending_count() == 2
+
+
+def test_receipt_is_normalized_and_resolves_future_and_callback():
+    provider = BatchProvider({HASH_A: raw_receipt(HASH_A)})
+    tracker = make_tracker(provider)
+    seen = []
+    future = tracker.track(HASH_A.upper().replace("0X", ""), callback=seen.append)
+    tracker.track(HASH_B)
+
+    assert tracker.poll_once() == 1
+    receipt = future.result(timeout=0)
+    assert (receipt['status'], receipt['blockNumber'], receipt['gasUsed']) == (1, 16, 21000)
+    assert receipt['contractAddress'] == Web3.to_checksum_address("0x" + "ab" * 20)
+    assert seen == [receipt]
+    assert tracker.pending_count() == 1
+
+
+def test_missing_receipt_times_out():
+    tracker = make_tracker(BatchProvider(), timeout=0)
+    future = tracker.track(HASH_A)
+
+    assert tracker.poll_once() == 1
+    with pytest.raises(TimeoutError):
+        future.result(timeout=0)
+    assert tracker.pending_count() == 0
+
+
+def test_untracked_hash_is_cancelled_and_no_longer_polled():
+    provider = BatchProvider()
+    tracker = make_tracker(provider)
+    future = tracker.track(HASH_A)
+    tracker.track(HASH_B)
+
+    tracker.untrack(HASH_A)
+    tracker.poll_once()
+
+    assert future.cancelled()
+    assert provider.batches == [[HASH_B]]
+
+
+def test_lookup_errors_leave_the_hash_pending():
+    provider = BatchProvider()
+    provider.make_batch_request = lambda payload: [
+        {'jsonrpc': "2.0", 'id': 0, 'error': {'code': -32000, 'message': "header not found"}}
+    ]
+    tracker = make_tracker(provider)
+    future = tracker.track(HASH_A)
+
+    assert tracker.poll_once() == 0
+    assert not future.done()
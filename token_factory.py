@@ -0,0 +1,122 @@
+"""
+token_factory.py - Batch ERC20 deployment through a CREATE2 token factory
+Holds the compiled factory artifacts and the address math used to predict token addresses off-chain
+"""
+
+from typing import List, Tuple
+
+import rlp
+from eth_abi import encode
+from web3 import Web3
+
+# Deterministic deployment proxy (same address on Base and Base Sepolia).
+# Calldata is salt (32 bytes) followed by init code; the contract is created with CREATE2.
+CREATE2_DEPLOYER = "0x4e59b44847b379578588920cA78FbF26c0B4956C"
+
+# Salt used for the one-time blueprint and factory deployments
+FACTORY_SALT = b"\x00" * 32
+
+# ERC-5202 preamble prepended to blueprint code; the factory skips it via code_offset=3
+BLUEPRINT_PREAMBLE_LENGTH = 3
+
+# Compiled with vyper 0.3.10 from contracts/FactoryToken.vy (-f blueprint_bytecode)
+TOKEN_BLUEPRINT_BYTECODE = "0x6105223d81600a3d39f3fe71003461012c57602061051f5f395f51604060208261051f015f395f511161012c57602060208261051f015f395f5101808261051f016040395050602061053f5f395f51602060208261051f015f395f511161012c57602060208261051f015f395f5101808261051f0160a0395050602061057f5f395f518060a01c61012c5760e0526020604051015f81601f0160051c6003811161012c5780156100b357905b8060051b60400151815560010181811861009e575b50505060a05160035560c051600455602061055f5f395f51600555602061055f5f395f51600660e0516020525f5260405f205560e0515f7fddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef602061055f610100396020610100a36103db610130610000396103db610000f35b5f80fd5f3560e01c60026007820660011b6103cd01601e395f51565b6306fdde03811861008f57346103c9576020806040528060400160205f54015f81601f0160051c600381116103c957801561006357905b80548160051b85015260010181811861004f575b5050508051806020830101601f825f03163682375050601f19601f825160200101169050810190506040f35b63a9059cbb81186103c5576044361034176103c9576004358060a01c6103c9576040526006336020525f5260405f2080546024358082038281116103c9579050905081555060066040516020525f5260405f2080546024358082018281106103c95790509050815550604051337fddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef60243560605260206060a3600160605260206060f36103c5565b6395d89b41811861018757346103c95760208060405280604001600354815260045460208201528051806020830101601f825f03163682375050601f19601f825160200101169050810190506040f35b63dd62ed3e81186103c5576044361034176103c9576004358060a01c6103c9576040526024358060a01c6103c95760605260076040516020525f5260405f20806060516020525f5260405f2090505460805260206080f36103c5565b63313ce56781186101fe57346103c957601260405260206040f35b6318160ddd81186103c557346103c95760055460405260206040f36103c5565b6370a0823181186103c5576024361034176103c9576004358060a01c6103c95760405260066040516020525f5260405f205460605260206060f36103c5565b63095ea7b381186103c5576044361034176103c9576004358060a01c6103c9576040526024356007336020525f5260405f20806040516020525f5260405f20905055604051337f8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b92560243560605260206060a3600160605260206060f36103c5565b6323b872dd81186103c5576064361034176103c9576004358060a01c6103c9576040526024358060a01c6103c95760605260076040516020525f5260405f2080336020525f5260405f20905080546044358082038281116103c9579050905081555060066040516020525f5260405f2080546044358082038281116103c9579050905081555060066060516020525f5260405f2080546044358082018281106103c957905090508155506060516040517fddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef60443560805260206080a3600160805260206080f35b5f5ffd5b5f80fd021e025d02de001803c501e30137841903db810e00a16576797065728300030a0014"
+
+# Compiled with vyper 0.3.10 from contracts/TokenFactory.vy (-f bytecode)
+TOKEN_FACTORY_BYTECODE = "0x6104465150346100365760206104955f395f518060a01c610036576040526040516104465261044661003a61000039610466610000f35b5f80fd5f3560e01c60026001821660011b61044201601e395f51565b6272e140811861043a573461043e57602061044660403960206040f361043a565b63241f39f9811861043a576101043610341761043e57600435600401604081351161043e5780355f816040811161043e5780156100a857905b8060051b6020850101356020850101604081351161043e5760208135016060830260600181838237505050600101818118610072575b5050806040525050602435600401604081351161043e5780355f816040811161043e57801561010a57905b8060051b6020850101356020850101602081351161043e5760208135018260061b61188001818382375050506001018181186100d3575b505080611860525050604435600401604081351161043e57803560208160051b01808361288037505050606435600401604081351161043e57803560208160051b0180836130a037505050611860516040511861018157612880516040511861017b576130a0516040511815610183565b5f610183565b5f5b6101ec57600f6138c0527f6c656e677468206d69736d6174636800000000000000000000000000000000006138e0526138c0506138c051806138e001601f825f031636823750506308c379a06138805260206138a052601f19601f6138c051011660440161389cfd5b5f6138c0525f6040905b806140e0526040516140e0511061020c576103db565b5f338161414001526020810190506140e0516130a05181101561043e5760051b6130c00151816141400152602081019050806141205261412090508051602082012090506141005260206104465f395f51614100516080806141805260606140e05160405181101561043e5702606001816141800160208251018082828560045afa50508051806020830101601f825f03163682375050601f19601f825160200101169050905081019050806141a0526140e0516118605181101561043e5760061b61188001816141800181518152602082015160208201528051806020830101601f825f03163682375050601f19601f8251602001011690509050810190506140e0516128805181101561043e5760051b6128a0015161414052614140516141c0523361416052614160516141e0526003833b03596001821261043e5781600382873c81810183818561418060045afa505083838301825ff5801561043e5790509050905090509050614120526138c051603f811161043e57614120518160051b6138e00152600181016138c0525033614120517f9ea39db4a398b469ed3a81a577108b4218a8642c91546deb19e4e16ba351d34e61410051614140526020614140a36001018181186101f6575b50506020806140e052806140e0015f6138c0518083528060051b5f826040811161043e57801561042557905b8060051b6138e001518160051b602088010152600101818118610407575b505082016020019150509050810190506140e0f35b5f5ffd5b5f80fd001800398419044681041820a16576797065728300030a0015"
+
+TOKEN_FACTORY_ABI = [
+    {"name": "TokenCreated", "inputs": [{"name": "token", "type": "address", "indexed": True}, {"name": "owner", "type": "address", "indexed": True}, {"name": "salt", "type": "bytes32", "indexed": False}], "anonymous": False, "type": "event"},
+    {"stateMutability": "nonpayable", "type": "constructor", "inputs": [{"name": "blueprint", "type": "address"}], "outputs": []},
+    {"stateMutability": "nonpayable", "type": "function", "name": "deployBatch", "inputs": [{"name": "names", "type": "string[]"}, {"name": "symbols", "type": "string[]"}, {"name": "supplies", "type": "uint256[]"}, {"name": "salts", "type": "bytes32[]"}], "outputs": [{"name": "", "type": "address[]"}]},
+    {"stateMutability": "view", "type": "function", "name": "BLUEPRINT", "inputs": [], "outputs": [{"name": "", "type": "address"}]}
+]
+
+# Most tokens TokenFactory.deployBatch accepts in one call (MAX_BATCH in the contract)
+MAX_BATCH = 64
+
+# deployBatch takes names as String[64] and symbols as String[32]; Vyper counts bytes, not characters
+MAX_NAME_BYTES = 64
+MAX_SYMBOL_BYTES = 32
+
+# Blueprint deploy code is a 10-byte copier header followed by the ERC-5202 preamble and the token init code
+_BLUEPRINT_DEPLOY_HEADER_LENGTH = 10
+
+
+def create2_address(deployer: str, salt: bytes, init_code: bytes) -> str:
+    """Compute the address a CREATE2 deployment of init_code by deployer will land on"""
+    digest = Web3.keccak(
+        b"\xff" + bytes.fromhex(deployer[2:]) + salt + Web3.keccak(init_code)
+    )
+    return Web3.to_checksum_address(digest[12:])
+
+
+def create_address(deployer: str, nonce: int) -> str:
+    """Compute the address a plain CREATE deployment sent by deployer at nonce will land on"""
+    digest = Web3.keccak(rlp.encode([bytes.fromhex(deployer[2:]), nonce]))
+    return Web3.to_checksum_address(digest[12:])
+
+
+def blueprint_deploy_code() -> bytes:
+    """Creation code of the FactoryToken blueprint contract"""
+    return bytes.fromhex(TOKEN_BLUEPRINT_BYTECODE[2:])
+
+
+def blueprint_address() -> str:
+    """Deterministic address of the FactoryToken blueprint"""
+    return create2_address(CREATE2_DEPLOYER, FACTORY_SALT, blueprint_deploy_code())
+
+
+def factory_init_code() -> bytes:
+    """Creation code of TokenFactory with the blueprint address as constructor argument"""
+    return bytes.fromhex(TOKEN_FACTORY_BYTECODE[2:]) + encode(['address'], [blueprint_address()])
+
+
+def factory_address() -> str:
+    """Deterministic address of TokenFactory"""
+    return create2_address(CREATE2_DEPLOYER, FACTORY_SALT, factory_init_code())
+
+
+def token_salt(owner: str, salt: bytes) -> bytes:
+    """Salt TokenFactory actually uses: keccak256(owner as bytes32 ++ caller salt)"""
+    return Web3.keccak(bytes(12) + bytes.fromhex(owner[2:]) + salt)
+
+
+def predict_token_address(
+    factory: str,
+    owner: str,
+    salt: bytes,
+    name: str,
+    symbol: str,
+    initial_supply_wei: int
+) -> str:
+    """
+    Compute the address TokenFactory.deployBatch will create a token at
+
+    Args:
+        factory: TokenFactory address
+        owner: Account calling deployBatch (receives the supply)
+        salt: Caller-chosen 32-byte salt for this token
+        name: Token name
+        symbol: Token symbol
+        initial_supply_wei: Initial supply in base units
+
+    Returns:
+        Checksummed token address
+    """
+    token_code = blueprint_deploy_code()[_BLUEPRINT_DEPLOY_HEADER_LENGTH + BLUEPRINT_PREAMBLE_LENGTH:]
+    init_code = token_code + encode(
+        ['string', 'string', 'uint256', 'address'],
+        [name, symbol, initial_supply_wei, owner]
+    )
+    return create2_address(factory, token_salt(owner, salt), init_code)
+
+
+def fits_factory(name: str, symbol: str) -> bool:
+    """Whether TokenFactory accepts this name and symbol (UTF-8 length within its String bounds)"""
+    return len(name.encode()) <= MAX_NAME_BYTES and len(symbol.encode()) <= MAX_SYMBOL_BYTES
+
+
+def chunk_batch(tokens: List[Tuple[str, str, int]], size: int = MAX_BATCH) -> List[List[Tuple[str, str, int]]]:
+    """Split a token list into chunks TokenFactory accepts in one call"""
+    return [tokens[i:i + size] for i in range(0, len(tokens), size)]
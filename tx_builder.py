@@ -0,0 +1,113 @@
+"""
+tx_builder.py - Offline batch transaction building for OpenClaw agent
+Encodes constructor calls and signs whole batches across a process pool before anything is broadcast
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from eth_abi import encode
+from eth_account import Account
+from hexbytes import HexBytes
+
+logger = logging.getLogger(__name__)
+
+
+class ContractTemplate:
+    """Bytecode bytes and constructor argument types of a contract, parsed once and reused"""
+
+    _cache: Dict[str, 'ContractTemplate'] = {}
+
+    def __init__(self, abi: List[Dict], bytecode: str):
+        self.abi = abi
+        self.bytecode = bytes(HexBytes(bytecode))
+        constructor = next((item for item in abi if item.get('type') == 'constructor'), None)
+        self.arg_types = [arg['type'] for arg in constructor['inputs']] if constructor else []
+
+    @classmethod
+    def for_contract(cls, abi: List[Dict], bytecode: str) -> 'ContractTemplate':
+        """Cached template for this bytecode"""
+        template = cls._cache.get(bytecode)
+        if template is None:
+            template = cls._cache[bytecode] = cls(abi, bytecode)
+        return template
+
+    def init_code(self, args: Sequence[Any]) -> bytes:
+        """Creation bytecode followed by the ABI-encoded constructor arguments"""
+        return self.bytecode + encode(self.arg_types, list(args))
+
+
+def _sign_chunk(private_key: str, bytecode: bytes, arg_types: List[str], jobs: List[Tuple]) -> List[Dict]:
+    """Worker: encode and sign (constructor args, tx fields) jobs; runs in a pool process"""
+    account = Account.from_key(private_key)
+    signed_jobs = []
+    for args, fields in jobs:
+        tx = dict(fields, data='0x' + (bytecode + encode(arg_types, list(args))).hex())
+        signed = account.sign_transaction(tx)
+        # eth-account < 0.13 only exposes the camelCase attribute
+        raw_tx = getattr(signed, 'raw_transaction', None) or signed.rawTransaction
+        signed_jobs.append({'tx': tx, 'raw_tx': bytes(raw_tx), 'tx_hash': bytes(signed.hash)})
+    return signed_jobs
+
+
+class BatchSigner:
+    """Signs contract-creation batches offline, fanning large batches out over worker processes"""
+
+    def __init__(self, private_key: str, max_workers: Optional[int] = None, min_parallel: int = 8):
+        """
+        Initialize batch signer
+
+        Args:
+            private_key: Key of the sending account
+            max_workers: Pool size (default: CPU count)
+            min_parallel: Batches smaller than this are signed in-process, where pool overhead would dominate
+        """
+        self.private_key = private_key
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel = min_parallel
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # spawn: forking a process that runs tracker/watcher threads is not safe
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._pool
+
+    def sign(self, template: ContractTemplate, jobs: List[Tuple[Sequence[Any], Dict]]) -> List[Dict]:
+        """
+        Encode and sign a batch of contract creations
+
+        Args:
+            template: Contract being created
+            jobs: (constructor args, tx fields without data) per transaction, nonces already assigned
+
+        Returns:
+            Dicts with the unsigned tx, raw signed bytes and tx hash, in job order
+        """
+        if len(jobs) < self.min_parallel or self.max_workers == 1:
+            return _sign_chunk(self.private_key, template.bytecode, template.arg_types, jobs)
+
+        size = -(-len(jobs) // self.max_workers)
+        chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        pool = self._get_pool()
+        futures = [
+            pool.submit(_sign_chunk, self.private_key, template.bytecode, template.arg_types, chunk)
+            for chunk in chunks
+        ]
+        signed_jobs = []
+        for future in futures:
+            signed_jobs.extend(future.result())
+        logger.info(f"✍️ Signed {len(jobs)} transactions across {len(chunks)} worker processes")
+        return signed_jobs
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
@@ -0,0 +1,230 @@
+"""
+tx_supervisor.py - Stuck-transaction replacement for OpenClaw agent
+Re-signs pending transactions at the same nonce with bumped fees once they miss a deadline
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+from metrics import REGISTRY
+from nonce_manager import NonceManager
+from tx_tracker import ReceiptTracker
+
+logger = logging.getLogger(__name__)
+
+
+class TransactionSupervisor:
+    """Watches broadcast transactions and replaces underpriced ones (replace-by-fee) until one confirms"""
+
+    def __init__(
+        self,
+        tracker: ReceiptTracker,
+        fee_oracle,
+        broadcast: Callable[[Dict], bytes],
+        replace_after: float = 45.0,
+        max_replacements: int = 5,
+        fee_bump: float = 1.125,
+        urgency: str = 'premium',
+        check_interval: float = 5.0
+    ):
+        """
+        Initialize transaction supervisor
+
+        Args:
+            tracker: ReceiptTracker that polls every hash we broadcast
+            fee_oracle: FeeOracle used to price replacements against the current base fee
+            broadcast: Callable that signs and sends a transaction dict, returning its hash
+            replace_after: Seconds a transaction may stay pending before it is replaced
+            max_replacements: Replacements per nonce before the supervisor gives up bumping
+            fee_bump: Minimum multiplier on both fee fields; nodes reject replacements under +10%
+            urgency: Fee oracle level replacements are priced at
+            check_interval: Seconds between deadline checks
+        """
+        self.tracker = tracker
+        self.fee_oracle = fee_oracle
+        self.broadcast = broadcast
+        self.replace_after = replace_after
+        self.max_replacements = max_replacements
+        self.fee_bump = fee_bump
+        self.urgency = urgency
+        self.check_interval = check_interval
+        self.replacements_sent = 0
+
+        self._entries: Dict[int, Dict] = {}
+        self._hash_to_nonce: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, nonce: int, tx: Dict, tx_hash) -> Future:
+        """
+        Supervise a freshly broadcast transaction
+
+        Args:
+            nonce: Nonce the transaction was signed with
+            tx: The unsigned transaction dict, re-signed with new fees on replacement
+            tx_hash: Hash of the broadcast transaction
+
+        Returns:
+            Future resolving to the receipt of whichever hash for this nonce confirms
+        """
+        tx_hash = ReceiptTracker._to_hex(tx_hash)
+        entry = {
+            'nonce': nonce,
+            'tx': dict(tx),
+            'hashes': [tx_hash],
+            'sent_at': time.time(),
+            'submitted_at': time.time(),
+            'replacements': 0,
+            'future': Future()
+        }
+        with self._lock:
+            self._entries[nonce] = entry
+            self._hash_to_nonce[tx_hash] = nonce
+        self._track(entry, tx_hash)
+        self._ensure_running()
+        return entry['future']
+
+    def track(self, tx_hash) -> Future:
+        """Confirmation future for a hash; unsupervised hashes go straight to the tracker"""
+        tx_hash = ReceiptTracker._to_hex(tx_hash)
+        with self._lock:
+            nonce = self._hash_to_nonce.get(tx_hash)
+            entry = self._entries.get(nonce) if nonce is not None else None
+        if entry is None:
+            return self.tracker.track(tx_hash)
+        return entry['future']
+
+    def nonce_of(self, tx_hash) -> Optional[int]:
+        """Nonce of a supervised, still pending transaction"""
+        with self._lock:
+            return self._hash_to_nonce.get(ReceiptTracker._to_hex(tx_hash))
+
+    def pending_count(self) -> int:
+        """Number of nonces still waiting for a confirmation"""
+        with self._lock:
+            return len(self._entries)
+
+    def _track(self, entry: Dict, tx_hash: str):
+        self.tracker.track(tx_hash).add_done_callback(lambda f: self._on_receipt(entry, tx_hash, f))
+
+    def _on_receipt(self, entry: Dict, tx_hash: str, receipt_future: Future):
+        """Resolve the nonce on the first confirmed hash and drop the ones it superseded"""
+        if receipt_future.cancelled():
+            return
+        error = receipt_future.exception()
+        with self._lock:
+            if entry['future'].done():
+                return
+            if error is not None and tx_hash != entry['hashes'][-1]:
+                # An older hash timing out is expected once it has been replaced
+                return
+            self._entries.pop(entry['nonce'], None)
+            for h in entry['hashes']:
+                self._hash_to_nonce.pop(h, None)
+            others = [h for h in entry['hashes'] if h != tx_hash]
+
+        for h in others:
+            self.tracker.untrack(h)
+        if error is not None:
+            entry['future'].set_exception(error)
+            return
+        REGISTRY.observe('openclaw_tx_stage_seconds', time.time() - entry['submitted_at'], stage='receipt_wait')
+        if len(entry['hashes']) > 1:
+            logger.info(f"🚀 Nonce {entry['nonce']} confirmed as {tx_hash} after {entry['replacements']} replacement(s)")
+        entry['future'].set_result(receipt_future.result())
+
+    def _ensure_running(self):
+        """Start the deadline thread on first use"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="tx-supervisor", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the deadline thread"""
+        self._stopped.set()
+        self._wakeup.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            if self.pending_count() == 0:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            try:
+                self.check()
+            except Exception as e:
+                logger.warning(f"⚠️ Transaction supervisor check failed: {e}")
+            self._stopped.wait(self.check_interval)
+
+    def check(self) -> int:
+        """
+        Replace every pending transaction that missed its deadline or is priced under the base fee
+
+        Returns:
+            Number of replacements broadcast
+        """
+        with self._lock:
+            entries = [e for e in self._entries.values() if e['replacements'] < self.max_replacements]
+        if not entries:
+            return 0
+
+        base_fee = self.fee_oracle.sample()['next_base_fee']
+        now = time.time()
+        replaced = 0
+        for entry in entries:
+            max_fee = entry['tx'].get('maxFeePerGas', entry['tx'].get('gasPrice', 0))
+            underpriced = max_fee < base_fee
+            if not underpriced and now - entry['sent_at'] < self.replace_after:
+                continue
+            if self._replace(entry):
+                replaced += 1
+        return replaced
+
+    def _bumped_fees(self, tx: Dict) -> Dict[str, int]:
+        """New fee fields: at least fee_bump over the old ones and at least the oracle's current price"""
+        old_max = tx.get('maxFeePerGas', tx.get('gasPrice', 0))
+        old_tip = tx.get('maxPriorityFeePerGas', tx.get('gasPrice', 0))
+        target = self.fee_oracle.fees(self.urgency)
+        tip = max(int(old_tip * self.fee_bump) + 1, target['maxPriorityFeePerGas'])
+        max_fee = max(int(old_max * self.fee_bump) + 1, target['maxFeePerGas'], tip)
+        return {'maxFeePerGas': max_fee, 'maxPriorityFeePerGas': tip}
+
+    def _replace(self, entry: Dict) -> bool:
+        """Re-sign the entry's nonce with bumped fees and track the new hash"""
+        tx = {k: v for k, v in entry['tx'].items() if k != 'gasPrice'}
+        tx.update(self._bumped_fees(entry['tx']))
+        try:
+            new_hash = ReceiptTracker._to_hex(self.broadcast(tx))
+        except Exception as e:
+            if NonceManager.is_nonce_too_low(e) or NonceManager.is_already_known(e):
+                # One of the earlier hashes was mined meanwhile; the tracker will report it
+                logger.info(f"ℹ️ Nonce {entry['nonce']} already mined, not replacing")
+            else:
+                logger.warning(f"⚠️ Replacement for nonce {entry['nonce']} rejected: {e}")
+            return False
+
+        with self._lock:
+            if entry['future'].done():
+                return False
+            entry['tx'] = tx
+            entry['hashes'].append(new_hash)
+            entry['sent_at'] = time.time()
+            entry['replacements'] += 1
+            self._hash_to_nonce[new_hash] = entry['nonce']
+            self.replacements_sent += 1
+        logger.info(
+            f"⛽ Replaced stuck nonce {entry['nonce']} with {new_hash} "
+            f"(maxFee {tx['maxFeePerGas']} wei, tip {tx['maxPriorityFeePerGas']} wei)"
+        )
+        self._track(entry, new_hash)
+        return True
+
+    def wait(self, tx_hash, timeout: Optional[float] = None) -> Dict:
+        """Block until any hash for tx_hash's nonce confirms and return its receipt"""
+        return self.track(tx_hash).result(timeout=timeout)
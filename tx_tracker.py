@@ -0,0 +1,199 @@
+"""
+tx_tracker.py - Background transaction receipt tracking for OpenClaw agent
+Polls receipts for every pending transaction with one JSON-RPC batch request per tick
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+import requests
+from web3 import Web3
+
+logger = logging.getLogger(__name__)
+
+
+class DeploymentHandle:
+    """Handle returned by non-blocking submits; resolves to the deployment result dict"""
+
+    def __init__(self, tx_hash: Optional[str], future: Future, contract_address: Optional[str] = None):
+        self.tx_hash = tx_hash
+        self.future = future
+        # Address the contract will land on, known from sender and nonce before the receipt
+        self.contract_address = contract_address
+
+    def done(self) -> bool:
+        """Check whether the deployment has been confirmed or failed"""
+        return self.future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Dict:
+        """Block until the deployment result is available"""
+        return self.future.result(timeout=timeout)
+
+    def add_callback(self, callback: Callable[[Dict], None]):
+        """Call callback with the deployment result once it is available"""
+        self.future.add_done_callback(lambda f: callback(f.result()))
+
+
+class ReceiptTracker:
+    """Tracks pending transactions and resolves futures as their receipts arrive"""
+
+    # Receipt fields returned as hex quantities by eth_getTransactionReceipt
+    QUANTITY_FIELDS = ('status', 'blockNumber', 'gasUsed', 'cumulativeGasUsed', 'effectiveGasPrice', 'transactionIndex')
+
+    def __init__(self, rpc_url: str, poll_interval: float = 2.0, timeout: float = 300, provider=None):
+        """
+        Initialize receipt tracker
+
+        Args:
+            rpc_url: JSON-RPC endpoint that accepts batch requests
+            poll_interval: Seconds between receipt polls
+            timeout: Seconds before a pending transaction is failed with TimeoutError
+            provider: Optional PooledHTTPProvider; batches then go to its fastest healthy endpoint
+        """
+        self.rpc_url = rpc_url
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.provider = provider
+        self.session = requests.Session()
+
+        self._pending: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, tx_hash, callback: Optional[Callable[[Dict], None]] = None) -> Future:
+        """
+        Start tracking a transaction
+
+        Args:
+            tx_hash: Transaction hash (bytes or hex string)
+            callback: Optional callable invoked with the receipt once mined
+
+        Returns:
+            Future resolving to the normalized receipt
+        """
+        tx_hash = self._to_hex(tx_hash)
+        future = Future()
+        if callback:
+            future.add_done_callback(lambda f: f.exception() is None and callback(f.result()))
+
+        with self._lock:
+            self._pending[tx_hash] = {'future': future, 'submitted_at': time.time()}
+        self._ensure_running()
+        self._wakeup.set()
+        return future
+
+    def untrack(self, tx_hash):
+        """Stop tracking a transaction that can no longer be mined, e.g. a replaced one"""
+        with self._lock:
+            entry = self._pending.pop(self._to_hex(tx_hash), None)
+        if entry is not None:
+            entry['future'].cancel()
+
+    def pending_count(self) -> int:
+        """Number of transactions still waiting for a receipt"""
+        with self._lock:
+            return len(self._pending)
+
+    def _ensure_running(self):
+        """Start the polling thread on first use"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="receipt-tracker", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the polling thread"""
+        self._stopped.set()
+        self._wakeup.set()
+
+    def _run(self):
+        """Polling loop: one batch request per tick while anything is pending"""
+        while not self._stopped.is_set():
+            if self.pending_count() == 0:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.warning(f"⚠️ Receipt poll failed: {e}")
+            self._stopped.wait(self.poll_interval)
+
+    def poll_once(self) -> int:
+        """
+        Fetch receipts for all pending transactions in a single batch request
+
+        Returns:
+            Number of transactions resolved during this poll
+        """
+        with self._lock:
+            hashes = list(self._pending.keys())
+        if not hashes:
+            return 0
+
+        receipts = self._fetch_receipts(hashes)
+        resolved = 0
+        now = time.time()
+        for tx_hash in hashes:
+            receipt = receipts.get(tx_hash)
+            with self._lock:
+                entry = self._pending.get(tx_hash)
+                if entry is None:
+                    continue
+                if receipt is None and now - entry['submitted_at'] < self.timeout:
+                    continue
+                del self._pending[tx_hash]
+
+            if receipt is not None:
+                entry['future'].set_result(receipt)
+            else:
+                logger.warning(f"⏰ No receipt for {tx_hash} after {self.timeout}s")
+                entry['future'].set_exception(TimeoutError(f"Transaction {tx_hash} not mined within {self.timeout}s"))
+            resolved += 1
+        return resolved
+
+    def _fetch_receipts(self, hashes: List[str]) -> Dict[str, Dict]:
+        """Send one eth_getTransactionReceipt batch and map tx hash to normalized receipt"""
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": "eth_getTransactionReceipt", "params": [tx_hash]}
+            for i, tx_hash in enumerate(hashes)
+        ]
+        if self.provider is not None:
+            items = self.provider.make_batch_request(payload)
+        else:
+            response = self.session.post(self.rpc_url, json=payload, timeout=30)
+            response.raise_for_status()
+            items = response.json()
+
+        receipts = {}
+        for item in items:
+            if item.get('error'):
+                logger.debug(f"Receipt lookup error: {item['error']}")
+                continue
+            if item.get('result'):
+                receipts[hashes[item['id']]] = self._normalize_receipt(item['result'])
+        return receipts
+
+    @classmethod
+    def _normalize_receipt(cls, raw: Dict) -> Dict:
+        """Convert hex quantities and addresses in a raw receipt to web3-style values"""
+        receipt = dict(raw)
+        for field in cls.QUANTITY_FIELDS:
+            if isinstance(receipt.get(field), str):
+                receipt[field] = int(receipt[field], 16)
+        if receipt.get('contractAddress'):
+            receipt['contractAddress'] = Web3.to_checksum_address(receipt['contractAddress'])
+        return receipt
+
+    @staticmethod
+    def _to_hex(tx_hash) -> str:
+        """Normalize a transaction hash to a 0x-prefixed lowercase hex string"""
+        if isinstance(tx_hash, (bytes, bytearray)):
+            return "0x" + bytes(tx_hash).hex()
+        tx_hash = tx_hash.lower()
+        return tx_hash if tx_hash.startswith("0x") else "0x" + tx_hash